@@ -0,0 +1,163 @@
+"""
+Бенчмарки горячего пути `ZXArtClient.api` на локальном сервере (`server.py`).
+
+Запуск с сохранением результатов:
+`pytest benchmarks --benchmark-autosave`
+
+Сравнение с последним сохраненным результатом (ошибка при замедлении более
+чем на 10%):
+`pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%`
+"""
+
+import asyncio
+import copy
+import time
+import tracemalloc
+
+import orjson
+import pytest
+from payloads import items, response
+
+from zxart.common import Entity, Order, process_filters
+from zxart.decode import decode_response
+from zxart.lazy import decode_views
+from zxart.models import ApiResponse
+from zxart.query import Query, compile_query
+
+ENTITIES = (
+    Entity.TUNE,
+    Entity.IMAGE,
+    Entity.AUTHOR,
+    Entity.PRODUCT,
+    Entity.RELEASE,
+)
+PAGE_SIZES = (10, 60, 500)
+
+FILTERS = {
+    "order": Order.TOP_RATED,
+    "years": range(2000, 2011),
+    "tags_include": ("AY", "demo"),
+    "min_party_place": 3,
+    "title": "Title",
+}
+
+
+def _json(entity: Entity, n: int) -> dict:
+    return {
+        "entity": entity,
+        "totalAmount": n,
+        "start": 0,
+        "limit": n,
+        "result": items(entity, n),
+    }
+
+
+def _decode(body: bytes) -> ApiResponse:
+    json = orjson.loads(body)
+    json["result"] = json.pop("responseData")[Entity.TUNE]
+    json["entity"] = Entity.TUNE
+
+    return decode_response(Entity.TUNE, json)
+
+
+@pytest.mark.benchmark(group="url")
+def bench_process_filters(benchmark):
+    benchmark(lambda: process_filters(Entity.TUNE, dict(FILTERS)))
+
+
+@pytest.mark.benchmark(group="url")
+def bench_url(benchmark):
+    benchmark(lambda: compile_query(Entity.TUNE, **FILTERS).url(0, 60))
+
+
+@pytest.mark.benchmark(group="url")
+def bench_query_url(benchmark):
+    query = Query.compile(Entity.TUNE, **FILTERS)
+    benchmark(query.url, 600, 60)
+
+
+@pytest.mark.benchmark(group="json")
+@pytest.mark.parametrize("n", PAGE_SIZES)
+def bench_json_loads(benchmark, n):
+    body = orjson.dumps(response(Entity.TUNE, n))
+    benchmark.extra_info["bytes"] = len(body)
+    benchmark(orjson.loads, body)
+
+
+@pytest.mark.benchmark(group="from_dict")
+@pytest.mark.parametrize("entity", ENTITIES)
+def bench_from_dict(benchmark, entity):
+    json = _json(entity, 60)
+    # Прогрев: компиляция mashumaro
+    ApiResponse.from_dict(copy.deepcopy(json))
+
+    benchmark.pedantic(
+        ApiResponse.from_dict,
+        setup=lambda: ((copy.deepcopy(json),), {}),
+        rounds=200,
+    )
+
+
+@pytest.mark.benchmark(group="decode")
+@pytest.mark.parametrize("entity", ENTITIES)
+def bench_decode(benchmark, entity):
+    json = _json(entity, 60)
+
+    benchmark.pedantic(
+        decode_response,
+        setup=lambda: ((entity, copy.deepcopy(json)), {}),
+        rounds=200,
+    )
+
+
+@pytest.mark.benchmark(group="decode")
+@pytest.mark.parametrize("entity", ENTITIES)
+def bench_decode_lazy(benchmark, entity):
+    json = _json(entity, 60)
+
+    def run(json):
+        for x in decode_views(entity, json).result:
+            x.id, x.title, x.url
+
+    benchmark.pedantic(
+        run, setup=lambda: ((copy.deepcopy(json),), {}), rounds=200
+    )
+
+
+@pytest.mark.benchmark(group="memory")
+@pytest.mark.parametrize("n", PAGE_SIZES)
+def bench_peak_memory(benchmark, n):
+    body = orjson.dumps(response(Entity.TUNE, n))
+
+    tracemalloc.start()
+    _decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["peak_bytes"] = peak
+    benchmark.extra_info["peak_bytes_per_item"] = peak / n
+    benchmark(_decode, body)
+
+
+@pytest.mark.benchmark(group="end-to-end")
+@pytest.mark.parametrize("concurrency", (1, 8, 32))
+def bench_requests(benchmark, loop, client, concurrency):
+    requests = 64
+
+    async def run():
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(i: int):
+            async with sem:
+                return await client.api(Entity.TUNE, start=i * 60)
+
+        await asyncio.gather(*(one(i) for i in range(requests)))
+
+    def burst():
+        t = time.perf_counter()
+        loop.run_until_complete(run())
+        rps.append(requests / (time.perf_counter() - t))
+
+    rps = []
+    benchmark.pedantic(burst, rounds=10, warmup_rounds=1)
+    benchmark.extra_info["requests_per_second"] = max(rps)
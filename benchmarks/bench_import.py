@@ -0,0 +1,81 @@
+"""
+Время холодного импорта пакета по данным `python -X importtime`.
+
+Каждая инструкция выполняется в отдельном интерпретаторе. Проверка
+завершается ошибкой, если суммарное время импорта модулей пакета превышает
+бюджет. Бюджеты масштабируются переменной окружения
+`ZXART_IMPORT_BUDGET_SCALE` для медленных машин.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCALE = float(os.environ.get("ZXART_IMPORT_BUDGET_SCALE", "1"))
+
+BUDGETS_US = {
+    "import zxart": 2_000,
+    "from zxart import Entity": 5_000,
+    "import zxart.decode": 40_000,
+}
+"""Бюджеты собственного времени импорта модулей пакета, мкс"""
+
+HEAVY = ("aiohttp", "mashumaro", "orjson", "yarl")
+"""Зависимости, не загружаемые импортом пакета"""
+
+
+def _importtime(statement: str) -> tuple[dict[str, int], list[str]]:
+    """Собственное время импорта модулей, мкс, и загруженные модули."""
+
+    code = f"{statement}; import sys; print(*sys.modules)"
+    env = os.environ | {"PYTHONDONTWRITEBYTECODE": ""}
+    # Первый запуск компилирует байт-код
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(us)
+
+    return times, p.stdout.split()
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("statement", BUDGETS_US)
+def bench_import(benchmark, statement):
+    times, modules = benchmark.pedantic(
+        _importtime, (statement,), rounds=3, iterations=1
+    )
+    own = sum(v for k, v in times.items() if k.split(".")[0] == "zxart")
+    benchmark.extra_info["zxart_us"] = own
+
+    assert own <= BUDGETS_US[statement] * SCALE
+
+    if statement != "import zxart.decode":
+        assert not [x for x in modules if x.split(".")[0] in HEAVY]
+
+
+def bench_pregenerated_decoders():
+    """Заранее сгенерированные декодеры соответствуют моделям."""
+
+    from zxart import _decoders, decode
+
+    assert _decoders.FINGERPRINT == decode._fingerprint()
+    assert decode.item_decoder(decode.Entity.TUNE) is _decoders.decode_Tune
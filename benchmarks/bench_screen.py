@@ -0,0 +1,123 @@
+"""
+Бенчмарки декодирования экранов ZX Spectrum `zxart.screen` на случайных
+данных. Скорость декодирования в экранах в секунду сохраняется в
+`extra_info`.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zxart import screen  # noqa: E402
+
+BATCH = 256
+
+
+def _reference(data: bytes, phase: int = 0) -> list[list[tuple[int, ...]]]:
+    """Построчное декодирование экрана 6912 байт по адресам видеопамяти."""
+
+    palette = screen._palette().tolist()
+    rows = []
+
+    for y in range(screen.HEIGHT):
+        line = (y & 0xC0) << 5 | (y & 7) << 8 | (y & 0x38) << 2
+        row = []
+
+        for x in range(screen.WIDTH):
+            attr = data[screen.BITMAP_SIZE + (y >> 3) * 32 + (x >> 3)]
+            bit = data[line + (x >> 3)] >> (7 - (x & 7)) & 1
+
+            if phase and attr & 0x80:
+                bit ^= 1
+
+            color = (attr & 7) if bit else (attr >> 3 & 7)
+            row.append(tuple(palette[color + (attr >> 6 & 1) * 8]))
+
+        rows.append(row)
+
+    return rows
+
+
+@pytest.fixture(scope="module")
+def screens():
+    rnd = random.Random(0)
+    return [rnd.randbytes(screen.SCREEN_SIZE) for _ in range(BATCH)]
+
+
+@pytest.mark.parametrize("phase", (0, 1))
+def bench_reference_match(screens, phase):
+    """Векторное декодирование совпадает с построчным."""
+
+    for data in screens[:2]:
+        image = screen.decode_screen(data, phase=phase)
+        assert [[tuple(x) for x in row] for row in image.tolist()] == (
+            _reference(data, phase)
+        )
+
+
+def bench_formats(screens):
+    data = screens[0]
+    mono = screen.decode_screen(data[: screen.BITMAP_SIZE])
+    assert set(np.unique(mono.reshape(-1, 3), axis=0).sum(axis=1)) == {
+        0,
+        3 * 0xD7,
+    }
+
+    # Мультиколор с атрибутами знакомест, повторенными в каждой строке
+    attrs = np.frombuffer(data[screen.BITMAP_SIZE :], np.uint8).reshape(24, 32)
+    lines = np.repeat(attrs, 8, axis=0).reshape(24, 8, 32)
+    timex = data[: screen.BITMAP_SIZE] + (
+        lines.reshape(3, 8, 8, 32).transpose(0, 2, 1, 3).tobytes()
+    )
+    assert (screen.decode_screen(timex) == screen.decode_screen(data)).all()
+
+
+@pytest.mark.benchmark(group="screen")
+def bench_decode_screen(benchmark, screens):
+    benchmark(screen.decode_screen, screens[0])
+
+    if benchmark.stats:
+        benchmark.extra_info["screens_per_sec"] = 1 / benchmark.stats["mean"]
+
+
+@pytest.mark.benchmark(group="screen")
+@pytest.mark.parametrize("phase", (0, 1))
+def bench_decode_batch(benchmark, screens, phase):
+    data = b"".join(screens)
+    images = benchmark(screen.decode_screens, data, phase=phase)
+
+    if benchmark.stats:
+        benchmark.extra_info["screens_per_sec"] = (
+            BATCH / benchmark.stats["mean"]
+        )
+
+    assert images.shape == (BATCH, screen.HEIGHT, screen.WIDTH, 3)
+
+
+@pytest.mark.benchmark(group="screen-files")
+def bench_decode_files(benchmark, screens, tmp_path):
+    paths = []
+
+    for i in range(4):
+        for j, data in enumerate(screens):
+            paths.append(tmp_path / f"{i}-{j}.scr")
+            paths[-1].write_bytes(data)
+
+    def run():
+        return sum(
+            len(x)
+            for x, _ in screen.decode_files(
+                paths, workers=2, batch_size=BATCH, scale=2
+            )
+        )
+
+    count = benchmark.pedantic(run, rounds=1, iterations=1)
+
+    if benchmark.stats:
+        benchmark.extra_info["screens_per_sec"] = (
+            count / benchmark.stats["mean"]
+        )
+
+    assert count == len(paths)
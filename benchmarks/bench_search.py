@@ -0,0 +1,72 @@
+"""
+Бенчмарки индекса поиска `zxart.search.SearchIndex` на синтетическом
+каталоге мелодий.
+"""
+
+import random
+
+import pytest
+from payloads import items
+
+from zxart.common import Entity
+from zxart.decode import decode_response
+from zxart.search import SearchIndex
+
+SIZE = 300_000
+
+QUERIES = {
+    "text": {"text": "dizzy"},
+    "text-typo": {"text": "fantasy wrld"},
+    "text-filters": {"text": "dizzy", "tags_include": "AY", "years": 1995},
+    "tags": {"tags_include": ("AY", "demo"), "tags_exclude": "game"},
+    "format-year-order": {"format": "PT3", "years": 1995, "order": "rating"},
+    "rating-order": {"min_rating": 4.5, "order": "plays"},
+}
+
+
+@pytest.fixture(scope="module")
+def tunes():
+    """Мелодии с названиями из случайных слов."""
+
+    rnd = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = [
+        "".join(rnd.choices(letters, k=rnd.randrange(3, 9)))
+        for _ in range(8000)
+    ]
+    words += ("dizzy", "fantasy", "world")
+    raw = items(Entity.TUNE, SIZE)
+
+    for x in raw:
+        x["title"] = " ".join(rnd.choices(words, k=rnd.randrange(1, 4)))
+
+    json = {"totalAmount": SIZE, "start": 0, "limit": SIZE, "result": raw}
+
+    return decode_response(Entity.TUNE, json).result
+
+
+@pytest.fixture(scope="module")
+def index(tunes):
+    return SearchIndex(tunes)
+
+
+@pytest.mark.benchmark(group="search")
+@pytest.mark.parametrize("query", QUERIES)
+def bench_search(benchmark, index, query):
+    benchmark(lambda: index.search(**QUERIES[query]))
+
+
+@pytest.mark.benchmark(group="search")
+def bench_count(benchmark, index):
+    benchmark(lambda: index.count(**QUERIES["tags"]))
+
+
+@pytest.mark.benchmark(group="search-update")
+def bench_add(benchmark, index, tunes):
+    item = tunes[SIZE // 2]
+    benchmark(index.add, item)
+
+
+@pytest.mark.benchmark(group="search-update")
+def bench_build(benchmark, tunes):
+    benchmark.pedantic(SearchIndex, (tunes[:50_000],), rounds=3)
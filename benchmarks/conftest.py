@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from server import MockServer
+
+import zxart.client
+import zxart.query
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """Цикл событий, общий для бенчмарков модуля."""
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def server(loop):
+    """Локальный сервер API, на который направлены запросы клиента."""
+
+    server = MockServer(total=100_000)
+    loop.run_until_complete(server.__aenter__())
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(zxart.query, "_BASE_URL", server.url)
+        yield server
+
+    loop.run_until_complete(server.__aexit__(None, None, None))
+
+
+@pytest.fixture
+def client(loop, server):
+    """Клиент без кэша и объединения запросов."""
+
+    async def create():
+        return zxart.client.ZXArtClient(coalesce=False)
+
+    cli = loop.run_until_complete(create())
+    yield cli
+    loop.run_until_complete(cli.close())
@@ -0,0 +1,40 @@
+"""
+Сравнение скорости декодирования записей: универсальный путь mashumaro
+(`ApiResponse.from_dict`) и специализированные декодеры (`zxart.decode`).
+
+Запуск: `python benchmarks/decode.py [количество записей]`
+"""
+
+import copy
+import sys
+import timeit
+
+from bench_api import _json
+from payloads import ITEMS
+
+from zxart.decode import decode_response
+from zxart.models import ApiResponse
+
+
+def main(n: int = 1000, repeat: int = 5) -> None:
+    for entity in ITEMS:
+        json = _json(entity, n)
+        # Прогрев: компиляция mashumaro
+        ApiResponse.from_dict(copy.deepcopy(json))
+
+        for name, fn in (
+            ("mashumaro", ApiResponse.from_dict),
+            ("compiled", lambda x, e=entity: decode_response(e, x)),
+        ):
+            copies = [copy.deepcopy(json) for _ in range(repeat)]
+            t = min(
+                timeit.repeat(lambda: fn(copies.pop()), number=1, repeat=repeat)
+            )
+            print(
+                f"{entity:<14} {name:<10} {n / t:>12,.0f} items/s "
+                f"{t / n * 1e6:>8.2f} us/item"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
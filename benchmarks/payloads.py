@@ -0,0 +1,182 @@
+"""Синтетические ответы API для бенчмарков."""
+
+import random
+from typing import Any
+
+from zxart.common import Entity
+
+_TAGS = ["AY", "demo", "game", "chiptune", "cover", "4k", "beeper", "party"]
+_COMPO = ["standard", "wild", "experimental", "realtime"]
+_TYPES = ["PT3", "STC", "ASC", "SQT", "PT2", "TFC"]
+
+
+def _media(i: int, rnd: random.Random) -> dict[str, Any]:
+    return {
+        "id": i,
+        "title": f"Title &amp; {i}" if i % 5 == 0 else f"Title {i}",
+        "url": f"https://zxart.ee/rus/title-{i}/",
+        "dateCreated": 1_600_000_000 + i * 60,
+        "dateModified": 1_600_000_000 + i * 90,
+        "partyId": rnd.randrange(1, 500),
+        "compo": rnd.choice(_COMPO),
+        "partyPlace": rnd.randrange(0, 20),
+        "authorIds": [
+            rnd.randrange(1, 5000) for _ in range(rnd.randrange(1, 3))
+        ],
+        "tags": rnd.sample(_TAGS, rnd.randrange(0, 4)),
+        "type": rnd.choice(_TYPES),
+        "rating": f"{rnd.uniform(0, 5):.2f}",
+        "year": rnd.randrange(1985, 2026),
+        "description": "&lt;pre&gt;Line&lt;/pre&gt;" if i % 7 == 0 else "",
+        "originalUrl": f"https://zxart.ee/file/id:{i}/file%20name.pt3",
+    }
+
+
+def tune(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _media(i, rnd) | {
+        "internalTitle": f"internal {i}",
+        "time": f"{rnd.randrange(0, 6)}:{rnd.randrange(0, 60):02}.{i % 100:02}",
+        "plays": rnd.randrange(0, 100_000),
+        "originalFileName": f"tune%20{i}.pt3",
+        "mp3FilePath": f"https://zxart.ee/zxmusic/{i}.mp3",
+    }
+
+
+def image(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _media(i, rnd) | {
+        "views": rnd.randrange(0, 100_000),
+        "imageUrl": f"https://zxart.ee/zxscreen/type:standard/id:{i}/",
+    }
+
+
+def author(i: int, rnd: random.Random) -> dict[str, Any]:
+    return {
+        "id": i,
+        "title": f"Author {i}",
+        "url": f"https://zxart.ee/rus/authors/a/author-{i}/",
+        "dateCreated": 1_600_000_000 + i * 60,
+        "dateModified": 1_600_000_000 + i * 90,
+        "realName": f"Name {i}",
+        "country": rnd.choice(["Russia", "Estonia", "Poland", "Spain"]),
+        "city": rnd.choice(["Moscow", "Tallinn", "Warsaw", "Madrid"]),
+        "picturesQuantity": rnd.randrange(0, 300),
+        "tunesQuantity": rnd.randrange(0, 300),
+        "aliases": [rnd.randrange(1, 10000) for _ in range(rnd.randrange(3))],
+        "importIds": {"3a": str(i), "dzoo": str(i * 2)},
+    }
+
+
+def _entity(i: int, title: str) -> dict[str, Any]:
+    return {
+        "id": i,
+        "title": f"{title} {i}",
+        "url": f"https://zxart.ee/rus/{title.lower()}-{i}/",
+        "dateCreated": 1_600_000_000 + i * 60,
+        "dateModified": 1_600_000_000 + i * 90,
+    }
+
+
+def author_alias(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _entity(i, "Alias") | {
+        "authorId": rnd.randrange(1, 5000),
+        "importIds": {"3a": str(i)},
+        "startDate": "01.01.1990",
+        "endDate": "31.12.1999",
+    }
+
+
+def group(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _entity(i, "Group") | {
+        "type": rnd.choice(["group", "company", "scene"]),
+        "country": rnd.choice(["Russia", "Estonia", "Poland", "Spain"]),
+        "city": rnd.choice(["Moscow", "Tallinn", "Warsaw", "Madrid"]),
+        "aliases": [rnd.randrange(1, 10000) for _ in range(rnd.randrange(3))],
+        "importIds": {"dzoo": str(i)},
+    }
+
+
+def group_alias(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _entity(i, "Alias") | {
+        "groupId": rnd.randrange(1, 5000),
+        "startDate": "01.01.1995",
+    }
+
+
+def product_category(i: int, rnd: random.Random) -> dict[str, Any]:
+    return {
+        "id": i,
+        "title": f"Category &amp; {i}" if i % 5 == 0 else f"Category {i}",
+    }
+
+
+def product(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _entity(i, "Product") | {
+        "year": rnd.randrange(1982, 2026),
+        "partyId": rnd.randrange(1, 500),
+        "compo": rnd.choice(_COMPO),
+        "partyPlace": rnd.randrange(0, 20),
+        "legalStatus": rnd.choice(["allowed", "forbidden", "unknown"]),
+        "rating": f"{rnd.uniform(0, 5):.2f}",
+        "authorIds": [rnd.randrange(1, 5000) for _ in range(3)],
+        "groupIds": [rnd.randrange(1, 5000)],
+        "publisherIds": [rnd.randrange(1, 5000)],
+        "categoryIds": [rnd.randrange(1, 100)],
+        "language": ["en", "ru"],
+        "tags": rnd.sample(_TAGS, rnd.randrange(0, 4)),
+        "description": "&lt;pre&gt;Line&lt;/pre&gt;" if i % 7 == 0 else "",
+        "youtubeId": f"yt{i}",
+        "imagesUrls": [
+            f"https://zxart.ee/zxscreen/id:{i}/{x}%20.png" for x in range(3)
+        ],
+        "importIds": {"wos": str(i), "sc": str(i)},
+    }
+
+
+def release(i: int, rnd: random.Random) -> dict[str, Any]:
+    return _entity(i, "Release") | {
+        "prodId": rnd.randrange(1, 50000),
+        "year": rnd.randrange(1982, 2026),
+        "releaseType": rnd.choice(["original", "rerelease", "crack"]),
+        "version": f"1.{i % 10}",
+        "language": ["en"],
+        "hardwareRequired": ["zx48", "ay"],
+        "authorIds": [rnd.randrange(1, 5000)],
+        "publisherIds": [rnd.randrange(1, 5000)],
+        "importIds": {"wos": str(i)},
+    }
+
+
+ITEMS = {
+    Entity.AUTHOR: author,
+    Entity.AUTHOR_ALIAS: author_alias,
+    Entity.GROUP: group,
+    Entity.GROUP_ALIAS: group_alias,
+    Entity.IMAGE: image,
+    Entity.PRODUCT: product,
+    Entity.PRODUCT_CATEGORY: product_category,
+    Entity.RELEASE: release,
+    Entity.TUNE: tune,
+}
+
+
+def items(entity: Entity, n: int, start: int = 0) -> list[dict[str, Any]]:
+    """Список синтетических записей сущности."""
+
+    rnd = random.Random(start)
+    make = ITEMS[entity]
+
+    return [make(i, rnd) for i in range(start + 1, start + n + 1)]
+
+
+def response(
+    entity: Entity, n: int, start: int = 0, total: int | None = None
+) -> dict[str, Any]:
+    """Синтетический ответ API в исходном формате сервера."""
+
+    return {
+        "responseStatus": "success",
+        "totalAmount": total if total is not None else start + n,
+        "start": start,
+        "limit": n,
+        "responseData": {str(entity): items(entity, n, start)},
+    }
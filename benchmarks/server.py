@@ -0,0 +1,227 @@
+"""
+Локальный заменитель `https://zxart.ee/api/` для бенчмарков.
+
+Сервер отвечает синтетическими записями из `payloads` в формате API с
+заданной задержкой. Поддерживаются параметры `export`, `start`, `limit`,
+фильтр по идентификаторам и сортировка по дате (`order:date,desc`: сначала
+последние). Дата изменения записи растет с идентификатором, прочие
+сортировки выдают записи по возрастанию идентификатора. Тела ответов
+кэшируются, чтобы измерялась работа клиента, а не генерация данных. Для
+тестов клиента сервер может отвечать с заголовком `ETag` и возвращать
+заданные ошибки.
+
+Запуск отдельно: `python benchmarks/server.py [порт] [задержка]`
+"""
+
+import asyncio
+import sys
+import zlib
+from typing import Any
+
+import orjson
+import yarl
+from aiohttp import web
+from payloads import items, response
+
+from zxart.common import Entity
+
+_CACHE_SIZE = 1024
+"""Количество кэшируемых тел ответов сервера"""
+
+
+class MockServer:
+    """Сервер API с синтетическими данными."""
+
+    total: int
+    """Количество записей каждой сущности"""
+    latency: float
+    """Задержка ответа в секундах"""
+    requests: int
+    """Количество обработанных запросов"""
+    active: int
+    """Количество запросов выборок в обработке"""
+    max_active: int
+    """Наибольшее количество одновременно обрабатываемых запросов выборок"""
+    etag: bool
+    """Ответы с заголовком `ETag` и поддержкой `If-None-Match`"""
+    not_modified: int
+    """Количество ответов `304 Not Modified`"""
+    faults: list[int]
+    """Статусы ответов на следующие запросы, `0`: обрыв тела ответа"""
+    retry_after: str | None
+    """Значение заголовка `Retry-After` ответов с ошибкой"""
+
+    def __init__(
+        self,
+        *,
+        total: int = 10_000,
+        latency: float = 0.0,
+        port: int = 0,
+        etag: bool = False,
+    ) -> None:
+        self.total = total
+        self.latency = latency
+        self.requests = 0
+        self.active = self.max_active = 0
+        self.etag = etag
+        self.not_modified = 0
+        self.faults = []
+        self.retry_after = None
+        self._port = port
+        self._runner: web.AppRunner | None = None
+        # Тела ответов по параметрам запроса и количеству записей
+        self._bodies: dict[tuple[Any, ...], bytes] = {}
+
+    @property
+    def url(self) -> yarl.URL:
+        """Базовый URL API сервера."""
+
+        return yarl.URL(f"http://127.0.0.1:{self._port}/api/")
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_route("*", "/api/{tail:.*}", self._handle)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self._port)
+        await site.start()
+        self._port = site._server.sockets[0].getsockname()[1]
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        params = dict(
+            x.split(":", 1)
+            for x in request.match_info["tail"].split("/")
+            if ":" in x
+        )
+
+        if (entity := params.get("export")) is None:
+            return web.Response(text="ok")
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+        try:
+            return await self._export(request, Entity(entity), params)
+
+        finally:
+            self.active -= 1
+
+    async def _export(
+        self, request: web.Request, entity: Entity, params: dict[str, str]
+    ) -> web.StreamResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.faults:
+            return await self._fault(request, self.faults.pop(0))
+
+        start = int(params.get("start", 0))
+        limit = int(params.get("limit", 60))
+        descending = params.get("order") == "date,desc"
+
+        for x in params.get("filter", "").split(";"):
+            k, _, v = x.partition("=")
+
+            if k == entity + "Id":
+                body = self._lookup(entity, v)
+                break
+
+        else:
+            body = self._page(entity, start, limit, descending)
+
+        if not self.etag:
+            return web.Response(body=body, content_type="application/json")
+
+        etag = f'"{zlib.crc32(body):08x}"'
+
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _fault(
+        self, request: web.Request, status: int
+    ) -> web.StreamResponse:
+        if status:
+            headers = {}
+
+            if self.retry_after is not None:
+                headers["Retry-After"] = self.retry_after
+
+            return web.Response(status=status, headers=headers)
+
+        # Соединение закрывается до передачи заявленного тела ответа
+        response = web.StreamResponse(headers={"Content-Length": "1024"})
+        await response.prepare(request)
+        await response.write(b'{"responseStatus":')
+        assert request.transport is not None
+        request.transport.close()
+
+        return response
+
+    def _cached(self, *key: Any) -> bytes | None:
+        return self._bodies.get((*key, self.total))
+
+    def _store(self, body: bytes, *key: Any) -> bytes:
+        if len(self._bodies) >= _CACHE_SIZE:
+            self._bodies.clear()
+
+        self._bodies[*key, self.total] = body
+
+        return body
+
+    def _page(
+        self, entity: Entity, start: int, limit: int, descending: bool
+    ) -> bytes:
+        key = entity, start, limit, descending
+
+        if (body := self._cached(*key)) is not None:
+            return body
+
+        n = max(0, min(limit, self.total - start))
+
+        if descending:
+            # Записи с идентификаторами от `total - start` по убыванию
+            json = response(entity, n, self.total - start - n, self.total)
+            json["start"] = start
+            json["responseData"][entity].reverse()
+
+        else:
+            json = response(entity, n, start, self.total)
+
+        return self._store(orjson.dumps(json), *key)
+
+    def _lookup(self, entity: Entity, ids: str) -> bytes:
+        if (body := self._cached(entity, ids)) is not None:
+            return body
+
+        json = response(entity, 0)
+        json["responseData"][entity] = [
+            items(entity, 1, x - 1)[0]
+            for x in map(int, ids.split(","))
+            if 0 < x <= self.total
+        ]
+        json["totalAmount"] = json["limit"] = len(json["responseData"][entity])
+
+        return self._store(orjson.dumps(json), entity, ids)
+
+
+async def _main(port: str = "8080", latency: str = "0") -> None:
+    async with MockServer(port=int(port), latency=float(latency)) as x:
+        print(f"Serving on {x.url}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(*sys.argv[1:3]))
@@ -1,13 +1,101 @@
-from .client import ZXArtClient
-from .common import Entity, Language, Order, OrderSettings
-from .models import Image, Tune
+"""
+Асинхронный клиент API ZXArt.ee.
+
+Имена пакета и его модули загружаются при первом обращении, поэтому импорт
+пакета не загружает `aiohttp`, `orjson` и `mashumaro`.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import MemoryCache
+    from .client import ZXArtClient
+    from .common import Entity, Language, Order, OrderSettings
+    from .models import Image, Tune
+    from .query import Query
+    from .telemetry import Metrics, RequestEvent
+    from .throttle import RetryPolicy
+    from .transport import TransportOptions
+
+_EXPORTS = {
+    "Entity": "common",
+    "Image": "models",
+    "Language": "common",
+    "MemoryCache": "cache",
+    "Metrics": "telemetry",
+    "Order": "common",
+    "OrderSettings": "common",
+    "Query": "query",
+    "RequestEvent": "telemetry",
+    "RetryPolicy": "throttle",
+    "TransportOptions": "transport",
+    "Tune": "models",
+    "ZXArtClient": "client",
+}
+"""Имена пакета и модули, в которых они определены"""
+
+_MODULES = frozenset(
+    (
+        "cache",
+        "client",
+        "common",
+        "crawl",
+        "decode",
+        "download",
+        "export",
+        "facets",
+        "graph",
+        "image",
+        "lazy",
+        "mirror",
+        "models",
+        "query",
+        "screen",
+        "search",
+        "sync",
+        "table",
+        "telemetry",
+        "throttle",
+        "transport",
+        "tune",
+        "watch",
+    )
+)
+"""Модули пакета, загружаемые при обращении как к атрибуту"""
 
 __all__ = [
     "Entity",
     "Image",
     "Language",
+    "MemoryCache",
+    "Metrics",
     "Order",
     "OrderSettings",
+    "Query",
+    "RequestEvent",
+    "RetryPolicy",
+    "TransportOptions",
     "Tune",
     "ZXArtClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _EXPORTS.get(name)) is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+
+    elif name in _MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Следующие обращения не вызывают `__getattr__`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__all__, *_MODULES})
@@ -1,13 +1,15 @@
+import argparse
 import asyncio
 import logging
+import sys
+from pathlib import Path
 
-from .client import ZXArtClient
 from .common import Entity, Language, Order
 
-logging.basicConfig(level=logging.DEBUG)
-
 
 async def main():
+    from .client import ZXArtClient
+
     async with ZXArtClient(language=Language.RUSSIAN, limit=10) as cli:
         result = await cli.api(
             Entity.TUNE,
@@ -20,4 +22,111 @@ async def main():
             print(x)
 
 
-asyncio.run(main())
+def _entity(value: str) -> Entity:
+    try:
+        return Entity[value.upper()]
+
+    except KeyError:
+        return Entity(value)
+
+
+def _years(value: str) -> range:
+    a, _, b = value.partition("-")
+    return range(int(a), int(b or a) + 1)
+
+
+def _crawl(args: argparse.Namespace) -> None:
+    from .crawl import crawl, plan
+
+    options = {"limit": args.limit}
+
+    if args.language:
+        options["language"] = Language(args.language)
+
+    partitions = plan(
+        args.entities,
+        split=args.split,
+        parts=args.parts or args.workers or 1,
+        years=args.years or (),
+        **options,
+    )
+
+    if args.output == "-":
+        stats = crawl(
+            partitions,
+            sys.stdout.buffer,
+            workers=args.workers,
+            rate_limit=args.rate,
+            **options,
+        )
+
+    else:
+        with open(args.output, "wb") as f:
+            stats = crawl(
+                partitions,
+                f,
+                workers=args.workers,
+                rate_limit=args.rate,
+                **options,
+            )
+
+    print(
+        f"Written: {stats.written}, duplicates: {stats.duplicates}, "
+        f"errors: {len(stats.errors)}",
+        file=sys.stderr,
+    )
+
+    for x in stats.errors:
+        print(x, file=sys.stderr)
+
+    if stats.errors:
+        sys.exit(1)
+
+
+def _decoders(args: argparse.Namespace) -> None:
+    from . import decode
+
+    path = args.output or Path(decode.__file__).with_name("_decoders.py")
+    Path(path).write_text(decode.generate(), encoding="utf-8")
+    print(f"Written: {path}", file=sys.stderr)
+
+
+def cli(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m zxart")
+    commands = parser.add_subparsers(dest="command")
+
+    p = commands.add_parser("crawl", help="multi-process catalogue crawl")
+    p.add_argument("entities", nargs="+", type=_entity, metavar="ENTITY")
+    p.add_argument("-o", "--output", required=True, help="NDJSON file or -")
+    p.add_argument(
+        "--split", choices=("entity", "offset", "years"), default="entity"
+    )
+    p.add_argument("--workers", type=int, help="worker processes")
+    p.add_argument("--parts", type=int, help="offset ranges per entity")
+    p.add_argument("--years", type=_years, help="year range, e.g. 1990-2025")
+    p.add_argument("--rate", type=float, help="global requests per second")
+    p.add_argument("--limit", type=int, default=60, help="page size")
+    p.add_argument("--language", choices=[x.value for x in Language])
+
+    p = commands.add_parser("decoders", help="pre-generate model decoders")
+    p.add_argument("-o", "--output", help="module file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "crawl" and args.split == "years" and not args.years:
+        parser.error("--split years requires --years")
+
+    logging.basicConfig(level=logging.DEBUG)
+
+    if args.command == "crawl":
+        _crawl(args)
+
+    elif args.command == "decoders":
+        _decoders(args)
+
+    else:
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    cli()
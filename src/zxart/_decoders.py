@@ -0,0 +1,309 @@
+"""
+Заранее сгенерированные декодеры моделей.
+
+Сгенерировано командой `python -m zxart decoders`. Не изменять.
+"""
+
+from zxart.models import _unescape as __unescape
+from zxart.models import _unquote as __unquote
+from datetime import datetime as _datetime_fromtimestamp
+_datetime_fromtimestamp = _datetime_fromtimestamp.fromtimestamp
+from sys import intern as _intern
+from zxart.models import ImportID as _ImportID
+from zxart.models import Author as _Author
+from zxart.models import _date as __date
+from zxart.models import AuthorAlias as _AuthorAlias
+from zxart.models import ProductCategory as _ProductCategory
+from zxart.models import Tune as _Tune
+from decimal import Decimal as _Decimal
+from zxart.models import _duration as __duration
+from zxart.models import Image as _Image
+from zxart.models import Group as _Group
+from zxart.models import GroupAlias as _GroupAlias
+from zxart.models import Product as _Product
+from zxart.models import Release as _Release
+
+FINGERPRINT = 'af7ee1b4127b25cb'
+
+
+def decode_ImportID(d):
+    f_zxaaa = d.get('3a')
+    f_demozoo = d.get('dzoo')
+    f_pouet = d.get('pouet')
+    f_spectrumcomputing = d.get('sc')
+    f_worldofspectrum = d.get('wos')
+    f_vtrd = d.get('vt')
+    f_zxdemo = d.get('zxd')
+    f_speccy = d.get('swiki')
+    return _ImportID(zxaaa=f_zxaaa, demozoo=f_demozoo, pouet=f_pouet, spectrumcomputing=f_spectrumcomputing, worldofspectrum=f_worldofspectrum, vtrd=f_vtrd, zxdemo=f_zxdemo, speccy=f_speccy)
+
+def decode_Author(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    f_name = d.get('realName')
+    v = d.get('country')
+    f_country = None if v is None else _intern(v)
+    v = d.get('city')
+    f_city = None if v is None else _intern(v)
+    v = d.get('picturesQuantity')
+    f_num_images = 0 if v is None else v if v.__class__ is int else int(v)
+    v = d.get('tunesQuantity')
+    f_num_tunes = 0 if v is None else v if v.__class__ is int else int(v)
+    v = d.get('aliases')
+    f_aliases = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    return _Author(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, name=f_name, country=f_country, city=f_city, num_images=f_num_images, num_tunes=f_num_tunes, aliases=f_aliases, import_ids=f_import_ids)
+
+def decode_AuthorAlias(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('authorId')
+    f_author_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    v = d.get('startDate')
+    f_start_date = None if v is None else __date(v)
+    v = d.get('endDate')
+    f_end_date = None if v is None else __date(v)
+    return _AuthorAlias(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, author_id=f_author_id, import_ids=f_import_ids, start_date=f_start_date, end_date=f_end_date)
+
+def decode_ProductCategory(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d['title']
+    f_title = v
+    return _ProductCategory(id=f_id, title=f_title)
+
+def decode_Tune(d):
+    d = _Tune.__pre_deserialize__(d)
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('partyId')
+    f_party_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('compo')
+    f_compo = None if v is None else _intern(v)
+    v = d.get('partyPlace')
+    f_party_place = None if v is None else v if v.__class__ is int else int(v)
+    v = d['authorIds']
+    f_author_ids = [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('tags')
+    f_tags = None if v is None else [_intern(x) for x in v]
+    v = d.get('type')
+    f_type = None if v is None else _intern(v)
+    v = d['rating']
+    f_rating = _Decimal(v)
+    v = d.get('year')
+    f_year = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('description')
+    f_description = None if v is None else __unescape(v)
+    v = d.get('originalUrl')
+    f_original_url = None if v is None else __unquote(v)
+    v = d.get('media_url')
+    f_media_url = None if v is None else __unquote(v)
+    v = d.get('internalTitle')
+    f_title_internal = None if v is None else __unescape(v)
+    v = d.get('time')
+    f_duration = None if v is None else __duration(v)
+    v = d.get('plays')
+    f_plays = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('originalFileName')
+    f_filename = None if v is None else __unquote(v)
+    return _Tune(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, party_id=f_party_id, compo=f_compo, party_place=f_party_place, author_ids=f_author_ids, tags=f_tags, type=f_type, rating=f_rating, year=f_year, description=f_description, original_url=f_original_url, media_url=f_media_url, title_internal=f_title_internal, duration=f_duration, plays=f_plays, filename=f_filename)
+
+def decode_Image(d):
+    d = _Image.__pre_deserialize__(d)
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('partyId')
+    f_party_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('compo')
+    f_compo = None if v is None else _intern(v)
+    v = d.get('partyPlace')
+    f_party_place = None if v is None else v if v.__class__ is int else int(v)
+    v = d['authorIds']
+    f_author_ids = [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('tags')
+    f_tags = None if v is None else [_intern(x) for x in v]
+    v = d.get('type')
+    f_type = None if v is None else _intern(v)
+    v = d['rating']
+    f_rating = _Decimal(v)
+    v = d.get('year')
+    f_year = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('description')
+    f_description = None if v is None else __unescape(v)
+    v = d.get('originalUrl')
+    f_original_url = None if v is None else __unquote(v)
+    v = d.get('media_url')
+    f_media_url = None if v is None else __unquote(v)
+    v = d.get('views')
+    f_views = None if v is None else v if v.__class__ is int else int(v)
+    return _Image(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, party_id=f_party_id, compo=f_compo, party_place=f_party_place, author_ids=f_author_ids, tags=f_tags, type=f_type, rating=f_rating, year=f_year, description=f_description, original_url=f_original_url, media_url=f_media_url, views=f_views)
+
+def decode_Group(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('type')
+    f_type = None if v is None else _intern(v)
+    v = d.get('country')
+    f_country = None if v is None else _intern(v)
+    v = d.get('city')
+    f_city = None if v is None else _intern(v)
+    v = d.get('website')
+    f_website = None if v is None else __unquote(v)
+    v = d.get('aliases')
+    f_aliases = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    return _Group(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, type=f_type, country=f_country, city=f_city, website=f_website, aliases=f_aliases, import_ids=f_import_ids)
+
+def decode_GroupAlias(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('groupId')
+    f_group_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    v = d.get('startDate')
+    f_start_date = None if v is None else __date(v)
+    v = d.get('endDate')
+    f_end_date = None if v is None else __date(v)
+    return _GroupAlias(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, group_id=f_group_id, import_ids=f_import_ids, start_date=f_start_date, end_date=f_end_date)
+
+def decode_Product(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('year')
+    f_year = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('partyId')
+    f_party_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('compo')
+    f_compo = None if v is None else _intern(v)
+    v = d.get('partyPlace')
+    f_party_place = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('legalStatus')
+    f_legal_status = None if v is None else _intern(v)
+    v = d.get('rating')
+    f_rating = None if v is None else _Decimal(v)
+    v = d.get('authorIds')
+    f_author_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('groupIds')
+    f_group_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('publisherIds')
+    f_publisher_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('categoryIds')
+    f_category_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('language')
+    f_languages = None if v is None else [_intern(x) for x in v]
+    v = d.get('tags')
+    f_tags = None if v is None else [_intern(x) for x in v]
+    v = d.get('description')
+    f_description = None if v is None else __unescape(v)
+    f_youtube_id = d.get('youtubeId')
+    v = d.get('imagesUrls')
+    f_image_urls = None if v is None else [__unquote(x) for x in v]
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    return _Product(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, year=f_year, party_id=f_party_id, compo=f_compo, party_place=f_party_place, legal_status=f_legal_status, rating=f_rating, author_ids=f_author_ids, group_ids=f_group_ids, publisher_ids=f_publisher_ids, category_ids=f_category_ids, languages=f_languages, tags=f_tags, description=f_description, youtube_id=f_youtube_id, image_urls=f_image_urls, import_ids=f_import_ids)
+
+def decode_Release(d):
+    v = d['id']
+    f_id = v if v.__class__ is int else int(v)
+    v = d.get('title')
+    f_title = None if v is None else __unescape(v)
+    v = d['url']
+    f_url = __unquote(v)
+    v = d['dateCreated']
+    f_created = _datetime_fromtimestamp(v)
+    v = d['dateModified']
+    f_modified = _datetime_fromtimestamp(v)
+    v = d.get('prodId')
+    f_product_id = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('year')
+    f_year = None if v is None else v if v.__class__ is int else int(v)
+    v = d.get('releaseType')
+    f_release_type = None if v is None else _intern(v)
+    f_version = d.get('version')
+    v = d.get('language')
+    f_languages = None if v is None else [_intern(x) for x in v]
+    v = d.get('hardwareRequired')
+    f_hardware = None if v is None else [_intern(x) for x in v]
+    v = d.get('authorIds')
+    f_author_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('publisherIds')
+    f_publisher_ids = None if v is None else [x if x.__class__ is int else int(x) for x in v]
+    v = d.get('description')
+    f_description = None if v is None else __unescape(v)
+    v = d.get('importIds')
+    f_import_ids = None if v is None else decode_ImportID(v)
+    return _Release(id=f_id, title=f_title, url=f_url, created=f_created, modified=f_modified, product_id=f_product_id, year=f_year, release_type=f_release_type, version=f_version, languages=f_languages, hardware=f_hardware, author_ids=f_author_ids, publisher_ids=f_publisher_ids, description=f_description, import_ids=f_import_ids)
+
+
+DECODERS = {
+    'author': decode_Author,
+    'authorAlias': decode_AuthorAlias,
+    'zxProdCategory': decode_ProductCategory,
+    'zxMusic': decode_Tune,
+    'zxPicture': decode_Image,
+    'group': decode_Group,
+    'groupAlias': decode_GroupAlias,
+    'zxProd': decode_Product,
+    'zxRelease': decode_Release,
+}
@@ -0,0 +1,100 @@
+import collections
+import dataclasses as dc
+from typing import Protocol
+
+
+@dc.dataclass(slots=True)
+class CacheEntry:
+    """Запись кэша ответов API"""
+
+    body: bytes
+    """Тело ответа"""
+    expires: float
+    """Время окончания актуальности (UNIX timestamp)"""
+    etag: str | None = None
+    """Значение заголовка `ETag`"""
+    last_modified: str | None = None
+    """Значение заголовка `Last-Modified`"""
+
+
+@dc.dataclass(slots=True)
+class CacheStats:
+    """Счетчики использования кэша"""
+
+    hits: int = 0
+    """Ответы из кэша"""
+    misses: int = 0
+    """Запросы к серверу"""
+    revalidations: int = 0
+    """Записи, подтвержденные сервером (`304 Not Modified`)"""
+
+
+class CacheBackend(Protocol):
+    """
+    Протокол хранилища кэша ответов API.
+
+    Ключом является итоговый URL запроса. Хранилище не проверяет актуальность
+    записей: устаревшие записи используются клиентом для условных запросов.
+    """
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Возвращает запись по ключу."""
+        ...
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Сохраняет запись."""
+        ...
+
+
+class MemoryCache:
+    """Хранилище кэша в памяти с вытеснением давно неиспользуемых записей."""
+
+    _data: collections.OrderedDict[str, CacheEntry]
+    _max_size: int
+    _size: int
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Параметры:
+        - `max_size`: ограничение суммарного размера тел ответов в байтах.
+        По-умолчанию: `64 МиБ`.
+        """
+
+        self._data = collections.OrderedDict()
+        self._max_size = max_size
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size(self) -> int:
+        """Суммарный размер тел ответов в байтах."""
+
+        return self._size
+
+    async def get(self, key: str) -> CacheEntry | None:
+        if (entry := self._data.get(key)) is not None:
+            self._data.move_to_end(key)
+
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        if (old := self._data.pop(key, None)) is not None:
+            self._size -= len(old.body)
+
+        if len(entry.body) > self._max_size:
+            return
+
+        self._data[key] = entry
+        self._size += len(entry.body)
+
+        while self._size > self._max_size:
+            _, old = self._data.popitem(last=False)
+            self._size -= len(old.body)
+
+    def clear(self) -> None:
+        """Очистка"""
+
+        self._data.clear()
+        self._size = 0
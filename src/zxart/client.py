@@ -1,21 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import collections
+import itertools
 import logging
+import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, overload
 
 import aiohttp
 import orjson
 import yarl
 
-from .common import Entity, Language, Order, process_filters
-from .models import ApiResponse
+from .cache import CacheEntry, CacheStats
+from .common import Entity, Language, Order
+from .decode import decode_response, item_decoder
+from .query import _BASE_URL, Query, compile_query
+from .telemetry import _EVENT, RequestEvent, trace_config
+from .throttle import (
+    ConcurrencyLimiter,
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+)
+from .transport import TransportOptions
 
 if TYPE_CHECKING:
-    from typing import Any, Literal, Unpack
+    from typing import (
+        Any,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterator,
+        Literal,
+        Mapping,
+        Unpack,
+    )
 
+    from .cache import CacheBackend
     from .common import CommonOptions, OrderSettings
     from .image import ImageParams
-    from .models import Author, AuthorAlias, Image, ProductCategory, Tune
+    from .mirror import Mirror
+    from .models import (
+        ApiResponse,
+        Author,
+        AuthorAlias,
+        Group,
+        GroupAlias,
+        Image,
+        Product,
+        ProductCategory,
+        Release,
+        Tune,
+    )
+    from .telemetry import Instrument
     from .tune import TuneParams
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,22 +62,159 @@ _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ORDER = Order.MOST_RECENT
 _DEFAULT_LANGUAGE = Language.RUSSIAN
 _DEFAULT_LIMIT = 60
+_DEFAULT_CONCURRENCY = 4
+_DEFAULT_CACHE_TTL = 300.0
+_DEFAULT_MAX_CONCURRENCY = 32
+_DEFAULT_TARGET_LATENCY = 2.0
 
-_BASE_URL = yarl.URL("https://zxart.ee/api/")
-"""Базовый URL API"""
+_MAX_IDS_LENGTH = 1024
+"""Ограничение длины списка идентификаторов в фильтре пакетного запроса"""
+_MAX_IDENTITY_SIZE = 10_000
+"""Количество сущностей каждого типа в карте загруженных"""
 
 
 class ZXArtApiError(Exception):
     """Ошибка API"""
 
 
+def _decode_json(entity: Entity, body: bytes) -> dict[str, Any]:
+    """Разбор тела ответа API с проверкой статуса."""
+
+    try:
+        json: dict[str, Any] = orjson.loads(body)
+
+    except orjson.JSONDecodeError as exc:
+        raise ZXArtApiError("API response decode error.") from exc
+
+    if json.pop("responseStatus", None) != "success":
+        raise ZXArtApiError("API request error.")
+
+    json["result"] = json.pop("responseData")[entity]
+    json["entity"] = entity
+
+    return json
+
+
+def _parse(entity: Entity, body: bytes) -> dict[str, Any]:
+    """Разбор тела ответа API с измерением для события `RequestEvent`."""
+
+    if (event := _EVENT.get()) is None:
+        return _decode_json(entity, body)
+
+    t = time.monotonic()
+    json = _decode_json(entity, body)
+
+    event.size = len(body)
+    event.json_decode = time.monotonic() - t
+
+    return json
+
+
+def _chunk_ids(ids: list[int], max_length: int) -> Iterator[list[int]]:
+    """Разбиение идентификаторов на списки ограниченной длины."""
+
+    chunk: list[int] = []
+    length = 0
+
+    for id in ids:
+        n = len(str(id)) + 1
+
+        if chunk and length + n > max_length:
+            yield chunk
+            chunk, length = [], 0
+
+        chunk.append(id)
+        length += n
+
+    if chunk:
+        yield chunk
+
+
+class _AutoBatcher:
+    """Сборщик одиночных запросов по идентификатору в пакетные."""
+
+    _load: Callable[[Iterable[int]], Awaitable[dict[int, Any]]]
+    _pending: dict[int, list[asyncio.Future[Any]]]
+    _tasks: set[asyncio.Task[dict[int, Any]]]
+
+    def __init__(
+        self, load: Callable[[Iterable[int]], Awaitable[dict[int, Any]]]
+    ) -> None:
+        self._load = load
+        self._pending = {}
+        self._tasks = set()
+
+    def get(self, id: int) -> asyncio.Future[Any]:
+        """Постановка идентификатора в очередь текущей итерации цикла."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self._pending:
+            loop.call_soon(self._flush)
+
+        self._pending.setdefault(id, []).append(future)
+
+        return future
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+
+        task = asyncio.ensure_future(self._load(pending))
+        self._tasks.add(task)
+
+        def resolve(task: asyncio.Task[dict[int, Any]]) -> None:
+            self._tasks.discard(task)
+
+            result = None if task.cancelled() else task.exception()
+
+            for id, futures in pending.items():
+                for future in futures:
+                    if future.done():
+                        continue
+
+                    if task.cancelled():
+                        future.cancel()
+
+                    elif result is not None:
+                        future.set_exception(result)
+
+                    else:
+                        future.set_result(task.result().get(id))
+
+        task.add_done_callback(resolve)
+
+
 class ZXArtClient:
     """Клиент ZXArt"""
 
     _cli: aiohttp.ClientSession
+    _transport: TransportOptions
     _language: Language
     _limit: int
     _order: Order | OrderSettings
+    _cache: CacheBackend | None
+    _cache_ttl: float | Mapping[Entity, float]
+
+    _coalesce: bool
+    _bucket: RateLimiter | None
+    _limiter: ConcurrencyLimiter | None
+    _retry: RetryPolicy | None
+    _identity: dict[Entity, collections.OrderedDict[int, tuple[float, Any]]]
+    _identity_ttl: float | None
+    _mirror: Mirror | None
+    _offline: bool
+    _batcher: _AutoBatcher | None
+    _decode_response: Callable[[Entity, dict[str, Any]], ApiResponse]
+    _item_decoder: Callable[[Entity], Callable[[dict[str, Any]], Any]]
+    _inflight: dict[yarl.URL, asyncio.Task[dict[str, Any]]]
+    _waiters: dict[asyncio.Task[dict[str, Any]], int]
+    _instruments: tuple[Instrument, ...]
+
+    cache_stats: CacheStats
+    """Счетчики использования кэша"""
+    coalesced: int
+    """Количество запросов, объединенных с уже выполняющимися"""
 
     def __init__(
         self,
@@ -48,6 +223,20 @@ class ZXArtClient:
         limit: int | None = None,
         order: Order | OrderSettings | None = None,
         session: aiohttp.ClientSession | None = None,
+        transport: TransportOptions | None = None,
+        cache: CacheBackend | None = None,
+        cache_ttl: float | Mapping[Entity, float] = _DEFAULT_CACHE_TTL,
+        coalesce: bool = True,
+        rate_limit: float | RateLimiter | None = None,
+        max_concurrency: int | None = None,
+        adaptive: bool = False,
+        retry: RetryPolicy | None = None,
+        auto_batch: bool = False,
+        identity_ttl: float | None = None,
+        mirror: Mirror | None = None,
+        offline: bool = False,
+        lazy: bool = False,
+        instruments: Iterable[Instrument] = (),
     ) -> None:
         """
         Инициализирует клиент параметрами запроса `по-умолчанию`.
@@ -57,20 +246,131 @@ class ZXArtClient:
         - `limit`: ограничение по количеству записей. По-умолчанию: `60`.
         - `order`: порядок сортировки результата. По-умолчанию: `сначала последние`.
         - `session`: пользовательская сессия `aiohttp.ClientSession`.
+        - `transport`: параметры транспорта для сессии, создаваемой клиентом.
+        Не используется вместе с `session`.
+        - `cache`: хранилище кэша ответов. По-умолчанию: кэширование отключено.
+        - `cache_ttl`: время актуальности записей кэша в секундах, общее или
+        по сущностям. По-умолчанию: `300`.
+        - `coalesce`: объединение одновременных идентичных запросов в один.
+        По-умолчанию: `включено`.
+        - `rate_limit`: ограничение частоты запросов в секунду или общий
+        ограничитель (например, `SharedTokenBucket`). По-умолчанию: не
+        ограничена.
+        - `max_concurrency`: ограничение количества одновременных запросов.
+        По-умолчанию: не ограничено.
+        - `adaptive`: подстройка количества одновременных запросов по задержке
+        и ошибкам сервера в пределах `max_concurrency`.
+        - `retry`: параметры повторов при ошибках. По-умолчанию: без повторов.
+        - `auto_batch`: объединение вызовов `author` одной итерации цикла
+        событий в пакетный запрос.
+        - `identity_ttl`: время хранения в секундах сущностей, загруженных
+        пакетными запросами, в карте загруженных. Повторные запросы этих
+        сущностей обслуживаются картой. По-умолчанию: карта отключена.
+        - `mirror`: локальное зеркало каталога, которое опрашивается до
+        обращения к серверу.
+        - `offline`: запросы обслуживаются только зеркалом.
+        - `lazy`: записи ответов представляются ленивыми представлениями
+        `LazyView`, поля которых преобразуются при первом обращении.
+        - `instruments`: обработчики событий `RequestEvent` с измерениями
+        каждого вызова `api` (например, `telemetry.Metrics`).
         """
 
         self._language = language or _DEFAULT_LANGUAGE
         self._limit = limit or _DEFAULT_LIMIT
         self._order = order or _DEFAULT_ORDER
-        self._cli = session or aiohttp.ClientSession()
+        if session is not None and transport is not None:
+            raise ValueError("Transport options require own session.")
+
+        if offline and mirror is None:
+            raise ValueError("Offline mode requires a mirror.")
+
+        self._instruments = tuple(instruments)
+        self._transport = transport or TransportOptions()
+        self._cli = session or self._transport.session(
+            [trace_config()] if self._instruments else None
+        )
         self._close_connector = not session
+        self._cache = cache
+        self._cache_ttl = cache_ttl
+        self.cache_stats = CacheStats()
+        self._coalesce = coalesce
+        self._inflight = {}
+        self._waiters = {}
+        self.coalesced = 0
+        if isinstance(rate_limit, float | int):
+            self._bucket = TokenBucket(rate_limit) if rate_limit else None
+
+        else:
+            self._bucket = rate_limit
+        self._limiter = None
+        self._retry = retry
+        self._identity = {}
+        self._identity_ttl = identity_ttl
+        self._batcher = _AutoBatcher(self.authors) if auto_batch else None
+        self._mirror = mirror
+        self._offline = offline
+
+        if lazy:
+            # Классы представлений генерируются только при использовании
+            from .lazy import decode_views, view_type
+
+            self._decode_response, self._item_decoder = decode_views, view_type
+
+        else:
+            self._decode_response = decode_response
+            self._item_decoder = item_decoder
+
+        if adaptive:
+            n = max_concurrency or _DEFAULT_MAX_CONCURRENCY
+            self._limiter = ConcurrencyLimiter(
+                max(1, n // 4),
+                max_limit=n,
+                target_latency=_DEFAULT_TARGET_LATENCY,
+            )
+
+        elif max_concurrency:
+            self._limiter = ConcurrencyLimiter(max_concurrency)
 
     async def __aenter__(self):
+        if n := self._transport.prewarm:
+            await self.prewarm(n)
+
         return self
 
     def __aexit__(self, exc_type, exc_value, traceback):
         return self.close()
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Сессия HTTP клиента."""
+
+        return self._cli
+
+    @property
+    def language(self) -> Language:
+        """Язык переводимых полей сущностей по-умолчанию."""
+
+        return self._language
+
+    @property
+    def limit(self) -> int:
+        """Ограничение по количеству записей по-умолчанию."""
+
+        return self._limit
+
+    async def prewarm(self, connections: int) -> None:
+        """Открытие соединений с сервером API заранее."""
+
+        async def connect() -> None:
+            try:
+                async with self._cli.head(_BASE_URL) as x:
+                    await x.release()
+
+            except (aiohttp.ClientError, TimeoutError) as exc:
+                _LOGGER.debug("Prewarm error: %s", exc)
+
+        await asyncio.gather(*(connect() for _ in range(connections)))
+
     async def close(self):
         """Закрытие"""
 
@@ -98,6 +398,34 @@ class ZXArtClient:
         **kwargs: Unpack[CommonOptions],
     ) -> ApiResponse[ProductCategory]: ...
 
+    @overload
+    async def api(
+        self,
+        entity: Literal[Entity.GROUP],
+        **kwargs: Unpack[CommonOptions],
+    ) -> ApiResponse[Group]: ...
+
+    @overload
+    async def api(
+        self,
+        entity: Literal[Entity.GROUP_ALIAS],
+        **kwargs: Unpack[CommonOptions],
+    ) -> ApiResponse[GroupAlias]: ...
+
+    @overload
+    async def api(
+        self,
+        entity: Literal[Entity.PRODUCT],
+        **kwargs: Unpack[CommonOptions],
+    ) -> ApiResponse[Product]: ...
+
+    @overload
+    async def api(
+        self,
+        entity: Literal[Entity.RELEASE],
+        **kwargs: Unpack[CommonOptions],
+    ) -> ApiResponse[Release]: ...
+
     @overload
     async def api(
         self,
@@ -153,31 +481,659 @@ class ZXArtClient:
         """
 
     async def api(self, entity: Entity, **kwargs: Any) -> ApiResponse:
-        if kwargs:
-            process_filters(entity, kwargs)
+        start = kwargs.pop("start", 0)
+        limit = kwargs.pop("limit", self._limit)
+        query = self._compile(entity, kwargs)
+
+        return await self.run(query, start=start, limit=limit)
+
+    def compile(self, entity: Entity, **filters: Any) -> Query:
+        """
+        Компиляция запроса для метода `run` с языком и сортировкой клиента
+        по-умолчанию. Параметры аналогичны методу `api`, кроме `start` и
+        `limit`.
+        """
+
+        return self._compile(entity, filters)
+
+    async def run(
+        self,
+        query: Query,
+        *,
+        start: int = 0,
+        limit: int | None = None,
+        fresh: bool = False,
+    ) -> ApiResponse:
+        """
+        Выполнение скомпилированного запроса `Query` (см. метод `compile`).
+
+        Параметры:
+        - `query`: запрос.
+        - `start`: стартовая позиция курсора запроса.
+        - `limit`: ограничение по количеству записей. По-умолчанию: из клиента.
+        - `fresh`: запрос к серверу в обход зеркала, кэша и объединения.
+        """
+
+        if limit is None:
+            limit = self._limit
+
+        call = self._run(query, start, limit, fresh)
+
+        if not self._instruments:
+            return await call
+
+        return await self._measure(query.entity, call)
+
+    async def _measure[T](self, entity: Entity, call: Awaitable[T]) -> T:
+        """Выполнение вызова с формированием события `RequestEvent`."""
+
+        event = RequestEvent(entity)
+        token = _EVENT.set(event)
+        t = time.monotonic()
+
+        try:
+            return await call
+
+        except Exception as exc:
+            event.error = exc
+            raise
+
+        finally:
+            event.duration = time.monotonic() - t
+            _EVENT.reset(token)
+            self._emit(event)
+
+    def _emit(self, event: RequestEvent) -> None:
+        """Передача события обработчикам."""
+
+        for x in self._instruments:
+            try:
+                x(event)
+
+            except Exception:
+                _LOGGER.exception("Instrument error.")
+
+    async def _run(
+        self, query: Query, start: int, limit: int, fresh: bool = False
+    ) -> ApiResponse:
+        entity, event = query.entity, _EVENT.get()
+        json = None
+
+        if self._offline or (self._mirror is not None and not fresh):
+            json = self._mirrored(query, start, limit)
+
+        if json is None:
+            url = query.url(start, limit)
+            _LOGGER.debug("API request URL: %s", url)
+
+            if fresh:
+                json = _parse(entity, (await self._request(url))[1])
+
+            else:
+                json = await self._load(entity, url)
+
+            if event is not None:
+                event.url = url
+
+        if event is None:
+            return self._decode_response(entity, json)
+
+        t = time.monotonic()
+        result = self._decode_response(entity, json)
+
+        event.model_decode = time.monotonic() - t
+        event.items = len(result.result)
+
+        return result
+
+    def _mirrored(
+        self, query: Query, start: int, limit: int
+    ) -> dict[str, Any] | None:
+        """
+        Ответ зеркала в формате ответа API или `None`, если зеркало не может
+        обработать запрос. В режиме `offline` вызывает `ZXArtApiError`.
+        """
+
+        assert self._mirror is not None
+
+        try:
+            json = self._mirror.select(
+                query.entity, start=start, limit=limit, **query.filters
+            )
+
+        except LookupError as exc:
+            if self._offline:
+                raise ZXArtApiError("Offline request error.") from exc
+
+            _LOGGER.debug("Mirror miss: %s", exc)
+
+            return None
+
+        if (event := _EVENT.get()) is not None:
+            event.outcome = "mirror"
+
+        return json
+
+    @overload
+    def stream(
+        self,
+        entity: Literal[Entity.TUNE],
+        **kwargs: Unpack[TuneParams],
+    ) -> AsyncIterator[Tune]: ...
+
+    @overload
+    def stream(
+        self,
+        entity: Literal[Entity.IMAGE],
+        **kwargs: Unpack[ImageParams],
+    ) -> AsyncIterator[Image]: ...
+
+    @overload
+    def stream(
+        self,
+        entity: Entity,
+        **kwargs: Unpack[CommonOptions],
+    ) -> AsyncIterator[Any]: ...
+
+    async def stream(self, entity: Entity, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Потоковое декодирование страницы выборки.
+
+        Записи декодируются в модели по одной по мере итерации, а исходные
+        словари освобождаются сразу после декодирования. Подходит для запросов
+        с большим значением `limit`. Параметры аналогичны методу `api`.
+        """
+
+        start = kwargs.pop("start", 0)
+        limit = kwargs.pop("limit", self._limit)
+        query = self._compile(entity, kwargs)
+
+        if self._instruments:
+            items = await self._measure(
+                entity, self._items(query, start, limit)
+            )
+
+        else:
+            items = await self._items(query, start, limit)
+
+        decode = self._item_decoder(entity)
+
+        # Извлечение с конца списка не требует сдвига элементов
+        items.reverse()
+
+        while items:
+            yield decode(items.pop())
+
+    async def _items(self, query: Query, start: int, limit: int) -> list[Any]:
+        """Запрос списка исходных записей без создания моделей."""
+
+        event, json = _EVENT.get(), None
+
+        if self._mirror is not None:
+            json = self._mirrored(query, start, limit)
+
+        if json is None:
+            url = query.url(start, limit)
+            _LOGGER.debug("API request URL: %s", url)
+            json = await self._load(query.entity, url)
+
+            if event is not None:
+                event.url = url
+
+        # Разобранный ответ может быть общим для объединенных запросов
+        items = list(json["result"])
+
+        if event is not None:
+            event.items = len(items)
+
+        return items
+
+    def _compile(self, entity: Entity, kwargs: dict[str, Any]) -> Query:
+        """Компиляция запроса с параметрами клиента по-умолчанию."""
 
         kwargs.setdefault("language", self._language)
-        kwargs.setdefault("limit", self._limit)
         kwargs.setdefault("order", self._order)
-        kwargs["export"] = entity
 
-        url = _BASE_URL.joinpath(*(f"{k}:{v}" for k, v in kwargs.items()))
+        return compile_query(entity, **kwargs)
+
+    async def _load(self, entity: Entity, url: yarl.URL) -> dict[str, Any]:
+        """Запрос и разбор ответа с объединением идентичных запросов."""
+
+        if not self._coalesce:
+            return await self._get(entity, url)
+
+        if (task := self._inflight.get(url)) is not None:
+            self.coalesced += 1
+
+            if (event := _EVENT.get()) is not None:
+                event.outcome = "coalesced"
+
+        else:
+            task = asyncio.create_task(self._get(entity, url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda x: self._discard(url, x))
+
+        waiters = self._waiters
+        waiters[task] = waiters.get(task, 0) + 1
+
+        try:
+            # Отмена одного из ожидающих не должна отменять общий запрос
+            return await asyncio.shield(task)
+
+        finally:
+            if n := waiters.pop(task) - 1:
+                waiters[task] = n
+
+            elif not task.done():
+                # Результат общего запроса больше никто не ожидает
+                task.cancel()
+                self._discard(url, task)
+
+    def _discard(self, url: yarl.URL, task: asyncio.Task[Any]) -> None:
+        """Удаление завершенного или отмененного общего запроса."""
+
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+
+    async def _get(self, entity: Entity, url: yarl.URL) -> dict[str, Any]:
+        """Запрос и разбор ответа с учетом кэша."""
+
+        if self._cache is None:
+            return _parse(entity, (await self._request(url))[1])
+
+        key, stats = str(url), self.cache_stats
+
+        if (entry := await self._cache.get(key)) is not None:
+            if entry.expires > time.time():
+                stats.hits += 1
+
+                if (event := _EVENT.get()) is not None:
+                    event.outcome = "cache"
+
+                return _parse(entity, entry.body)
+
+            headers = {}
+
+            if entry.etag:
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = entry.etag
+
+            if entry.last_modified:
+                headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+
+        else:
+            headers = None
+
+        stats.misses += 1
+
+        status, body, hdrs = await self._request(url, headers)
+
+        if entry is not None and status == 304:
+            stats.revalidations += 1
+            json = _parse(entity, entry.body)
+
+            if (event := _EVENT.get()) is not None:
+                event.outcome = "revalidated"
 
-        _LOGGER.debug("API request URL: %s", url)
+        else:
+            # В кэш попадают только успешно разобранные ответы
+            json = _parse(entity, body)
 
-        async with self._cli.get(url) as x:
-            json: dict[str, Any] = await x.json(loads=orjson.loads)
+            entry = CacheEntry(
+                body,
+                0,
+                hdrs.get(aiohttp.hdrs.ETAG),
+                hdrs.get(aiohttp.hdrs.LAST_MODIFIED),
+            )
 
-        if json.pop("responseStatus") != "success":
-            raise ZXArtApiError("API request error.")
+        ttl = self._cache_ttl
 
-        json["result"] = json.pop("responseData")[entity]
-        json["entity"] = entity
+        if not isinstance(ttl, float | int):
+            ttl = ttl.get(entity, _DEFAULT_CACHE_TTL)
 
-        return ApiResponse.from_dict(json)
+        entry.expires = time.time() + ttl
+        await self._cache.set(key, entry)
+
+        return json
+
+    async def _request(
+        self,
+        url: yarl.URL,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        """Сетевой запрос с ограничением нагрузки и повторами."""
+
+        retry, attempt = self._retry, 0
+        event = _EVENT.get()
+
+        while True:
+            t0 = time.monotonic()
+
+            if self._bucket is not None:
+                await self._bucket.acquire()
+
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            latency, retry_after = None, None
+            t1 = time.monotonic()
+
+            if event is not None:
+                event.queue_wait += t1 - t0
+                event.attempts += 1
+
+            try:
+                async with self._cli.get(url, headers=headers) as x:
+                    status = x.status
+
+                    if event is not None:
+                        event.status = status
+                        event.ttfb = time.monotonic() - t1
+
+                    if status < 400:
+                        body = await x.read()
+                        latency = time.monotonic() - t1
+                        return status, body, x.headers
+
+                    retry_after = x.headers.get(aiohttp.hdrs.RETRY_AFTER)
+                    error = ZXArtApiError(f"API HTTP error: {status}.")
+
+                    # Только перегрузка сервера уменьшает ограничение
+                    if status < 500 and status != 429:
+                        latency = time.monotonic() - t1
+
+                    if retry is None or status not in retry.statuses:
+                        raise error
+
+            except (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                TimeoutError,
+            ) as exc:
+                # Включая обрыв соединения во время чтения тела ответа
+                error = ZXArtApiError("API connection error.")
+                error.__cause__ = exc
+
+                if retry is None:
+                    raise error
+
+            finally:
+                if self._limiter is not None:
+                    await self._limiter.release(latency)
+
+            if attempt >= retry.attempts:
+                raise error
+
+            delay = retry.delay(attempt, retry_after)
+            attempt += 1
+
+            _LOGGER.debug("%s Retry %d in %.2f s.", error, attempt, delay)
+
+            await asyncio.sleep(delay)
 
     async def author(self, author_id: int) -> Author | None:
         """Запрос автора по идентификатору."""
 
-        if x := (await self.api(Entity.AUTHOR, id=author_id)).result:
-            return x[0]
+        if self._batcher is not None:
+            return await self._batcher.get(author_id)
+
+        return (await self.authors([author_id])).get(author_id)
+
+    async def authors(self, ids: Iterable[int]) -> dict[int, Author]:
+        """Пакетный запрос авторов по идентификаторам."""
+
+        return await self._lookup(Entity.AUTHOR, ids)
+
+    async def aliases(self, ids: Iterable[int]) -> dict[int, AuthorAlias]:
+        """Пакетный запрос псевдонимов авторов по идентификаторам."""
+
+        return await self._lookup(Entity.AUTHOR_ALIAS, ids)
+
+    async def tunes(self, ids: Iterable[int]) -> dict[int, Tune]:
+        """Пакетный запрос мелодий по идентификаторам."""
+
+        return await self._lookup(Entity.TUNE, ids)
+
+    async def images(self, ids: Iterable[int]) -> dict[int, Image]:
+        """Пакетный запрос изображений по идентификаторам."""
+
+        return await self._lookup(Entity.IMAGE, ids)
+
+    async def groups(self, ids: Iterable[int]) -> dict[int, Group]:
+        """Пакетный запрос групп по идентификаторам."""
+
+        return await self._lookup(Entity.GROUP, ids)
+
+    async def products(self, ids: Iterable[int]) -> dict[int, Product]:
+        """Пакетный запрос продуктов по идентификаторам."""
+
+        return await self._lookup(Entity.PRODUCT, ids)
+
+    async def releases(self, ids: Iterable[int]) -> dict[int, Release]:
+        """Пакетный запрос релизов по идентификаторам."""
+
+        return await self._lookup(Entity.RELEASE, ids)
+
+    def forget(self, entity: Entity | None = None) -> None:
+        """Очистка карты загруженных пакетными запросами сущностей."""
+
+        if entity is None:
+            self._identity.clear()
+
+        else:
+            self._identity.pop(entity, None)
+
+    async def _lookup(
+        self, entity: Entity, ids: Iterable[int]
+    ) -> dict[int, Any]:
+        """
+        Пакетный запрос сущностей по идентификаторам.
+
+        Сущности, загруженные не ранее `identity_ttl`, берутся из карты,
+        затем из зеркала. Остальные запрашиваются у сервера параллельно
+        списками идентификаторов, ограниченными длиной URL. В режиме `offline`
+        отсутствие сущности в зеркале вызывает `ZXArtApiError`.
+        """
+
+        ttl, now = self._identity_ttl, time.monotonic()
+        known = None
+        result, missing = {}, []
+
+        if ttl is not None:
+            known = self._identity.setdefault(entity, collections.OrderedDict())
+
+        for id in dict.fromkeys(ids):
+            if known is not None and (x := known.get(id)) and x[0] > now:
+                known.move_to_end(id)
+                result[id] = x[1]
+
+            else:
+                missing.append(id)
+
+        pages: list[list[Any]] = []
+
+        if self._mirror is not None and missing:
+            page, missing = self._lookup_mirror(entity, missing)
+            pages.append(page)
+
+        # Отсутствующие в зеркале сущности запрашиваются в обход зеркала
+        fresh = self._mirror is not None
+        pages += await asyncio.gather(
+            *(
+                self.fetch_all(entity, id=chunk, limit=len(chunk), fresh=fresh)
+                for chunk in _chunk_ids(missing, _MAX_IDS_LENGTH)
+            )
+        )
+
+        for x in itertools.chain.from_iterable(pages):
+            result[x.id] = x
+
+            if known is not None:
+                known[x.id] = now + ttl, x
+                known.move_to_end(x.id)
+
+        if known is not None:
+            while len(known) > _MAX_IDENTITY_SIZE:
+                known.popitem(last=False)
+
+        return result
+
+    def _lookup_mirror(
+        self, entity: Entity, ids: list[int]
+    ) -> tuple[list[Any], list[int]]:
+        """Сущности из зеркала и идентификаторы отсутствующих в нем."""
+
+        decode, result = self._item_decoder(entity), []
+
+        for chunk in _chunk_ids(ids, _MAX_IDS_LENGTH):
+            query = self._compile(entity, {"id": chunk})
+
+            if (json := self._mirrored(query, 0, len(chunk))) is None:
+                break
+
+            result += map(decode, json["result"])
+
+        found = {x.id for x in result}
+        missing = [x for x in ids if x not in found]
+
+        if missing and self._offline:
+            raise ZXArtApiError(
+                f"Offline request error: {len(missing)} ids are not mirrored."
+            )
+
+        return result, missing
+
+    @overload
+    def iter_all(
+        self,
+        entity: Literal[Entity.TUNE],
+        *,
+        concurrency: int = ...,
+        stop: int | None = ...,
+        fresh: bool = ...,
+        **kwargs: Unpack[TuneParams],
+    ) -> AsyncIterator[Tune]: ...
+
+    @overload
+    def iter_all(
+        self,
+        entity: Literal[Entity.IMAGE],
+        *,
+        concurrency: int = ...,
+        stop: int | None = ...,
+        fresh: bool = ...,
+        **kwargs: Unpack[ImageParams],
+    ) -> AsyncIterator[Image]: ...
+
+    @overload
+    def iter_all(
+        self,
+        entity: Entity,
+        *,
+        concurrency: int = ...,
+        stop: int | None = ...,
+        fresh: bool = ...,
+        **kwargs: Unpack[CommonOptions],
+    ) -> AsyncIterator[Any]: ...
+
+    async def iter_all(
+        self,
+        entity: Entity,
+        *,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        stop: int | None = None,
+        fresh: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Итератор по всем записям выборки с автоматической пагинацией.
+
+        Первая страница определяет общее количество записей `total`, после
+        чего остальные страницы запрашиваются параллельно. Записи выдаются
+        строго в порядке выборки.
+
+        Параметры:
+        - `entity`: сущность API.
+        - `concurrency`: максимальное количество одновременных запросов страниц.
+        - `stop`: конечное смещение выборки (не включая). Страницы за ним не
+        запрашиваются. По-умолчанию: до конца выборки.
+        - `fresh`: запрос страниц к серверу в обход зеркала, кэша и
+        объединения.
+        - `kwargs`: параметры запроса, как в методе `api`.
+        """
+
+        if concurrency < 1:
+            raise ValueError("Concurrency must be positive.")
+
+        start = kwargs.pop("start", 0)
+        limit = kwargs.pop("limit", self._limit)
+        # Запрос компилируется однократно для всех страниц
+        query = self._compile(entity, kwargs)
+
+        if stop is not None:
+            if stop <= start:
+                return
+
+            limit = min(limit, stop - start)
+
+        page = await self.run(query, start=start, limit=limit, fresh=fresh)
+
+        for x in page.result:
+            yield x
+
+        # Шаг пагинации определяется фактическим ограничением сервера
+        if not page.result or (step := page.limit) < 1:
+            return
+
+        end = page.total if stop is None else min(stop, page.total)
+        offsets = iter(range(start + step, end, step))
+        pending: collections.deque[asyncio.Task[ApiResponse]] = (
+            collections.deque()
+        )
+
+        def schedule() -> None:
+            for offset in offsets:
+                n = min(limit, end - offset)
+                coro = self.run(query, start=offset, limit=n, fresh=fresh)
+                pending.append(asyncio.create_task(coro))
+
+                if len(pending) >= concurrency:
+                    break
+
+        try:
+            schedule()
+
+            while pending:
+                page = await pending.popleft()
+                schedule()
+
+                for x in page.result:
+                    yield x
+
+                # Выборка сократилась во время обхода
+                if not page.result:
+                    break
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def fetch_all(
+        self,
+        entity: Entity,
+        *,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """
+        Запрос всех записей выборки. Параметры аналогичны `iter_all`.
+        """
+
+        return [
+            x
+            async for x in self.iter_all(
+                entity, concurrency=concurrency, **kwargs
+            )
+        ]
@@ -0,0 +1,268 @@
+"""
+Многопроцессный обход каталога.
+
+Работа делится на части (по сущностям, годам или диапазонам смещений), каждая
+часть обходится клиентом в отдельном процессе. Процессы передают записи в
+виде строк NDJSON, основной процесс объединяет их в один файл, исключая
+повторы по идентификатору. Частота запросов всех процессов ограничена общим
+`SharedTokenBucket`.
+"""
+
+import asyncio
+import contextlib
+import dataclasses as dc
+import datetime as dt
+import multiprocessing
+import queue
+from array import array
+from decimal import Decimal
+from typing import Any, BinaryIO, Iterable, Literal
+
+import orjson
+
+from .client import ZXArtClient
+from .common import Entity
+from .throttle import SharedTokenBucket
+
+type Split = Literal["entity", "offset", "years"]
+"""Способ разбиения работы"""
+
+
+@dc.dataclass(frozen=True, slots=True)
+class Partition:
+    """Часть работы обхода"""
+
+    entity: Entity
+    """Сущность"""
+    filters: dict[str, Any] = dc.field(default_factory=dict)
+    """Фильтры запроса"""
+    start: int = 0
+    """Начальное смещение"""
+    stop: int | None = None
+    """Конечное смещение (не включая). По-умолчанию: до конца выборки."""
+
+
+@dc.dataclass(slots=True)
+class CrawlStats:
+    """Результат обхода"""
+
+    written: int = 0
+    """Записано уникальных записей"""
+    duplicates: int = 0
+    """Отброшено повторов"""
+    errors: list[str] = dc.field(default_factory=list)
+    """Ошибки частей обхода"""
+
+
+def _default(x: Any) -> Any:
+    if isinstance(x, Decimal):
+        return str(x)
+
+    if isinstance(x, dt.timedelta):
+        return x.total_seconds()
+
+    raise TypeError
+
+
+def dumps(item: Any) -> bytes:
+    """Сериализация модели в строку JSON."""
+
+    return orjson.dumps(item, default=_default)
+
+
+async def _total(
+    entity: Entity, filters: dict[str, Any], **options: Any
+) -> int:
+    async with ZXArtClient(**options) as cli:
+        return (await cli.api(entity, limit=1, **filters)).total
+
+
+def plan(
+    entities: Iterable[Entity],
+    *,
+    split: Split = "entity",
+    parts: int = 1,
+    years: Iterable[int] = (),
+    limit: int = 60,
+    **options: Any,
+) -> list[Partition]:
+    """
+    Разбиение работы на части.
+
+    Параметры:
+    - `entities`: сущности.
+    - `split`: способ разбиения: по сущностям, по диапазонам смещений (на
+    `parts` частей каждая сущность) или по годам `years`. Разбиение по годам
+    требует непустого `years`.
+    - `limit`: размер страницы, к которому выравниваются смещения.
+    - `options`: параметры клиента для пробных запросов.
+    """
+
+    years = tuple(years)
+
+    if split == "years" and not years:
+        raise ValueError("Split by years requires years.")
+
+    result = []
+
+    for entity in entities:
+        match split:
+            case "entity":
+                result.append(Partition(entity))
+
+            case "years":
+                result.extend(Partition(entity, {"years": y}) for y in years)
+
+            case "offset":
+                total = asyncio.run(_total(entity, {}, **options))
+                # Смещения кратны размеру страницы
+                step = -(-total // (parts * limit)) * limit
+
+                result.extend(
+                    Partition(entity, start=x, stop=min(x + step, total))
+                    for x in range(0, total, step or 1)
+                )
+
+    return result
+
+
+async def _crawl(
+    partition: Partition,
+    results: multiprocessing.Queue,
+    options: dict[str, Any],
+) -> None:
+    entity = partition.entity
+    # Поле сущности добавляется в начало объекта JSON записи
+    prefix = b'{"entity":' + orjson.dumps(entity) + b","
+    ids, lines = array("q"), []
+
+    async with (
+        ZXArtClient(**options) as cli,
+        contextlib.aclosing(
+            cli.iter_all(
+                entity,
+                start=partition.start,
+                stop=partition.stop,
+                **partition.filters,
+            )
+        ) as it,
+    ):
+        async for x in it:
+            ids.append(x.id)
+            lines.append(prefix + dumps(x)[1:])
+
+            if len(ids) >= cli.limit:
+                results.put(("items", entity, ids.tobytes(), b"\n".join(lines)))
+                ids, lines = array("q"), []
+
+    if ids:
+        results.put(("items", entity, ids.tobytes(), b"\n".join(lines)))
+
+
+def _worker(
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    bucket: SharedTokenBucket | None,
+    options: dict[str, Any],
+) -> None:
+    if bucket is not None:
+        options = options | {"rate_limit": bucket}
+
+    while (partition := tasks.get()) is not None:
+        try:
+            asyncio.run(_crawl(partition, results, options))
+
+        except Exception as exc:
+            results.put(
+                ("error", partition.entity, f"{partition}: {exc!r}", b"")
+            )
+
+    results.put(("done", None, b"", b""))
+
+
+def crawl(
+    partitions: Iterable[Partition],
+    output: BinaryIO,
+    *,
+    workers: int | None = None,
+    rate_limit: float | None = None,
+    **options: Any,
+) -> CrawlStats:
+    """
+    Обход частей работы в нескольких процессах с записью в NDJSON.
+
+    Параметры:
+    - `partitions`: части работы.
+    - `output`: файл вывода (бинарный).
+    - `workers`: количество процессов. По-умолчанию: количество ядер.
+    - `rate_limit`: общее ограничение частоты запросов в секунду.
+    - `options`: параметры клиентов процессов (`limit`, `language`, `retry`).
+    """
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = workers or multiprocessing.cpu_count()
+    tasks, results = ctx.Queue(), ctx.Queue()
+    bucket = SharedTokenBucket(rate_limit, context=ctx) if rate_limit else None
+
+    for x in partitions:
+        tasks.put(x)
+
+    for _ in range(workers):
+        tasks.put(None)
+
+    procs = [
+        ctx.Process(
+            target=_worker,
+            args=(tasks, results, bucket, options),
+            daemon=True,
+        )
+        for _ in range(workers)
+    ]
+
+    for p in procs:
+        p.start()
+
+    stats, active = CrawlStats(), workers
+    seen: set[tuple[Entity, int]] = set()
+
+    try:
+        while active:
+            try:
+                kind, entity, a, b = results.get(timeout=1)
+
+            except queue.Empty:
+                if not any(p.is_alive() for p in procs):
+                    stats.errors.append("Worker processes exited.")
+                    break
+
+                continue
+
+            match kind:
+                case "done":
+                    active -= 1
+
+                case "error":
+                    stats.errors.append(a)
+
+                case "items":
+                    ids = array("q")
+                    ids.frombytes(a)
+
+                    for id, line in zip(ids, b.split(b"\n")):
+                        if (key := (entity, id)) in seen:
+                            stats.duplicates += 1
+                            continue
+
+                        seen.add(key)
+                        output.write(line)
+                        output.write(b"\n")
+                        stats.written += 1
+
+    finally:
+        for p in procs:
+            p.join(timeout=1)
+
+            if p.is_alive():
+                p.terminate()
+
+    return stats
@@ -0,0 +1,332 @@
+"""
+Специализированные декодеры моделей.
+
+Для каждой модели заранее генерируется функция разбора записи ответа с учетом
+псевдонимов полей и стратегий десериализации из конфигурации модели. В отличие
+от универсального пути `ApiResponse.from_dict` декодеры не используют
+дискриминатор и компилируются при импорте модуля.
+
+Чтобы не тратить время на генерацию при каждом запуске, с пакетом
+поставляется модуль `zxart._decoders` с заранее сгенерированным кодом
+(команда `python -m zxart decoders`). Модуль используется, если его отпечаток
+совпадает с отпечатком исходного кода моделей, иначе декодеры компилируются.
+"""
+
+import dataclasses as dc
+import functools
+import hashlib
+import importlib
+import logging
+import types
+import typing
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+from .common import Entity
+from .models import ApiResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+_SOURCES = ("models.py", "decode.py")
+"""Исходный код, по которому генерируются декодеры"""
+
+type Decoder = Callable[[dict[str, Any]], Any]
+"""Декодер записи ответа"""
+
+
+class _Compiler:
+    """Генератор исходного кода декодеров моделей."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.refs: dict[str, Any] = {}
+        self._names: dict[type, str] = {}
+
+    def ref(self, obj: Any) -> str:
+        """Имя объекта в пространстве имен генерируемого кода."""
+
+        name = "_" + getattr(obj, "__qualname__", type(obj).__name__)
+        name = name.replace(".", "_")
+
+        while self.refs.setdefault(name, obj) is not obj:
+            name += "_"
+
+        return name
+
+    def model(self, cls: type) -> str:
+        """Генерация декодера модели. Возвращает имя функции."""
+
+        if (name := self._names.get(cls)) is not None:
+            return name
+
+        name = self._names[cls] = f"decode_{cls.__name__}"
+
+        config = getattr(cls, "Config", None)
+        aliases = getattr(config, "aliases", {})
+        strategies = getattr(config, "serialization_strategy", {})
+        hints = typing.get_type_hints(cls, include_extras=True)
+
+        body = [f"def {name}(d):"]
+
+        if hasattr(cls, "__pre_deserialize__"):
+            body.append(f"    d = {self.ref(cls)}.__pre_deserialize__(d)")
+
+        args = []
+
+        for field in dc.fields(cls):
+            if not field.init:
+                continue
+
+            key = aliases.get(field.name, field.name)
+            tp, optional = _unwrap_optional(hints[field.name])
+            required = (
+                field.default is dc.MISSING
+                and field.default_factory is dc.MISSING
+            )
+
+            var, expr = f"f_{field.name}", self.convert("v", tp, strategies)
+
+            if required and not optional:
+                body.append(f"    v = d[{key!r}]")
+                body.append(f"    {var} = {expr}")
+
+            elif expr == "v" and self.default(field) == "None":
+                body.append(f"    {var} = d.get({key!r})")
+
+            else:
+                default = self.default(field)
+                body.append(f"    v = d.get({key!r})")
+                body.append(f"    {var} = {default} if v is None else {expr}")
+
+            args.append(f"{field.name}={var}")
+
+        body.append(f"    return {self.ref(cls)}({', '.join(args)})")
+
+        self.lines.extend(body)
+        self.lines.append("")
+
+        return name
+
+    def default(self, field: dc.Field) -> str:
+        """Выражение значения поля по-умолчанию."""
+
+        if field.default_factory is not dc.MISSING:
+            return f"{self.ref(field.default_factory)}()"
+
+        if field.default is dc.MISSING or field.default is None:
+            return "None"
+
+        if isinstance(field.default, bool | int | float | str):
+            return repr(field.default)
+
+        return self.ref(field.default)
+
+    def convert(self, var: str, tp: Any, strategies: dict[Any, Any]) -> str:
+        """Выражение преобразования значения `var` к типу `tp`."""
+
+        if (x := strategies.get(tp)) is not None:
+            return f"{self.ref(x['deserialize'])}({var})"
+
+        if isinstance(tp, typing.TypeAliasType):
+            return self.convert(var, tp.__value__, strategies)
+
+        if typing.get_origin(tp) is typing.Annotated:
+            return self.convert(var, typing.get_args(tp)[0], strategies)
+
+        if typing.get_origin(tp) is list:
+            (arg,) = typing.get_args(tp)
+            item = self.convert("x", arg, strategies)
+
+            if item == "x":
+                return f"list({var})"
+
+            return f"[{item} for x in {var}]"
+
+        if tp is int:
+            return f"{var} if {var}.__class__ is int else int({var})"
+
+        if tp is float:
+            return f"float({var})"
+
+        if tp is Decimal:
+            return f"{self.ref(Decimal)}({var})"
+
+        if tp is str:
+            return var
+
+        if dc.is_dataclass(tp):
+            return f"{self.model(tp)}({var})"
+
+        raise TypeError(f"Unsupported field type: {tp!r}")
+
+    def build(self) -> dict[str, Any]:
+        """Компиляция сгенерированного кода."""
+
+        namespace = dict(self.refs)
+        exec(self.source, namespace)
+
+        return namespace
+
+    @property
+    def source(self) -> str:
+        """Исходный код декодеров."""
+
+        return "\n".join(self.lines)
+
+    def imports(self) -> list[str]:
+        """Инструкции импорта объектов пространства имен кода."""
+
+        lines = []
+
+        for name, obj in self.refs.items():
+            owner = getattr(obj, "__self__", obj)
+            module = getattr(obj, "__module__", None) or owner.__module__
+            head, *tail = obj.__qualname__.split(".")
+            resolved = importlib.import_module(module)
+            resolved = functools.reduce(getattr, [head, *tail], resolved)
+
+            if resolved != obj:
+                raise TypeError(f"Object is not importable: {obj!r}")
+
+            lines.append(f"from {module} import {head} as {name}")
+
+            if tail:
+                lines.append(f"{name} = {'.'.join([name, *tail])}")
+
+        return lines
+
+
+def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
+    if isinstance(tp, types.UnionType) or typing.get_origin(tp) is typing.Union:
+        args = [x for x in typing.get_args(tp) if x is not types.NoneType]
+
+        if len(args) == 1:
+            return args[0], True
+
+    return tp, False
+
+
+def _response_model(cls: type[ApiResponse]) -> type:
+    for base in cls.__orig_bases__:  # type: ignore[attr-defined]
+        if typing.get_origin(base) is ApiResponse:
+            return typing.get_args(base)[0]
+
+    raise TypeError(f"Unknown response model: {cls!r}")
+
+
+_RESPONSES: dict[Entity, type[ApiResponse]] = {
+    x.entity: x  # type: ignore[attr-defined]
+    for x in ApiResponse.__subclasses__()
+}
+
+
+def _fingerprint() -> str:
+    """Отпечаток исходного кода моделей и генератора декодеров."""
+
+    h = hashlib.sha256()
+
+    for x in _SOURCES:
+        h.update(Path(__file__).with_name(x).read_bytes())
+
+    return h.hexdigest()[:16]
+
+
+def generate() -> str:
+    """Исходный код модуля `zxart._decoders`."""
+
+    compiler = _Compiler()
+
+    names = {
+        entity: compiler.model(_response_model(cls))
+        for entity, cls in _RESPONSES.items()
+    }
+
+    return "\n".join(
+        [
+            '"""',
+            "Заранее сгенерированные декодеры моделей.",
+            "",
+            "Сгенерировано командой `python -m zxart decoders`. Не изменять.",
+            '"""',
+            "",
+            *compiler.imports(),
+            "",
+            f"FINGERPRINT = {_fingerprint()!r}",
+            "",
+            "",
+            *compiler.lines,
+            "",
+            "DECODERS = {",
+            *(f"    {str(k)!r}: {v}," for k, v in names.items()),
+            "}",
+            "",
+        ]
+    )
+
+
+def _load() -> dict[Entity, Decoder] | None:
+    """Заранее сгенерированные декодеры, если они соответствуют моделям."""
+
+    try:
+        from . import _decoders
+
+        if _decoders.FINGERPRINT == _fingerprint():
+            return {Entity(k): v for k, v in _decoders.DECODERS.items()}
+
+    except (ImportError, AttributeError, OSError) as e:
+        _LOGGER.debug("Pre-generated decoders are unavailable: %s", e)
+        return None
+
+    _LOGGER.debug("Pre-generated decoders are outdated")
+
+    return None
+
+
+def _compile() -> dict[Entity, Decoder]:
+    if (decoders := _load()) is not None:
+        return decoders
+
+    compiler = _Compiler()
+
+    names = {
+        entity: compiler.model(_response_model(cls))
+        for entity, cls in _RESPONSES.items()
+    }
+
+    namespace = compiler.build()
+
+    return {entity: namespace[name] for entity, name in names.items()}
+
+
+_DECODERS = _compile()
+
+
+def response_type(entity: Entity) -> type[ApiResponse]:
+    """Класс модели ответа сущности."""
+
+    return _RESPONSES[entity]
+
+
+def item_decoder(entity: Entity) -> Decoder:
+    """Декодер отдельной записи ответа сущности."""
+
+    return _DECODERS[entity]
+
+
+def decode_response(entity: Entity, json: dict[str, Any]) -> ApiResponse:
+    """
+    Декодирование ответа API.
+
+    Словарь `json` должен содержать поля `totalAmount`, `start`, `limit` и
+    список записей `result`.
+    """
+
+    decode = _DECODERS[entity]
+
+    return _RESPONSES[entity](
+        total=int(json["totalAmount"]),
+        start=int(json["start"]),
+        limit=int(json["limit"]),
+        result=[decode(x) for x in json["result"]],
+    )
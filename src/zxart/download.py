@@ -0,0 +1,384 @@
+"""
+Загрузка медиафайлов (`media_url`, `original_url`).
+
+Файлы сохраняются в хранилище с адресацией по содержимому:
+`objects/<первые два символа SHA-256>/<SHA-256><расширение>`. Соответствие URL
+и файлов хранится в манифесте SQLite. Незавершенные загрузки сохраняются в
+каталоге `partial` и продолжаются запросами `Range`.
+
+Операции с файлами и манифестом выполняются в потоках `asyncio.to_thread`,
+чтобы не блокировать цикл событий.
+"""
+
+import asyncio
+import dataclasses as dc
+import hashlib
+import mimetypes
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Literal,
+)
+
+import aiohttp
+import yarl
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+
+_CHUNK_SIZE = 64 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT
+)
+"""
+
+
+@dc.dataclass(slots=True)
+class DownloadStats:
+    """Счетчики загрузки"""
+
+    downloaded: int = 0
+    """Загружено файлов"""
+    skipped: int = 0
+    """Пропущено актуальных файлов"""
+    failed: int = 0
+    """Ошибок загрузки"""
+    bytes: int = 0
+    """Получено байт"""
+    started: float = dc.field(default_factory=time.monotonic)
+    """Время начала (`time.monotonic`)"""
+
+    @property
+    def throughput(self) -> float:
+        """Средняя скорость загрузки в байтах в секунду."""
+
+        return self.bytes / max(time.monotonic() - self.started, 1e-9)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class DownloadResult:
+    """Результат загрузки файла"""
+
+    url: str
+    """URL файла"""
+    status: Literal["downloaded", "skipped", "failed"]
+    """Результат"""
+    path: Path | None = None
+    """Путь к файлу в хранилище"""
+    size: int = 0
+    """Размер файла"""
+    error: BaseException | None = None
+    """Ошибка загрузки"""
+
+
+class Downloader:
+    """Параллельная загрузка медиафайлов в хранилище."""
+
+    _session: aiohttp.ClientSession
+    _root: Path
+    _concurrency: int
+    _revalidate: bool
+    _progress: Callable[[DownloadResult, DownloadStats], None] | None
+    _db: sqlite3.Connection
+    _lock: threading.Lock
+
+    stats: DownloadStats
+    """Счетчики загрузки"""
+
+    def __init__(
+        self,
+        client: "ZXArtClient",
+        root: str | os.PathLike[str],
+        *,
+        concurrency: int = 8,
+        revalidate: bool = False,
+        progress: Callable[[DownloadResult, DownloadStats], None] | None = None,
+    ) -> None:
+        """
+        Параметры:
+        - `client`: клиент API, сессия которого используется для загрузки.
+        - `root`: каталог хранилища.
+        - `concurrency`: количество одновременных загрузок.
+        - `revalidate`: проверка `ETag` и размера загруженных файлов запросом
+        `HEAD`. По-умолчанию: загруженные файлы пропускаются без проверки.
+        - `progress`: функция, вызываемая после обработки каждого файла.
+        """
+
+        self._session = client.session
+        self._root = Path(root)
+        self._concurrency = concurrency
+        self._revalidate = revalidate
+        self._progress = progress
+        self.stats = DownloadStats()
+
+        (self._root / "partial").mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            self._root / "manifest.sqlite", check_same_thread=False
+        )
+        # Манифест используется из нескольких потоков
+        self._lock = threading.Lock()
+        self._db.execute(_SCHEMA)
+
+    def close(self) -> None:
+        """Закрытие манифеста"""
+
+        self._db.close()
+
+    def path(self, url: str) -> Path | None:
+        """Путь к загруженному файлу по URL."""
+
+        sql = "SELECT path FROM files WHERE url = ?"
+
+        with self._lock:
+            x = self._db.execute(sql, (url,)).fetchone()
+
+        if x:
+            return self._root / x[0]
+
+    async def download_all(
+        self, urls: Iterable[str]
+    ) -> AsyncIterator[DownloadResult]:
+        """
+        Загрузка файлов. Результаты выдаются по мере завершения загрузок.
+        Повторяющиеся и пустые URL пропускаются.
+        """
+
+        pending = iter(dict.fromkeys(x for x in urls if x))
+        results: asyncio.Queue[DownloadResult | Exception | None] = (
+            asyncio.Queue()
+        )
+
+        async def worker() -> None:
+            try:
+                for url in pending:
+                    await results.put(await self.download(url))
+
+            except Exception as exc:
+                # Непредвиденная ошибка прерывает загрузку всех файлов
+                await results.put(exc)
+
+            finally:
+                await results.put(None)
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(self._concurrency)
+        ]
+
+        try:
+            active = len(workers)
+
+            while active:
+                if (x := await results.get()) is None:
+                    active -= 1
+
+                elif isinstance(x, Exception):
+                    raise x
+
+                else:
+                    yield x
+
+        finally:
+            for task in workers:
+                task.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def download(self, url: str) -> DownloadResult:
+        """
+        Загрузка файла. Ошибки сети и файловой системы возвращаются
+        результатом `failed`, прочие ошибки учитываются в счетчиках и
+        передаются вызывающему.
+        """
+
+        try:
+            result = await self._download(url)
+
+        except (aiohttp.ClientError, TimeoutError, OSError) as exc:
+            result = DownloadResult(url, "failed", error=exc)
+
+        except Exception as exc:
+            self._record(DownloadResult(url, "failed", error=exc))
+            raise
+
+        return self._record(result)
+
+    def _record(self, result: DownloadResult) -> DownloadResult:
+        """Учет результата в счетчиках и уведомление о прогрессе."""
+
+        stats = self.stats
+
+        match result.status:
+            case "downloaded":
+                stats.downloaded += 1
+            case "skipped":
+                stats.skipped += 1
+            case "failed":
+                stats.failed += 1
+
+        if self._progress is not None:
+            self._progress(result, stats)
+
+        return result
+
+    async def _download(self, url: str) -> DownloadResult:
+        if (row := await asyncio.to_thread(self._stored, url)) is not None:
+            path, size, etag = row
+
+            if not self._revalidate or await self._is_current(url, size, etag):
+                return DownloadResult(url, "skipped", path, size)
+
+        key = hashlib.sha1(url.encode()).hexdigest()
+        part = self._root / "partial" / f"{key}.part"
+        tag = self._root / "partial" / f"{key}.etag"
+
+        while True:
+            offset, validator = await asyncio.to_thread(_partial, part, tag)
+            headers = {}
+
+            if offset:
+                headers[aiohttp.hdrs.RANGE] = f"bytes={offset}-"
+
+                if validator:
+                    headers[aiohttp.hdrs.IF_RANGE] = validator
+
+            async with self._session.get(url, headers=headers) as x:
+                if x.status != 416 or not offset:
+                    x.raise_for_status()
+                    etag = x.headers.get(aiohttp.hdrs.ETAG)
+                    hasher = await self._receive(x, part, tag, etag)
+                    suffix = _suffix(url, x.content_type)
+                    break
+
+            # Частичный файл некорректен: повторная загрузка после
+            # освобождения ответа
+            await asyncio.to_thread(part.unlink)
+
+        path, size = await asyncio.to_thread(
+            self._commit, url, part, tag, hasher.hexdigest(), suffix, etag
+        )
+
+        return DownloadResult(url, "downloaded", path, size)
+
+    def _stored(self, url: str) -> tuple[Path, int, str | None] | None:
+        """Загруженный файл по манифесту, если он существует."""
+
+        sql = "SELECT path, size, etag FROM files WHERE url = ?"
+
+        with self._lock:
+            row = self._db.execute(sql, (url,)).fetchone()
+
+        if row:
+            path, size = self._root / row[0], row[1]
+
+            if path.is_file() and path.stat().st_size == size:
+                return path, size, row[2]
+
+    async def _receive(
+        self,
+        response: aiohttp.ClientResponse,
+        part: Path,
+        tag: Path,
+        etag: str | None,
+    ) -> "hashlib._Hash":
+        """Запись тела ответа в частичный файл. Возвращает хеш файла."""
+
+        hasher = hashlib.sha256()
+
+        if etag:
+            await asyncio.to_thread(tag.write_text, etag)
+
+        if response.status == 206:
+            await asyncio.to_thread(_update_hash, hasher, part)
+            mode = "ab"
+
+        else:
+            mode = "wb"
+
+        f = await asyncio.to_thread(part.open, mode)
+
+        try:
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                await asyncio.to_thread(_write, f, hasher, chunk)
+                self.stats.bytes += len(chunk)
+
+        finally:
+            await asyncio.to_thread(f.close)
+
+        return hasher
+
+    def _commit(
+        self,
+        url: str,
+        part: Path,
+        tag: Path,
+        digest: str,
+        suffix: str,
+        etag: str | None,
+    ) -> tuple[Path, int]:
+        """Перемещение файла в хранилище и запись в манифест."""
+
+        rel = Path("objects", digest[:2], digest + suffix)
+        path = self._root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(part, path)
+        tag.unlink(missing_ok=True)
+        size = path.stat().st_size
+
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                (url, digest, str(rel), size, etag),
+            )
+
+        return path, size
+
+    async def _is_current(self, url: str, size: int, etag: str | None) -> bool:
+        async with self._session.head(url, allow_redirects=True) as x:
+            if not x.ok:
+                return False
+
+            if etag and (y := x.headers.get(aiohttp.hdrs.ETAG)):
+                return y == etag
+
+            return x.content_length in (None, size)
+
+
+def _partial(part: Path, tag: Path) -> tuple[int, str | None]:
+    """Размер частичного файла и значение `ETag` для `If-Range`."""
+
+    if not part.is_file():
+        return 0, None
+
+    return part.stat().st_size, tag.read_text() if tag.is_file() else None
+
+
+def _write(f: BinaryIO, hasher: "hashlib._Hash", chunk: bytes) -> None:
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _update_hash(hasher: "hashlib._Hash", path: Path) -> None:
+    with path.open("rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            hasher.update(chunk)
+
+
+def _suffix(url: str, content_type: str) -> str:
+    if suffix := PurePosixPath(yarl.URL(url).path).suffix:
+        return suffix.lower()
+
+    return mimetypes.guess_extension(content_type) or ""
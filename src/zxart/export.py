@@ -0,0 +1,345 @@
+"""
+Потоковая выгрузка записей в файлы для аналитики.
+
+Поддерживаемые форматы: Parquet и Arrow IPC (требуется `pyarrow`), а также
+NDJSON без дополнительных зависимостей. Записи накапливаются группами по
+`row_group_size` и записываются по мере заполнения группы, поэтому выгрузка
+всего каталога выполняется в ограниченном объеме памяти. Колонки имеют
+типы полей моделей: длительность, десятичный рейтинг, дата и время, списки
+тегов и идентификаторов.
+"""
+
+import contextlib
+import dataclasses as dc
+import datetime as dt
+import os
+import typing
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal
+
+import orjson
+
+from .common import Entity
+from .decode import _RESPONSES, _response_model, _unwrap_optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+except ImportError:
+    pa = pq = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+
+type Format = Literal["parquet", "arrow", "ndjson"]
+"""Формат файла выгрузки"""
+
+_SUFFIXES: dict[str, Format] = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+_DECIMAL_PRECISION = 9
+_DECIMAL_SCALE = 2
+_QUANTUM = Decimal(1).scaleb(-_DECIMAL_SCALE)
+
+type _Converter = Callable[[list[Any]], list[Any]] | None
+
+
+def _base(tp: Any) -> Any:
+    """Тип без псевдонимов и аннотаций."""
+
+    while True:
+        if isinstance(tp, typing.TypeAliasType):
+            tp = tp.__value__
+
+        elif typing.get_origin(tp) is typing.Annotated:
+            tp = typing.get_args(tp)[0]
+
+        elif (x := _unwrap_optional(tp)[0]) is not tp:
+            tp = x
+
+        else:
+            return tp
+
+
+def _column(tp: Any) -> tuple["pa.DataType", _Converter]:
+    """Тип колонки Arrow и преобразование значений поля."""
+
+    tp = _base(tp)
+
+    if typing.get_origin(tp) is list:
+        item, convert = _column(typing.get_args(tp)[0])
+
+        if convert is not None:
+            return pa.list_(item), lambda xs: [
+                None if x is None else convert(x) for x in xs
+            ]
+
+        return pa.list_(item), None
+
+    if dc.is_dataclass(tp):
+        names = [x.name for x in dc.fields(tp)]
+        types = [_column(x.type)[0] for x in dc.fields(tp)]
+
+        return pa.struct(list(zip(names, types))), lambda xs: [
+            None if x is None else {k: getattr(x, k) for k in names} for x in xs
+        ]
+
+    if tp is Decimal:
+        return pa.decimal128(_DECIMAL_PRECISION, _DECIMAL_SCALE), lambda xs: [
+            None if x is None else x.quantize(_QUANTUM) for x in xs
+        ]
+
+    if tp is dt.datetime:
+        # Наивное локальное время моделей переводится в UTC
+        return pa.timestamp("s", tz="UTC"), lambda xs: [
+            None if x is None else int(x.timestamp()) for x in xs
+        ]
+
+    types = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        dt.date: pa.date32(),
+        dt.timedelta: pa.duration("ms"),
+    }
+
+    return types[tp], None
+
+
+def _model(entity: Entity) -> type:
+    return _response_model(_RESPONSES[entity])
+
+
+def schema(entity: Entity) -> "pa.Schema":
+    """Схема Arrow записей сущности."""
+
+    _require("arrow")
+    hints = typing.get_type_hints(_model(entity), include_extras=True)
+
+    return pa.schema(
+        (x.name, _column(hints[x.name])[0])
+        for x in dc.fields(_model(entity))
+        if x.init
+    )
+
+
+def _require(format: Format) -> None:
+    if pa is None and format != "ndjson":
+        raise ImportError(f"Format '{format}' requires pyarrow.")
+
+
+def _format(path: Path, format: Format | None) -> Format:
+    if format is not None:
+        return format
+
+    return _SUFFIXES.get(path.suffix, "parquet" if pa else "ndjson")
+
+
+def _default(x: Any) -> Any:
+    if isinstance(x, Decimal):
+        return str(x)
+
+    if isinstance(x, dt.timedelta):
+        return x.total_seconds()
+
+    raise TypeError
+
+
+class Exporter:
+    """Потоковая запись записей сущности в файл."""
+
+    _path: Path
+    _entity: Entity
+    _format: Format
+    _row_group_size: int
+    _buffer: list[Any]
+    _writer: Any
+    _columns: list[tuple[str, _Converter]]
+
+    rows: int
+    """Записано строк"""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        entity: Entity,
+        *,
+        format: Format | None = None,
+        row_group_size: int = 10_000,
+        compression: str | None = None,
+    ) -> None:
+        """
+        Параметры:
+        - `path`: путь к файлу.
+        - `entity`: сущность записей.
+        - `format`: формат. По-умолчанию: по расширению файла.
+        - `row_group_size`: количество записей в группе строк.
+        - `compression`: сжатие Parquet и Arrow IPC. По-умолчанию: `zstd` для
+        Parquet, без сжатия для Arrow IPC, чтобы файл читался отображением в
+        память без копирования.
+        """
+
+        self._path = Path(path)
+        self._entity = entity
+        self._format = _format(self._path, format)
+        self._row_group_size = row_group_size
+        self._buffer = []
+        self.rows = 0
+
+        _require(self._format)
+
+        match self._format:
+            case "ndjson":
+                self._writer = self._path.open("wb")
+                return
+
+            case "parquet":
+                s = schema(entity)
+                self._writer = pq.ParquetWriter(
+                    self._path, s, compression=compression or "zstd"
+                )
+
+            case "arrow":
+                s = schema(entity)
+                options = pa.ipc.IpcWriteOptions(compression=compression)
+                self._writer = pa.ipc.new_file(self._path, s, options=options)
+
+        hints = typing.get_type_hints(_model(entity), include_extras=True)
+        self._columns = [(x, _column(hints[x])[1]) for x in s.names]
+        self._schema = s
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write(self, items: Iterable[Any]) -> None:
+        """Добавление записей. Запись в файл выполняется группами строк."""
+
+        for x in items:
+            self._buffer.append(x)
+
+            if len(self._buffer) >= self._row_group_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Запись накопленных записей."""
+
+        if not (rows := self._buffer):
+            return
+
+        self._buffer = []
+        self.rows += len(rows)
+
+        if self._format == "ndjson":
+            self._writer.write(
+                b"".join(
+                    orjson.dumps(
+                        _materialize(x),
+                        default=_default,
+                        option=orjson.OPT_APPEND_NEWLINE,
+                    )
+                    for x in rows
+                )
+            )
+            return
+
+        arrays = []
+
+        for name, convert in self._columns:
+            values = [getattr(x, name) for x in rows]
+
+            if convert is not None:
+                values = convert(values)
+
+            arrays.append(values)
+
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(x, type=f.type)
+                for x, f in zip(arrays, self._schema, strict=True)
+            ],
+            schema=self._schema,
+        )
+
+        # Каждый пакет записывается отдельной группой строк
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        """Запись остатка и закрытие файла."""
+
+        self.flush()
+        self._writer.close()
+
+
+def _materialize(x: Any) -> Any:
+    # Ленивые представления сериализуются полной моделью
+    return x.materialize() if hasattr(x, "materialize") else x
+
+
+async def export(
+    client: "ZXArtClient",
+    entity: Entity,
+    path: str | os.PathLike[str],
+    *,
+    format: Format | None = None,
+    row_group_size: int = 10_000,
+    concurrency: int = 4,
+    **kwargs: Any,
+) -> int:
+    """
+    Выгрузка всех записей выборки в файл. Возвращает количество записей.
+
+    Параметры:
+    - `client`: клиент API.
+    - `entity`: сущность.
+    - `path`: путь к файлу.
+    - `format`: формат. По-умолчанию: по расширению файла.
+    - `row_group_size`: количество записей в группе строк.
+    - `concurrency`: количество одновременных запросов страниц.
+    - `kwargs`: параметры запроса, как в методе `api`.
+    """
+
+    with Exporter(
+        path, entity, format=format, row_group_size=row_group_size
+    ) as out:
+        async with contextlib.aclosing(
+            client.iter_all(entity, concurrency=concurrency, **kwargs)
+        ) as it:
+            async for x in it:
+                out.write((x,))
+
+    return out.rows
+
+
+def open_table(path: str | os.PathLike[str]) -> "pa.Table":
+    """
+    Чтение файла Parquet или Arrow IPC. Файл Arrow IPC отображается в память,
+    колонки несжатого файла ссылаются на отображение без копирования данных.
+    Сжатые файлы Arrow IPC и файлы Parquet распаковываются в память.
+    """
+
+    _require("arrow")
+    path = Path(path)
+
+    if _format(path, None) == "arrow":
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+    return pq.read_table(path, memory_map=True)
+
+
+def read_ndjson(path: str | os.PathLike[str]) -> Iterator[dict[str, Any]]:
+    """Чтение записей файла NDJSON."""
+
+    with Path(path).open("rb") as f:
+        for line in f:
+            yield orjson.loads(line)
@@ -0,0 +1,192 @@
+"""
+Подсчет записей по значениям фильтров без загрузки самих записей.
+
+Для каждого значения фасета выполняется запрос с `limit=1`, количество
+записей берется из `ApiResponse.total`. Запросы выполняются параллельно с
+ограничением количества одновременных запросов, результаты кэшируются на
+время `ttl`. Для перекрестных таблиц сначала подсчитываются значения каждого
+фасета, сочетания с нулевым значением хотя бы одного фасета не запрашиваются.
+"""
+
+import asyncio
+import collections
+import datetime as dt
+import itertools
+import time
+import typing
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from .common import Entity
+from .image import ImageFormatGroup, ImageType
+from .query import Query
+from .tune import TuneFormat, TuneFormatGroup
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+
+_FIRST_YEAR = 1982
+"""Год выпуска ZX Spectrum: начало диапазона фасета `years` по-умолчанию"""
+
+_CACHE_SIZE = 4096
+"""Количество результатов в кэше `FacetCounter`"""
+
+_VALUES: dict[tuple[Entity, str], tuple[Any, ...]] = {
+    (Entity.TUNE, "format"): typing.get_args(TuneFormat),
+    (Entity.TUNE, "format_group"): typing.get_args(TuneFormatGroup),
+    (Entity.IMAGE, "type"): typing.get_args(ImageType),
+    (Entity.IMAGE, "format_group"): typing.get_args(ImageFormatGroup),
+}
+"""Значения фасетов по-умолчанию"""
+
+
+def facet_values(entity: Entity, facet: str) -> tuple[Any, ...]:
+    """
+    Значения фасета по-умолчанию: форматы мелодий, типы экранов изображений
+    и группы форматов из `tune.py` и `image.py`, годы с 1982 года по текущий.
+    Для прочих фасетов значения должны быть заданы явно.
+    """
+
+    if facet == "years":
+        return tuple(range(_FIRST_YEAR, dt.date.today().year + 1))
+
+    try:
+        return _VALUES[entity, facet]
+
+    except KeyError:
+        raise ValueError(
+            f"Facet '{facet}' of {entity} requires explicit values."
+        ) from None
+
+
+class FacetCounter:
+    """Подсчет записей по значениям фасетов с кэшированием результатов."""
+
+    _client: "ZXArtClient"
+    _ttl: float
+    _semaphore: asyncio.Semaphore
+    _cache: collections.OrderedDict[Query, tuple[float, int]]
+
+    probes: int
+    """Выполнено запросов количества"""
+
+    def __init__(
+        self,
+        client: "ZXArtClient",
+        *,
+        ttl: float = 300.0,
+        concurrency: int = 8,
+    ) -> None:
+        """
+        Параметры:
+        - `client`: клиент API.
+        - `ttl`: время актуальности результатов в секундах.
+        - `concurrency`: количество одновременных запросов.
+        """
+
+        self._client = client
+        self._ttl = ttl
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache = collections.OrderedDict()
+        self.probes = 0
+
+    def clear(self) -> None:
+        """Очистка кэша результатов."""
+
+        self._cache.clear()
+
+    async def count(self, entity: Entity, **filters: Any) -> int:
+        """
+        Количество записей выборки.
+
+        Параметры:
+        - `entity`: сущность.
+        - `filters`: фильтры запроса, как в методе `api`.
+        """
+
+        query = self._client.compile(entity, **filters)
+        now = time.monotonic()
+
+        if (x := self._cache.get(query)) is not None and x[0] > now:
+            self._cache.move_to_end(query)
+            return x[1]
+
+        async with self._semaphore:
+            total = (await self._client.run(query, limit=1)).total
+
+        self.probes += 1
+        self._cache[query] = time.monotonic() + self._ttl, total
+        self._cache.move_to_end(query)
+
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        return total
+
+    async def histogram(
+        self,
+        entity: Entity,
+        facet: str,
+        values: Iterable[Any] | None = None,
+        **filters: Any,
+    ) -> dict[Any, int]:
+        """
+        Количество записей по значениям фасета.
+
+        Параметры:
+        - `entity`: сущность.
+        - `facet`: имя фильтра, например `years`, `format`, `tags_include`.
+        - `values`: значения фасета. По-умолчанию: `facet_values`.
+        - `filters`: общие фильтры запроса, как в методе `api`.
+        """
+
+        if values is None:
+            values = facet_values(entity, facet)
+
+        values = tuple(values)
+        counts = await asyncio.gather(
+            *(self.count(entity, **filters | {facet: x}) for x in values)
+        )
+
+        return dict(zip(values, counts))
+
+    async def crosstab(
+        self,
+        entity: Entity,
+        facets: Mapping[str, Iterable[Any] | None],
+        **filters: Any,
+    ) -> dict[tuple[Any, ...], int]:
+        """
+        Количество записей по сочетаниям значений фасетов. Ключи содержат
+        значения в порядке фасетов, нулевые сочетания в результат не входят.
+
+        Параметры:
+        - `entity`: сущность.
+        - `facets`: имена фильтров и их значения. Значение `None`: значения
+        по-умолчанию `facet_values`.
+        - `filters`: общие фильтры запроса, как в методе `api`.
+        """
+
+        names = tuple(facets)
+        margins = await asyncio.gather(
+            *(
+                self.histogram(entity, name, values, **filters)
+                for name, values in facets.items()
+            )
+        )
+
+        if len(names) == 1:
+            return {(k,): v for k, v in margins[0].items() if v}
+
+        keys = list(
+            itertools.product(
+                *([k for k, v in x.items() if v] for x in margins)
+            )
+        )
+        counts = await asyncio.gather(
+            *(
+                self.count(entity, **filters | dict(zip(names, key)))
+                for key in keys
+            )
+        )
+
+        return {k: v for k, v in zip(keys, counts) if v}
@@ -0,0 +1,182 @@
+"""
+Раскрытие графа авторов.
+
+Для набора авторов параллельно запрашиваются их псевдонимы, мелодии и
+изображения, на следующих уровнях — соавторы найденных работ. Все запросы
+уровня выполняются одновременно, поэтому количество последовательных
+обращений к серверу определяется глубиной, а не количеством авторов.
+Результаты выдаются по мере получения.
+"""
+
+import asyncio
+import dataclasses as dc
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Literal
+
+from .common import Entity
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+    from .models import Author, AuthorAlias, Image, Tune
+
+type Relation = Literal["author", "alias", "tune", "image"]
+"""Вид связи автора с записью"""
+
+_MEDIA: dict[Relation, Entity] = {"tune": Entity.TUNE, "image": Entity.IMAGE}
+
+_RELATIONS: tuple[Relation, ...] = ("alias", "tune", "image")
+
+
+@dc.dataclass(frozen=True, slots=True)
+class Edge:
+    """Связь автора с записью"""
+
+    author_id: int
+    """Идентификатор автора"""
+    relation: Relation
+    """Вид связи"""
+    item: Any
+    """Запись (`Author`, `AuthorAlias`, `Tune` или `Image`)"""
+    depth: int
+    """Уровень раскрытия, начиная с нуля"""
+
+
+@dc.dataclass(slots=True)
+class AuthorProfile:
+    """Автор со связанными записями"""
+
+    author: "Author | None" = None
+    """Автор"""
+    aliases: "list[AuthorAlias]" = dc.field(default_factory=list)
+    """Псевдонимы"""
+    tunes: "list[Tune]" = dc.field(default_factory=list)
+    """Мелодии"""
+    images: "list[Image]" = dc.field(default_factory=list)
+    """Изображения"""
+
+
+async def expand(
+    client: "ZXArtClient",
+    author_ids: Iterable[int],
+    *,
+    depth: int = 1,
+    relations: Iterable[Relation] = _RELATIONS,
+    concurrency: int = 8,
+) -> AsyncIterator[Edge]:
+    """
+    Раскрытие графа авторов с выдачей связей по мере получения.
+
+    Каждая запись выдается для каждого связанного автора одним и тем же
+    объектом, авторы — однократно.
+
+    Параметры:
+    - `client`: клиент API.
+    - `author_ids`: идентификаторы исходных авторов.
+    - `depth`: количество уровней. На втором и следующих уровнях
+    раскрываются соавторы работ предыдущего уровня.
+    - `relations`: раскрываемые связи: `alias`, `tune`, `image`.
+    - `concurrency`: количество одновременных запросов.
+    """
+
+    relations = frozenset(relations)
+    sem = asyncio.Semaphore(concurrency)
+    # Карта идентичности записей всех уровней
+    known: dict[tuple[Entity, int], Any] = {}
+    visited: set[int] = set()
+    level = set(author_ids)
+
+    async def authors(ids: list[int], d: int) -> list[Edge]:
+        async with sem:
+            found = await client.authors(ids)
+
+        edges = [Edge(x.id, "author", x, d) for x in found.values()]
+        alias_ids = {
+            y: x.id
+            for x in found.values()
+            if "alias" in relations
+            for y in x.aliases or ()
+        }
+
+        if alias_ids:
+            async with sem:
+                aliases = await client.aliases(alias_ids)
+
+            edges += (
+                Edge(alias_ids[x.id], "alias", x, d) for x in aliases.values()
+            )
+
+        return edges
+
+    async def media(relation: Relation, author_id: int, d: int) -> list[Edge]:
+        entity = _MEDIA[relation]
+
+        async with sem:
+            items = await client.fetch_all(entity, author_id=author_id)
+
+        return [
+            Edge(author_id, relation, known.setdefault((entity, x.id), x), d)
+            for x in items
+        ]
+
+    for d in range(depth):
+        ids = sorted(level - visited)
+
+        if not ids:
+            return
+
+        visited.update(ids)
+        tasks = [asyncio.create_task(authors(ids, d))]
+        tasks += (
+            asyncio.create_task(media(relation, id, d))
+            for relation in _MEDIA
+            if relation in relations
+            for id in ids
+        )
+        level = set()
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                for edge in await task:
+                    if edge.relation in _MEDIA:
+                        level.update(edge.item.author_ids)
+
+                    yield edge
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def profiles(
+    client: "ZXArtClient",
+    author_ids: Iterable[int],
+    *,
+    relations: Iterable[Relation] = _RELATIONS,
+    concurrency: int = 8,
+) -> dict[int, AuthorProfile]:
+    """
+    Профили авторов: автор, псевдонимы, мелодии и изображения. Параметры
+    аналогичны функции `expand`.
+    """
+
+    author_ids = set(author_ids)
+    result = {x: AuthorProfile() for x in author_ids}
+
+    async for x in expand(
+        client, author_ids, relations=relations, concurrency=concurrency
+    ):
+        if (profile := result.get(x.author_id)) is None:
+            continue
+
+        match x.relation:
+            case "author":
+                profile.author = x.item
+            case "alias":
+                profile.aliases.append(x.item)
+            case "tune":
+                profile.tunes.append(x.item)
+            case "image":
+                profile.images.append(x.item)
+
+    return result
@@ -45,6 +45,40 @@ ImageFormat = Literal[
 ]
 
 
+ImageType = Literal[
+    "standard",
+    "monochrome",
+    "flash",
+    "attributes",
+    "gigascreen",
+    "tricolor",
+    "mg1",
+    "mg2",
+    "mg4",
+    "mg8",
+    "multicolor",
+    "multicolor4",
+    "multiartist",
+    "timex81",
+    "timexhr",
+    "timexhrg",
+    "ulaplus",
+    "sam4",
+    "bsc",
+    "bmc4",
+    "chr$",
+    "lowresgs",
+    "stellar",
+    "zxevo",
+    "sxg",
+    "nxi",
+    "sca",
+    "ssx",
+    "bsp",
+]
+"""Типы экранов изображений (поле `type`)"""
+
+
 ImageFormatGroup = Literal[
     "ay",
     "beeper",
@@ -62,5 +96,5 @@ ImageFormatGroup = Literal[
 
 
 class ImageParams(MediaParams, total=False):
-    type: ImageFormat
+    type: ImageType
     format_group: ImageFormatGroup
@@ -0,0 +1,146 @@
+"""
+Ленивые представления записей.
+
+Представление хранит исходный словарь записи ответа и преобразует поле только
+при первом обращении к нему, запоминая результат. Преобразования те же, что и
+в декодерах `zxart.decode`. Полная модель создается методом `materialize`.
+Подходит для списков, из которых читается лишь несколько полей записей.
+"""
+
+import dataclasses as dc
+import typing
+from typing import Any
+
+from .common import Entity
+from .decode import _RESPONSES, _Compiler, _response_model, _unwrap_optional
+from .models import ApiResponse
+
+
+class LazyView:
+    """Базовый класс ленивого представления записи."""
+
+    __slots__ = ("_d",)
+
+    _model: typing.ClassVar[type]
+    """Класс модели"""
+    _fields: typing.ClassVar[tuple[str, ...]]
+    """Поля модели"""
+
+    def __init__(self, d: dict[str, Any]) -> None:
+        self._d = d
+
+    def materialize(self) -> Any:
+        """Полная модель записи. Уже преобразованные поля не вычисляются."""
+
+        return self._model(**{x: getattr(self, x) for x in self._fields})
+
+    def __reduce__(self):
+        # Сериализуется полная модель
+        return _identity, (self.materialize(),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self._d.get('id')!r})"
+
+
+def _identity(x: Any) -> Any:
+    return x
+
+
+def _generate(compiler: _Compiler, cls: type) -> str:
+    """Генерация класса представления модели. Возвращает имя класса."""
+
+    name = f"{cls.__name__}View"
+    config = getattr(cls, "Config", None)
+    aliases = getattr(config, "aliases", {})
+    strategies = getattr(config, "serialization_strategy", {})
+    hints = typing.get_type_hints(cls, include_extras=True)
+
+    fields = [x for x in dc.fields(cls) if x.init]
+    # Методы генерируются вне тела класса: в нем имена вида `__x` искажаются
+    methods, memo, body = [], [], []
+
+    for field in fields:
+        key = aliases.get(field.name, field.name)
+        tp, _ = _unwrap_optional(hints[field.name])
+        expr = compiler.convert("v", tp, strategies)
+        default = compiler.default(field)
+        method = f"{name}_{field.name}"
+        methods.append(f"    {field.name} = property({method})")
+        body.append(f"def {method}(self):")
+
+        if expr == "v" and default == "None":
+            # Поле без преобразования не требует запоминания
+            body.append(f"    return self._d.get({key!r})")
+            continue
+
+        slot = f"_{field.name}"
+        memo.append(slot)
+        body += [
+            "    try:",
+            f"        return self.{slot}",
+            "    except AttributeError:",
+            f"        v = self._d.get({key!r})",
+            f"        x = {default} if v is None else {expr}",
+            f"        self.{slot} = x",
+            "        return x",
+        ]
+
+    body += [
+        f"class {name}({compiler.ref(LazyView)}):",
+        f"    __slots__ = {tuple(memo)!r}",
+        f"    _model = {compiler.ref(cls)}",
+        f"    _fields = {tuple(x.name for x in fields)!r}",
+        *methods,
+    ]
+
+    if hasattr(cls, "__pre_deserialize__"):
+        body += [
+            "    def __init__(self, d):",
+            f"        self._d = {compiler.ref(cls)}.__pre_deserialize__(d)",
+        ]
+
+    compiler.lines.extend(body)
+    compiler.lines.append("")
+
+    return name
+
+
+def _compile() -> dict[Entity, type[LazyView]]:
+    compiler = _Compiler()
+
+    names = {
+        entity: _generate(compiler, _response_model(cls))
+        for entity, cls in _RESPONSES.items()
+    }
+
+    namespace = compiler.build()
+
+    for x in names.values():
+        namespace[x].__module__ = __name__
+
+    return {entity: namespace[name] for entity, name in names.items()}
+
+
+_VIEWS = _compile()
+
+
+def view_type(entity: Entity) -> type[LazyView]:
+    """Класс ленивого представления записи сущности."""
+
+    return _VIEWS[entity]
+
+
+def decode_views(entity: Entity, json: dict[str, Any]) -> ApiResponse:
+    """
+    Декодирование ответа API с ленивыми представлениями записей. Параметры
+    аналогичны функции `decode.decode_response`.
+    """
+
+    view = _VIEWS[entity]
+
+    return _RESPONSES[entity](
+        total=int(json["totalAmount"]),
+        start=int(json["start"]),
+        limit=int(json["limit"]),
+        result=[view(x) for x in json["result"]],
+    )
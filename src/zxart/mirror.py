@@ -0,0 +1,443 @@
+"""
+Локальное зеркало каталога на SQLite.
+
+Зеркало наполняется декодированными записями (например, синхронизацией
+`zxart.sync.sync`, для которой оно является приемником) и отвечает на запросы
+с теми же фильтрами и сортировками, что и API, возвращая идентичные модели
+ответа. Запросы, которые зеркало обработать не может, вызывают `LookupError`.
+
+Записи хранятся в формате JSON ответа API и декодируются теми же декодерами,
+что и ответы сервера. Зеркало отвечает на запросы сущности только после
+завершения ее полного обхода на языке запроса.
+"""
+
+import dataclasses as dc
+import datetime as dt
+import functools
+import html
+import sqlite3
+import time
+import typing
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+import orjson
+
+from .common import Entity, Language, Order, OrderSettings
+from .decode import _unwrap_optional, decode_response
+from .models import ApiResponse, HtmlStr, UrlStr
+
+_VERSION = 2
+"""Версия схемы базы данных"""
+
+_DROP = """
+DROP TABLE IF EXISTS entities;
+DROP TABLE IF EXISTS crawls;
+DROP TABLE IF EXISTS items;
+DROP TABLE IF EXISTS item_authors;
+DROP TABLE IF EXISTS item_tags;
+"""
+
+_SCHEMA = f"""
+PRAGMA user_version = {_VERSION};
+CREATE TABLE IF NOT EXISTS crawls (
+    entity TEXT PRIMARY KEY,
+    language TEXT NOT NULL,
+    completed REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    entity TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    title TEXT,
+    title_internal TEXT,
+    year INTEGER,
+    rating REAL,
+    party_place INTEGER,
+    plays INTEGER,
+    created REAL,
+    modified REAL,
+    type TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (entity, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_authors (
+    entity TEXT NOT NULL,
+    author_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (entity, author_id, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_tags (
+    entity TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (entity, tag, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_year ON items (entity, year);
+CREATE INDEX IF NOT EXISTS items_rating ON items (entity, rating);
+CREATE INDEX IF NOT EXISTS items_party_place ON items (entity, party_place);
+CREATE INDEX IF NOT EXISTS items_plays ON items (entity, plays);
+CREATE INDEX IF NOT EXISTS items_created ON items (entity, created);
+CREATE INDEX IF NOT EXISTS items_title ON items (entity, title);
+CREATE INDEX IF NOT EXISTS items_type ON items (entity, type);
+"""
+
+_ORDER_COLUMNS = {
+    "year": "year",
+    "plays": "plays",
+    "title": "title",
+    "place": "party_place",
+    "date": "created",
+    "votes": "rating",
+}
+"""Колонки полей сортировки API"""
+
+_COLUMNS = (
+    "title",
+    "title_internal",
+    "year",
+    "rating",
+    "party_place",
+    "plays",
+    "created",
+    "modified",
+    "type",
+)
+
+
+def _iterable(value: Any) -> list[Any]:
+    if isinstance(value, str) or not isinstance(value, Iterable):
+        return [value]
+
+    return list(value)
+
+
+def _timestamp(x: Any) -> float | None:
+    return None if x is None else x.timestamp()
+
+
+def _escape(value: str) -> str:
+    if "&" not in value and "<" not in value:
+        return value
+
+    return html.escape(value, quote=False)
+
+
+def _quote(value: str) -> str:
+    return value.replace("%", "%25")
+
+
+def _date(value: dt.date) -> str:
+    return f"{value.day:02}.{value.month:02}.{value.year}"
+
+
+def _duration(value: dt.timedelta) -> str:
+    return str(value.total_seconds())
+
+
+_ENCODERS: dict[Any, Callable[[Any], Any]] = {
+    dt.datetime: dt.datetime.timestamp,
+    dt.date: _date,
+    dt.timedelta: _duration,
+    Decimal: str,
+    HtmlStr: _escape,
+    UrlStr: _quote,
+}
+"""Преобразования значений в формат API, обратные стратегиям моделей"""
+
+
+def _encoder(
+    tp: Any, strategies: dict[Any, Any]
+) -> Callable[[Any], Any] | None:
+    """
+    Преобразование значения типа `tp` в формат API. `None`: не требуется.
+    Как и в декодере, стратегии применяются только заданные в модели.
+    """
+
+    if (tp in strategies or tp is Decimal) and (
+        x := _ENCODERS.get(tp)
+    ) is not None:
+        return x
+
+    if isinstance(tp, typing.TypeAliasType):
+        return _encoder(tp.__value__, strategies)
+
+    if typing.get_origin(tp) is typing.Annotated:
+        return _encoder(typing.get_args(tp)[0], strategies)
+
+    if typing.get_origin(tp) is list:
+        if (item := _encoder(typing.get_args(tp)[0], strategies)) is None:
+            return None
+
+        return lambda x: [item(v) for v in x]
+
+    if dc.is_dataclass(tp):
+        return _model_encoder(tp)  # type: ignore[arg-type]
+
+    return None
+
+
+@functools.cache
+def _model_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Преобразование модели в запись ответа API, обратное декодеру."""
+
+    config = getattr(cls, "Config", None)
+    aliases = getattr(config, "aliases", {})
+    strategies = getattr(config, "serialization_strategy", {})
+    hints = typing.get_type_hints(cls, include_extras=True)
+    fields = [
+        (
+            x.name,
+            aliases.get(x.name, x.name),
+            _encoder(_unwrap_optional(hints[x.name])[0], strategies),
+        )
+        for x in dc.fields(cls)
+        if x.init
+    ]
+
+    def encode(item: Any) -> dict[str, Any]:
+        json = {}
+
+        for name, key, convert in fields:
+            if (v := getattr(item, name)) is not None:
+                json[key] = v if convert is None else convert(v)
+
+        return json
+
+    return encode
+
+
+class Mirror:
+    """Локальное зеркало каталога"""
+
+    _db: sqlite3.Connection
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Параметры:
+        - `path`: путь к файлу базы данных. По-умолчанию: база в памяти.
+        """
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _VERSION:
+            # Записи прежнего формата не переносятся: зеркало наполняется заново
+            self._db.executescript(_DROP)
+
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Закрытие"""
+
+        self._db.close()
+
+    def __contains__(self, entity: Entity) -> bool:
+        """Завершение полного обхода сущности."""
+
+        return self.language(entity) is not None
+
+    def language(self, entity: Entity) -> Language | None:
+        """Язык завершенного полного обхода сущности."""
+
+        sql = "SELECT language FROM crawls WHERE entity = ?"
+
+        if (x := self._db.execute(sql, (entity,)).fetchone()) is not None:
+            return Language(x[0])
+
+    def mark_complete(self, entity: Entity, language: Language) -> None:
+        """
+        Отметка завершения полного обхода сущности. До отметки зеркало не
+        отвечает на запросы сущности.
+        """
+
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO crawls VALUES (?, ?, ?)",
+                (entity, language, time.time()),
+            )
+
+    def add(self, entity: Entity, items: Iterable[Any]) -> None:
+        """Добавление или обновление записей."""
+
+        rows, authors, tags = [], [], []
+
+        for x in items:
+            values = (getattr(x, k, None) for k in _COLUMNS)
+            data = orjson.dumps(_model_encoder(type(x))(x))
+            row = [entity, x.id, *values, data]
+            row[8] = _timestamp(row[8])
+            row[9] = _timestamp(row[9])
+            row[5] = None if row[5] is None else float(row[5])
+            rows.append(row)
+
+            ids = getattr(x, "author_ids", None)
+
+            if ids is None and (id := getattr(x, "author_id", None)):
+                ids = [id]
+
+            authors.extend((entity, a, x.id) for a in ids or ())
+            tags.extend((entity, t, x.id) for t in getattr(x, "tags", ()) or ())
+
+        ids = [(entity, row[1]) for row in rows]
+
+        with self._db:
+            db = self._db
+            db.executemany(
+                "DELETE FROM item_authors WHERE entity = ? AND id = ?", ids
+            )
+            db.executemany(
+                "DELETE FROM item_tags WHERE entity = ? AND id = ?", ids
+            )
+            db.executemany(
+                f"INSERT OR REPLACE INTO items VALUES ({', '.join('?' * 12)})",
+                rows,
+            )
+            db.executemany(
+                "INSERT OR IGNORE INTO item_authors VALUES (?, ?, ?)", authors
+            )
+            db.executemany(
+                "INSERT OR IGNORE INTO item_tags VALUES (?, ?, ?)", tags
+            )
+
+    async def upsert(self, entity: Entity, items: list[Any]) -> None:
+        """Приемник синхронизации `zxart.sync.sync`."""
+
+        self.add(entity, items)
+
+    async def complete(self, entity: Entity, language: Language) -> None:
+        """Завершение полного обхода синхронизацией `zxart.sync.sync`."""
+
+        self.mark_complete(entity, language)
+
+    def query(
+        self,
+        entity: Entity,
+        *,
+        limit: int,
+        order: Order | OrderSettings,
+        start: int = 0,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        """
+        Запрос записей с фильтрами и сортировкой API.
+
+        Вызывает `LookupError`, если полный обход сущности не завершен, язык
+        обхода отличается от языка запроса или фильтр либо сортировка не
+        поддерживаются.
+        """
+
+        json = self.select(
+            entity, limit=limit, order=order, start=start, **kwargs
+        )
+
+        return decode_response(entity, json)
+
+    def select(
+        self,
+        entity: Entity,
+        *,
+        limit: int,
+        order: Order | OrderSettings,
+        start: int = 0,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Запрос записей в формате ответа API без декодирования моделей.
+        Параметры и исключения аналогичны методу `query`.
+        """
+
+        if (language := self.language(entity)) is None:
+            raise LookupError(f"Entity {entity} is not mirrored.")
+
+        where, params = ["i.entity = ?"], [entity]
+
+        def exists(table: str, column: str, values: list[Any]) -> str:
+            params.extend(values)
+            marks = ", ".join("?" * len(values))
+
+            return (
+                f"EXISTS (SELECT 1 FROM {table} x WHERE x.entity = i.entity "
+                f"AND x.id = i.id AND x.{column} IN ({marks}))"
+            )
+
+        for k, v in kwargs.items():
+            match k:
+                case "language":
+                    if v != language:
+                        raise LookupError(f"Mirror language is {language}.")
+
+                case "id" | "years":
+                    values = _iterable(v)
+                    column = "id" if k == "id" else "year"
+                    where.append(
+                        f"i.{column} IN ({', '.join('?' * len(values))})"
+                    )
+                    params.extend(values)
+
+                case "author_id":
+                    where.append(exists("item_authors", "author_id", [v]))
+
+                case "title":
+                    where.append(
+                        "(i.title LIKE ? ESCAPE '\\' "
+                        "OR i.title_internal LIKE ? ESCAPE '\\')"
+                    )
+                    x = v.replace("\\", "\\\\").replace("%", "\\%")
+                    x = "%" + x.replace("_", "\\_") + "%"
+                    params.extend((x, x))
+
+                case "min_rating":
+                    where.append("i.rating >= ?")
+                    params.append(v)
+
+                case "min_party_place":
+                    where.append("i.party_place BETWEEN 1 AND ?")
+                    params.append(v)
+
+                case "tags_include":
+                    for tag in _iterable(v):
+                        where.append(exists("item_tags", "tag", [tag]))
+
+                case "tags_exclude":
+                    where.append(
+                        "NOT " + exists("item_tags", "tag", _iterable(v))
+                    )
+
+                case "format":
+                    where.append("i.type = ?")
+                    params.append(v)
+
+                case _:
+                    raise LookupError(f"Unsupported mirror filter: {k}.")
+
+        settings = order.value if isinstance(order, Order) else order
+
+        if (column := _ORDER_COLUMNS.get(settings.field)) is None:
+            raise LookupError(f"Unsupported mirror order: {settings.field}.")
+
+        if settings.order == "rand":
+            order_by = "random()"
+
+        else:
+            d = settings.order.upper()
+            order_by = f"i.{column} IS NULL, i.{column} {d}, i.id {d}"
+
+        sql_where = " AND ".join(where)
+        db = self._db
+
+        (total,) = db.execute(
+            f"SELECT COUNT(*) FROM items i WHERE {sql_where}", params
+        ).fetchone()
+
+        rows = db.execute(
+            f"SELECT data FROM items i WHERE {sql_where} "
+            f"ORDER BY {order_by} LIMIT ? OFFSET ?",
+            (*params, limit, start),
+        )
+
+        return {
+            "totalAmount": total,
+            "start": start,
+            "limit": limit,
+            "result": [orjson.loads(x) for (x,) in rows],
+            "entity": entity,
+        }
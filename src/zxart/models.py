@@ -2,6 +2,7 @@ import dataclasses as dc
 import datetime as dt
 import html
 import re
+import sys
 from decimal import Decimal
 from typing import Annotated, Any
 from urllib.parse import unquote
@@ -20,25 +21,37 @@ type HtmlStr = Annotated[str, "HtmlStr"]
 type UrlStr = Annotated[str, "UrlStr"]
 """Строка с экранированными символами URL"""
 
+type InternStr = Annotated[str, "InternStr"]
+"""Часто повторяющаяся строка (теги, типы, страны)"""
+
 
 def _unescape(value: str) -> str:
+    # Быстрый путь: строка без сущностей HTML и форматирования
+    if "&" not in value and "<pre>" not in value:
+        return value
     value = html.unescape(value)
     if m := _RE_DESCRIPTION.fullmatch(value):
         return m.group(1)
     return value
 
 
+def _unquote(value: str) -> str:
+    return unquote(value) if "%" in value else value
+
+
 def _duration(value: str) -> dt.timedelta:
-    m = map(float, reversed(value.split(":")))
-    s = sum(x * k for x, k in zip(m, [1, 60, 3600]))
+    s = 0.0
+    for x in value.split(":")[-3:]:
+        s = s * 60 + float(x)
     return dt.timedelta(seconds=s)
 
 
 def _date(value: str) -> dt.date:
-    return dt.datetime.strptime(value, "%d.%m.%Y").date()
+    d, m, y = value.split(".")
+    return dt.date(int(y), int(m), int(d))
 
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class ProductCategory:
     """Категория"""
 
@@ -48,7 +61,7 @@ class ProductCategory:
     """Название"""
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class EntityBase:
     """Базовый класс сущности API"""
 
@@ -67,11 +80,18 @@ class EntityBase:
         aliases = {
             "author_id": "authorId",
             "author_ids": "authorIds",
+            "category_ids": "categoryIds",
             "created": "dateCreated",
             "duration": "time",
             "end_date": "endDate",
             "filename": "originalFileName",
+            "group_id": "groupId",
+            "group_ids": "groupIds",
+            "hardware": "hardwareRequired",
+            "image_urls": "imagesUrls",
             "import_ids": "importIds",
+            "languages": "language",
+            "legal_status": "legalStatus",
             "modified": "dateModified",
             "name": "realName",
             "num_images": "picturesQuantity",
@@ -79,8 +99,12 @@ class EntityBase:
             "original_url": "originalUrl",
             "party_id": "partyId",
             "party_place": "partyPlace",
+            "product_id": "prodId",
+            "publisher_ids": "publisherIds",
+            "release_type": "releaseType",
             "start_date": "startDate",
             "title_internal": "internalTitle",
+            "youtube_id": "youtubeId",
         }
 
         serialization_strategy = {
@@ -88,25 +112,26 @@ class EntityBase:
             dt.datetime: {"deserialize": dt.datetime.fromtimestamp},
             dt.timedelta: {"deserialize": _duration},
             HtmlStr: {"deserialize": _unescape},
-            UrlStr: {"deserialize": unquote},
+            InternStr: {"deserialize": sys.intern},
+            UrlStr: {"deserialize": _unquote},
         }
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class MediaBase(EntityBase):
     """Базовый класс медиафайла"""
 
     party_id: int | None = None
     """Идентификатор мероприятия"""
-    compo: str | None = None
+    compo: InternStr | None = None
     """Тип"""
     party_place: int | None = None
     """Занятое место на мероприятии"""
     author_ids: list[int]
     """Идентификаторы авторов"""
-    tags: list[str] | None = None
+    tags: list[InternStr] | None = None
     """Теги"""
-    type: str | None = None
+    type: InternStr | None = None
     """Тип файла"""
     rating: Decimal
     """Рейтинг"""
@@ -126,7 +151,7 @@ class MediaBase(EntityBase):
         return x
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class Tune(MediaBase):
     """Мелодия"""
 
@@ -140,7 +165,7 @@ class Tune(MediaBase):
     """Имя оригинального файла"""
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class Image(MediaBase):
     """Изображение"""
 
@@ -148,7 +173,7 @@ class Image(MediaBase):
     """Кол-во просмотров"""
 
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class ImportID:
     """Импортированные идентификаторы автора на сторонних ресурсах."""
 
@@ -181,7 +206,7 @@ class ImportID:
         }
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class AuthorAlias(EntityBase):
     """Модель псевдонима автора"""
 
@@ -195,15 +220,15 @@ class AuthorAlias(EntityBase):
     """Дата окончания действия"""
 
 
-@dc.dataclass(kw_only=True)
+@dc.dataclass(kw_only=True, slots=True)
 class Author(EntityBase):
     """Модель категории"""
 
     name: str | None = None
     """Настоящее имя"""
-    country: str | None = None
+    country: InternStr | None = None
     """Страна"""
-    city: str | None = None
+    city: InternStr | None = None
     """Город"""
     num_images: int = 0
     """Количество изображений"""
@@ -215,6 +240,102 @@ class Author(EntityBase):
     """Идентификаторы на других ресурсах"""
 
 
+@dc.dataclass(kw_only=True, slots=True)
+class GroupAlias(EntityBase):
+    """Модель псевдонима группы"""
+
+    group_id: int | None = None
+    """Идентификатор группы"""
+    import_ids: ImportID | None = None
+    """Идентификаторы на других ресурсах"""
+    start_date: dt.date | None = None
+    """Дата начала действия"""
+    end_date: dt.date | None = None
+    """Дата окончания действия"""
+
+
+@dc.dataclass(kw_only=True, slots=True)
+class Group(EntityBase):
+    """Модель группы"""
+
+    type: InternStr | None = None
+    """Тип группы"""
+    country: InternStr | None = None
+    """Страна"""
+    city: InternStr | None = None
+    """Город"""
+    website: UrlStr | None = None
+    """Сайт"""
+    aliases: list[int] | None = None
+    """Идентификаторы псевдонимов"""
+    import_ids: ImportID | None = None
+    """Идентификаторы на других ресурсах"""
+
+
+@dc.dataclass(kw_only=True, slots=True)
+class Product(EntityBase):
+    """Модель продукта (программы, игры, демо)"""
+
+    year: int | None = None
+    """Год выпуска"""
+    party_id: int | None = None
+    """Идентификатор мероприятия"""
+    compo: InternStr | None = None
+    """Тип конкурса"""
+    party_place: int | None = None
+    """Занятое место на мероприятии"""
+    legal_status: InternStr | None = None
+    """Правовой статус"""
+    rating: Decimal | None = None
+    """Рейтинг"""
+    author_ids: list[int] | None = None
+    """Идентификаторы авторов"""
+    group_ids: list[int] | None = None
+    """Идентификаторы групп"""
+    publisher_ids: list[int] | None = None
+    """Идентификаторы издателей"""
+    category_ids: list[int] | None = None
+    """Идентификаторы категорий"""
+    languages: list[InternStr] | None = None
+    """Языки"""
+    tags: list[InternStr] | None = None
+    """Теги"""
+    description: HtmlStr | None = None
+    """Описание"""
+    youtube_id: str | None = None
+    """Идентификатор видео YouTube"""
+    image_urls: list[UrlStr] | None = None
+    """URL снимков экрана"""
+    import_ids: ImportID | None = None
+    """Идентификаторы на других ресурсах"""
+
+
+@dc.dataclass(kw_only=True, slots=True)
+class Release(EntityBase):
+    """Модель релиза (издания продукта)"""
+
+    product_id: int | None = None
+    """Идентификатор продукта"""
+    year: int | None = None
+    """Год выпуска"""
+    release_type: InternStr | None = None
+    """Тип релиза"""
+    version: str | None = None
+    """Версия"""
+    languages: list[InternStr] | None = None
+    """Языки"""
+    hardware: list[InternStr] | None = None
+    """Требуемое оборудование"""
+    author_ids: list[int] | None = None
+    """Идентификаторы авторов"""
+    publisher_ids: list[int] | None = None
+    """Идентификаторы издателей"""
+    description: HtmlStr | None = None
+    """Описание"""
+    import_ids: ImportID | None = None
+    """Идентификаторы на других ресурсах"""
+
+
 @dc.dataclass
 class ApiResponse[T](DataClassDictMixin):
     """Модель ответа на запросы"""
@@ -257,3 +378,23 @@ class TuneResponse(ApiResponse[Tune]):
 @dc.dataclass
 class ImageResponse(ApiResponse[Image]):
     entity = Entity.IMAGE
+
+
+@dc.dataclass
+class GroupResponse(ApiResponse[Group]):
+    entity = Entity.GROUP
+
+
+@dc.dataclass
+class GroupAliasResponse(ApiResponse[GroupAlias]):
+    entity = Entity.GROUP_ALIAS
+
+
+@dc.dataclass
+class ProductResponse(ApiResponse[Product]):
+    entity = Entity.PRODUCT
+
+
+@dc.dataclass
+class ReleaseResponse(ApiResponse[Release]):
+    entity = Entity.RELEASE
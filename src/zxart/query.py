@@ -0,0 +1,108 @@
+import dataclasses as dc
+import functools
+import operator
+from typing import Any, Iterable
+
+import yarl
+
+from .common import Entity, Language, Order, OrderSettings, process_filters
+
+_BASE_URL = yarl.URL("https://zxart.ee/api/")
+"""Базовый URL API"""
+
+_CACHE_SIZE = 256
+"""Количество скомпилированных запросов в кэше `compile_query`"""
+
+
+@dc.dataclass(frozen=True, slots=True)
+class Query:
+    """
+    Скомпилированный запрос: сущность, фильтры, язык и порядок сортировки.
+
+    Путь URL формируется однократно при создании, `url` только добавляет
+    позицию и размер страницы. Параметры упорядочиваются по имени, поэтому
+    запросы с одинаковыми параметрами равны и имеют одинаковый URL
+    независимо от порядка аргументов. Объект хэшируемый и может служить
+    ключом.
+    """
+
+    entity: Entity
+    """Сущность"""
+    params: tuple[tuple[str, Any], ...]
+    """
+    Параметры запроса, упорядоченные по имени (значения `Iterable` сохранены
+    кортежами)
+    """
+    _path: str = dc.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "params", _sorted(self.params))
+        kwargs = dict(self.params)
+        process_filters(self.entity, kwargs)
+        kwargs["export"] = self.entity
+
+        url = _BASE_URL.joinpath(*(f"{k}:{v}" for k, v in kwargs.items()))
+        path = url.raw_path[len(_BASE_URL.raw_path) :]
+
+        object.__setattr__(self, "_path", path)
+
+    @classmethod
+    def compile(
+        cls,
+        entity: Entity,
+        *,
+        language: Language = Language.RUSSIAN,
+        order: Order | OrderSettings = Order.MOST_RECENT,
+        **filters: Any,
+    ) -> "Query":
+        """
+        Компиляция запроса. Параметры аналогичны методу `ZXArtClient.api`,
+        кроме `start` и `limit`, которые передаются методу `url`.
+        """
+
+        for k, v in filters.items():
+            if not isinstance(v, str) and isinstance(v, Iterable):
+                filters[k] = tuple(v)
+
+        filters["language"] = language
+        filters["order"] = order
+
+        return cls(entity, tuple(filters.items()))
+
+    @property
+    def filters(self) -> dict[str, Any]:
+        """Параметры запроса в виде словаря."""
+
+        return dict(self.params)
+
+    def url(self, start: int = 0, limit: int = 60) -> yarl.URL:
+        """URL страницы выборки."""
+
+        return yarl.URL(
+            f"{_BASE_URL}{self._path}/start:{start}/limit:{limit}",
+            encoded=True,
+        )
+
+
+def _sorted(params: Iterable[tuple[str, Any]]) -> tuple[tuple[str, Any], ...]:
+    """Параметры, упорядоченные по имени."""
+
+    return tuple(sorted(params, key=operator.itemgetter(0)))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _compile(entity: Entity, params: tuple[tuple[str, Any], ...]) -> Query:
+    return Query.compile(entity, **dict(params))
+
+
+def compile_query(entity: Entity, **kwargs: Any) -> Query:
+    """
+    Компиляция запроса с кэшированием по параметрам. Запросы с
+    нехэшируемыми значениями параметров компилируются без кэширования.
+    """
+
+    try:
+        return _compile(entity, _sorted(kwargs.items()))
+
+    except TypeError:
+        return Query.compile(entity, **kwargs)
@@ -0,0 +1,314 @@
+"""
+Декодирование экранов ZX Spectrum в массивы RGB (требуется `numpy`).
+
+Поддерживаемые форматы по размеру данных:
+- 6144 байт: только растр, черные точки на белом фоне;
+- 6912 байт: стандартный экран `.scr`, растр и атрибуты знакомест 8×8;
+- 12288 байт: мультиколор Timex, растр и атрибуты строк 8×1.
+
+Растр хранится третями экрана с чередованием строк, его порядок
+восстанавливается перестановкой осей массива. Цвета восьми точек байта
+растра выбираются одной выборкой из таблицы по паре `(атрибут, байт)`,
+поэтому BRIGHT и обе фазы FLASH обрабатываются без ветвлений. Пакет экранов
+декодируется одним массивом формы `(n, 192, 256, 3)`.
+"""
+
+import concurrent.futures
+import itertools
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+_LOGGER = logging.getLogger(__name__)
+
+WIDTH = 256
+"""Ширина экрана в точках"""
+HEIGHT = 192
+"""Высота экрана в точках"""
+
+BITMAP_SIZE = 6144
+"""Размер растра в байтах"""
+SCREEN_SIZE = 6912
+"""Размер стандартного экрана `.scr` в байтах"""
+TIMEX_SIZE = 12288
+"""Размер экрана мультиколор Timex 8×1 в байтах"""
+
+SIZES = (BITMAP_SIZE, SCREEN_SIZE, TIMEX_SIZE)
+"""Поддерживаемые размеры экранов"""
+
+_DEFAULT_ATTR = 0o070
+"""Атрибут экрана без атрибутов: черные чернила на белой бумаге"""
+
+_LEVELS = (0x00, 0xD7, 0xFF)
+"""Яркость канала: выключен, обычный, BRIGHT"""
+
+type Buffer = bytes | bytearray | memoryview
+
+
+def _palette() -> "np.ndarray":
+    """Палитра формы `(16, 3)`: индекс `BRIGHT * 8 + GRB`."""
+
+    palette = np.zeros((16, 3), np.uint8)
+
+    for i in range(16):
+        level = _LEVELS[1 + (i >> 3)]
+        # Биты цвета: 0 - синий, 1 - красный, 2 - зеленый
+        palette[i] = [
+            level * (i >> 1 & 1),
+            level * (i >> 2 & 1),
+            level * (i & 1),
+        ]
+
+    return palette
+
+
+def _table(phase: int) -> "np.ndarray":
+    """
+    Таблица цветов восьми точек байта растра по ключу `атрибут << 8 | байт`.
+    Элементы типа `V24` (8 точек RGB) выбираются одной операцией `take`.
+    """
+
+    attr = np.arange(256)
+    bright = (attr >> 6 & 1) * 8
+    ink, paper = attr & 7, attr >> 3 & 7
+
+    if phase:
+        # Во второй фазе FLASH чернила и бумага меняются местами
+        flash = attr >> 7 == 1
+        ink, paper = np.where(flash, paper, ink), np.where(flash, ink, paper)
+
+    # Индекс палитры по атрибуту и биту, форма (256, 2)
+    index = np.stack([paper + bright, ink + bright], axis=1)
+    bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+    pixels = _palette()[index[:, bits]]
+
+    return pixels.reshape(-1, 24).view("V24").reshape(-1)
+
+
+_TABLES: list["np.ndarray"] = []
+
+
+def _tables() -> list["np.ndarray"]:
+    if not _TABLES:
+        _require()
+        _TABLES.extend(_table(x) for x in (0, 1))
+
+    return _TABLES
+
+
+def _require() -> None:
+    if np is None:
+        raise ImportError("Screen decoding requires numpy.")
+
+
+def _deinterleave(bitmap: "np.ndarray") -> "np.ndarray":
+    """
+    Строки растра в порядке сверху вниз, форма `(n, 192, 32)`.
+
+    Адрес байта: `треть * 2048 + строка знакоместа * 256 + ряд знакомест * 32
+    + столбец`.
+    """
+
+    n = bitmap.shape[0]
+
+    return (
+        bitmap.reshape(n, 3, 8, 8, 32)
+        .transpose(0, 1, 3, 2, 4)
+        .reshape(n, HEIGHT, 32)
+    )
+
+
+def _attributes(data: "np.ndarray", size: int) -> "np.ndarray":
+    """Атрибуты строк знакомест, форма `(n, 192, 32)`."""
+
+    n = data.shape[0]
+
+    match size:
+        case 6144:
+            return np.full((n, HEIGHT, 32), _DEFAULT_ATTR, np.uint8)
+
+        case 6912:
+            attrs = data[:, BITMAP_SIZE:].reshape(n, 24, 1, 32)
+            return np.broadcast_to(attrs, (n, 24, 8, 32)).reshape(n, HEIGHT, 32)
+
+        case _:
+            return _deinterleave(data[:, BITMAP_SIZE:])
+
+
+def _decode(data: "np.ndarray", size: int, phase: int) -> "np.ndarray":
+    key = _attributes(data, size).astype(np.uint16) << 8
+    key |= _deinterleave(data[:, :BITMAP_SIZE])
+    pixels = _tables()[phase].take(key)
+
+    return pixels.view(np.uint8).reshape(data.shape[0], HEIGHT, WIDTH, 3)
+
+
+def decode_screens(
+    data: Buffer | Sequence[Buffer],
+    *,
+    size: int | None = None,
+    phase: int = 0,
+) -> "np.ndarray":
+    """
+    Декодирование пакета экранов одного формата. Возвращает массив `uint8`
+    формы `(n, 192, 256, 3)`.
+
+    Параметры:
+    - `data`: экраны одним буфером подряд или последовательностью буферов.
+    - `size`: размер экрана. По-умолчанию: размер буферов
+    последовательности, для одного буфера - его размер, если он
+    поддерживается, иначе `SCREEN_SIZE`.
+    - `phase`: фаза FLASH, `0` или `1`.
+    """
+
+    _require()
+
+    if isinstance(data, bytes | bytearray | memoryview):
+        buffer = np.frombuffer(data, np.uint8)
+
+        if size is None:
+            size = len(buffer) if len(buffer) in SIZES else SCREEN_SIZE
+
+    else:
+        if size is None:
+            if len(sizes := {len(x) for x in data}) != 1:
+                raise ValueError(f"Screens of different sizes: {sizes}.")
+
+            size = sizes.pop()
+
+        buffer = np.frombuffer(b"".join(data), np.uint8)
+
+    if size not in SIZES or not len(buffer) or len(buffer) % size:
+        raise ValueError(f"Unsupported screen data size: {len(buffer)}.")
+
+    return _decode(buffer.reshape(-1, size), size, phase & 1)
+
+
+def decode_screen(data: Buffer, *, phase: int = 0) -> "np.ndarray":
+    """
+    Декодирование экрана. Возвращает массив `uint8` формы `(192, 256, 3)`.
+
+    Параметры:
+    - `data`: данные экрана.
+    - `phase`: фаза FLASH, `0` или `1`.
+    """
+
+    if len(data) not in SIZES:
+        raise ValueError(f"Unsupported screen data size: {len(data)}.")
+
+    return decode_screens(data, size=len(data), phase=phase)[0]
+
+
+def thumbnail(images: "np.ndarray", scale: int) -> "np.ndarray":
+    """Уменьшение изображений в `scale` раз усреднением блоков точек."""
+
+    if scale == 1:
+        return images
+
+    *n, h, w, c = images.shape
+    blocks = images.reshape(*n, h // scale, scale, w // scale, scale, c)
+
+    return blocks.mean(axis=(-4, -2), dtype=np.float32).astype(np.uint8)
+
+
+def _decode_files(
+    paths: list[str], phase: int, scale: int
+) -> tuple[list[str], "np.ndarray | None"]:
+    """Декодирование файлов в процессе пула."""
+
+    groups: dict[int, tuple[list[str], list[bytes]]] = {}
+
+    for path in paths:
+        try:
+            data = Path(path).read_bytes()
+
+        except OSError as exc:
+            _LOGGER.warning("Screen read error: %s", exc)
+            continue
+
+        if len(data) not in SIZES:
+            _LOGGER.debug("Not a screen: %s (%d bytes)", path, len(data))
+            continue
+
+        names, buffers = groups.setdefault(len(data), ([], []))
+        names.append(path)
+        buffers.append(data)
+
+    if not groups:
+        return [], None
+
+    result = [x for names, _ in groups.values() for x in names]
+    images = np.concatenate(
+        [decode_screens(x, size=k, phase=phase) for k, (_, x) in groups.items()]
+    )
+
+    return result, thumbnail(images, scale)
+
+
+def decode_files(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    workers: int | None = None,
+    batch_size: int = 256,
+    phase: int = 0,
+    scale: int = 1,
+) -> Iterator[tuple[list[Path], "np.ndarray"]]:
+    """
+    Декодирование файлов экранов в пуле процессов. Возвращает пакеты путей
+    декодированных файлов и массивов изображений в порядке завершения.
+    Файлы неподдерживаемого размера пропускаются.
+
+    Параметры:
+    - `paths`: пути к файлам, например из хранилища `Downloader`.
+    - `workers`: количество процессов. По-умолчанию: количество ядер.
+    - `batch_size`: количество файлов в задании процесса.
+    - `phase`: фаза FLASH, `0` или `1`.
+    - `scale`: уменьшение размера изображений (миниатюры), делитель 64.
+    """
+
+    _require()
+
+    if HEIGHT % scale or WIDTH % scale:
+        raise ValueError(f"Scale must divide {WIDTH}x{HEIGHT}: {scale}.")
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = workers or os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(
+        workers, mp_context=ctx
+    ) as pool:
+        pending: set[concurrent.futures.Future] = set()
+        paths = iter(paths)
+
+        while True:
+            # Ограничение количества заданий и результатов в памяти
+            while len(pending) < 2 * workers:
+                batch = [
+                    os.fspath(x) for x in itertools.islice(paths, batch_size)
+                ]
+
+                if not batch:
+                    break
+
+                pending.add(pool.submit(_decode_files, batch, phase, scale))
+
+            if not pending:
+                return
+
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+
+            for future in done:
+                names, images = future.result()
+
+                if images is not None:
+                    yield [Path(x) for x in names], images
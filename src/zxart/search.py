@@ -0,0 +1,559 @@
+"""
+Индекс поиска записей в памяти.
+
+Индекс строится из любых записей (`Tune`, `Image`, `Author` и т.п.) одной
+сущности и отвечает на запросы без обращения к серверу:
+
+- нечеткий поиск по названию: инвертированный индекс триграмм `title` и
+`title_internal` с ранжированием по доле найденных триграмм запроса;
+- фильтры по тегам, формату, конкурсу и году: множества номеров записей,
+которые при запросе переводятся в битовые маски (целые числа) и
+объединяются поразрядными операциями;
+- фильтры и сортировка по рейтингу, прослушиваниям и месту на конкурсе:
+отсортированные списки значений.
+
+Записи добавляются, обновляются и удаляются по идентификатору.
+"""
+
+import bisect
+import dataclasses as dc
+import heapq
+import itertools
+import math
+import re
+from collections import Counter
+from typing import Any, Hashable, Iterable, Iterator, Literal
+
+type Field = Literal["rating", "plays", "party_place"]
+"""Числовое поле индекса"""
+
+_FACETS = ("tags", "type", "compo", "year")
+"""Поля, индексируемые множествами"""
+
+_NUMERIC: tuple[Field, ...] = ("rating", "plays", "party_place")
+"""Поля, индексируемые отсортированными списками"""
+
+_TEXT = ("title", "title_internal")
+"""Поля нечеткого поиска"""
+
+_CACHE_SIZE = 1024
+"""Количество кэшируемых битовых масок"""
+
+_ORDER_CACHE_SIZE = 128
+"""Количество кэшируемых отсортированных выборок масок"""
+
+_WORD = re.compile(r"\w+")
+_NONZERO = re.compile(rb"[^\x00]")
+_BITS = [tuple(i for i in range(8) if x >> i & 1) for x in range(256)]
+"""Номера установленных битов байта"""
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """
+    Триграммы строки без учета регистра. Каждое слово дополняется двумя
+    пробелами в начале и одним в конце.
+    """
+
+    return frozenset(
+        w[i : i + 3]
+        for x in _WORD.findall(text.casefold())
+        for w in (f"  {x} ",)
+        for i in range(len(w) - 2)
+    )
+
+
+def _bitmap(slots: Iterable[int], size: int) -> int:
+    """Битовая маска номеров записей."""
+
+    buf = bytearray((size + 7) >> 3)
+
+    for x in slots:
+        buf[x >> 3] |= 1 << (x & 7)
+
+    return int.from_bytes(buf, "little")
+
+
+def _decode(mask: int) -> Iterator[int]:
+    """Номера установленных битов маски по возрастанию."""
+
+    data = mask.to_bytes((mask.bit_length() + 7) >> 3, "little")
+
+    return (
+        i << 3 | x
+        for i in map(re.Match.start, _NONZERO.finditer(data))
+        for x in _BITS[data[i]]
+    )
+
+
+def _iterable(value: Any) -> Iterable[Any]:
+    if isinstance(value, (str, int)):
+        return (value,)
+
+    return value
+
+
+class _Postings:
+    """Инвертированный список: ключ и номера записей с этим ключом."""
+
+    __slots__ = ("_masks", "_sets")
+
+    def __init__(self) -> None:
+        self._sets: dict[Hashable, set[int]] = {}
+        # Маски часто запрашиваемых ключей обновляются на месте
+        self._masks: dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, slot: int) -> None:
+        self._sets.setdefault(key, set()).add(slot)
+
+        if (x := self._masks.get(key)) is not None:
+            self._masks[key] = x | 1 << slot
+
+    def discard(self, key: Hashable, slot: int) -> None:
+        if (s := self._sets.get(key)) is None:
+            return
+
+        s.discard(slot)
+
+        if not s:
+            del self._sets[key]
+            self._masks.pop(key, None)
+
+        elif (x := self._masks.get(key)) is not None:
+            self._masks[key] = x & ~(1 << slot)
+
+    def get(self, key: Hashable) -> set[int]:
+        return self._sets.get(key) or set()
+
+    def mask(self, key: Hashable, size: int) -> int:
+        """Битовая маска ключа. Маски кэшируются по давности использования."""
+
+        if (x := self._masks.pop(key, None)) is None:
+            if (s := self._sets.get(key)) is None:
+                return 0
+
+            x = _bitmap(s, size)
+
+            if len(self._masks) >= _CACHE_SIZE:
+                del self._masks[next(iter(self._masks))]
+
+        self._masks[key] = x
+
+        return x
+
+
+@dc.dataclass(slots=True)
+class Match:
+    """Результат поиска"""
+
+    item: Any
+    """Запись"""
+    score: float
+    """Доля найденных триграмм запроса от 0 до 1. Без запроса — 1."""
+
+
+class SearchIndex:
+    """
+    Индекс поиска записей одной сущности в памяти.
+
+    Идентификаторы записей разных сущностей пересекаются, поэтому для каждой
+    сущности строится отдельный индекс.
+    """
+
+    _items: list[Any]
+    """Записи по номерам. Удаленные записи — `None`."""
+    _slots: dict[int, int]
+    """Номера записей по идентификаторам"""
+    _free: list[int]
+    """Свободные номера"""
+    _grams: list[frozenset[str]]
+    """Триграммы записей по номерам"""
+    _trigrams: _Postings
+    _facets: dict[str, _Postings]
+    _values: dict[str, list[float | None]]
+    """Числовые значения полей по номерам записей"""
+    _numeric: dict[str, list[tuple[float, int]]]
+    """Отсортированные пары значения и номера записи"""
+    _ranges: dict[tuple[str, float, float], int]
+    """Кэш масок диапазонов. Очищается при изменении индекса."""
+    _orders: dict[tuple[str, int], list[int]]
+    """
+    Кэш номеров записей масок, отсортированных по значению поля. Очищается
+    при изменении индекса.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        self._items = []
+        self._slots = {}
+        self._free = []
+        self._grams = []
+        self._trigrams = _Postings()
+        self._facets = {x: _Postings() for x in _FACETS}
+        self._values = {x: [] for x in _NUMERIC}
+        self._numeric = {x: [] for x in _NUMERIC}
+        self._ranges = {}
+        self._orders = {}
+        self.update(items)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._slots
+
+    def get(self, id: int) -> Any:
+        """Запись по идентификатору или `None`."""
+
+        if (slot := self._slots.get(id)) is None:
+            return None
+
+        return self._items[slot]
+
+    def add(self, item: Any) -> None:
+        """Добавление или обновление записи."""
+
+        self.remove(item.id)
+        slot = self._insert(item)
+
+        for field in _NUMERIC:
+            if (x := self._values[field][slot]) is not None:
+                bisect.insort(self._numeric[field], (x, slot))
+
+    def update(self, items: Iterable[Any]) -> None:
+        """
+        Добавление или обновление записей. Отсортированные списки
+        перестраиваются один раз на весь набор.
+        """
+
+        items = {x.id: x for x in items}
+
+        for x in items:
+            self.remove(x)
+
+        for x in items.values():
+            slot = self._insert(x)
+
+            for field in _NUMERIC:
+                if (v := self._values[field][slot]) is not None:
+                    self._numeric[field].append((v, slot))
+
+        for x in self._numeric.values():
+            x.sort()
+
+    def remove(self, id: int) -> bool:
+        """Удаление записи. Возвращает `False`, если запись отсутствует."""
+
+        if (slot := self._slots.pop(id, None)) is None:
+            return False
+
+        item = self._items[slot]
+
+        for x in self._grams[slot]:
+            self._trigrams.discard(x, slot)
+
+        for field, keys in self._keys(item):
+            for x in keys:
+                self._facets[field].discard(x, slot)
+
+        for field, values in self._values.items():
+            if (x := values[slot]) is not None:
+                lst = self._numeric[field]
+                del lst[bisect.bisect_left(lst, (x, slot))]
+                values[slot] = None
+
+        self._items[slot] = None
+        self._grams[slot] = frozenset()
+        self._free.append(slot)
+        self._ranges.clear()
+        self._orders.clear()
+
+        return True
+
+    def _insert(self, item: Any) -> int:
+        """
+        Индексирование записи во всех индексах, кроме отсортированных
+        списков. Возвращает номер записи.
+        """
+
+        if self._free:
+            slot = self._free.pop()
+            self._items[slot] = item
+
+        else:
+            slot = len(self._items)
+            self._items.append(item)
+            self._grams.append(frozenset())
+
+            for x in self._values.values():
+                x.append(None)
+
+        self._slots[item.id] = slot
+        self._ranges.clear()
+        self._orders.clear()
+
+        grams = frozenset().union(
+            *(trigrams(x) for k in _TEXT if (x := getattr(item, k, None)))
+        )
+        self._grams[slot] = grams
+
+        for x in grams:
+            self._trigrams.add(x, slot)
+
+        for field, keys in self._keys(item):
+            for x in keys:
+                self._facets[field].add(x, slot)
+
+        for field, values in self._values.items():
+            if (x := getattr(item, field, None)) is not None:
+                values[slot] = float(x)
+
+        return slot
+
+    @staticmethod
+    def _keys(item: Any) -> Iterator[tuple[str, Iterable[Any]]]:
+        for field in _FACETS:
+            if (x := getattr(item, field, None)) is not None:
+                yield field, x if field == "tags" else (x,)
+
+    def _alive(self) -> int:
+        size = len(self._items)
+        mask = (1 << size) - 1
+
+        return mask ^ _bitmap(self._free, size) if self._free else mask
+
+    def _range(self, field: str, lo: float, hi: float) -> int:
+        """Маска записей со значением поля в диапазоне `[lo, hi]`."""
+
+        if (x := self._ranges.get((field, lo, hi))) is not None:
+            return x
+
+        lst, size = self._numeric[field], len(self._items)
+        i = bisect.bisect_left(lst, (lo, -1))
+        j = bisect.bisect_right(lst, (hi, math.inf))
+
+        if i == 0 and j == len(lst):
+            # Все записи со значением поля
+            if len(lst) == len(self._slots):
+                x = self._alive()
+
+            else:
+                x = _bitmap((s for _, s in lst), size)
+
+        elif j - i <= len(lst) // 2:
+            x = _bitmap((s for _, s in lst[i:j]), size)
+
+        else:
+            # Широкий диапазон: маска строится по дополнению
+            outside = (s for _, s in lst[:i] + lst[j:])
+            x = self._range(field, -math.inf, math.inf)
+            x &= ~_bitmap(outside, size)
+
+        if len(self._ranges) >= _CACHE_SIZE:
+            self._ranges.clear()
+
+        self._ranges[field, lo, hi] = x
+
+        return x
+
+    def _sorted(self, field: str, mask: int) -> list[int]:
+        """
+        Номера записей маски со значением поля, отсортированные по значению
+        и номеру записи.
+        """
+
+        if (x := self._orders.get((field, mask))) is not None:
+            return x
+
+        values = self._values[field]
+        pairs = sorted(
+            (values[s], s) for s in _decode(mask) if values[s] is not None
+        )
+        x = [s for _, s in pairs]
+
+        if len(self._orders) >= _ORDER_CACHE_SIZE:
+            self._orders.clear()
+
+        self._orders[field, mask] = x
+
+        return x
+
+    def mask(
+        self,
+        *,
+        years: Iterable[int] | int | None = None,
+        format: Iterable[str] | str | None = None,
+        compo: Iterable[str] | str | None = None,
+        tags_include: Iterable[str] | str | None = None,
+        tags_exclude: Iterable[str] | str | None = None,
+        min_rating: float | None = None,
+        min_plays: int | None = None,
+        min_party_place: int | None = None,
+    ) -> int | None:
+        """
+        Битовая маска номеров записей, удовлетворяющих фильтрам. Фильтры
+        аналогичны фильтрам запроса API. Без фильтров возвращает `None`.
+        """
+
+        size, masks = len(self._items), []
+
+        for field, values in (
+            ("year", years),
+            ("type", format),
+            ("compo", compo),
+        ):
+            if values is not None:
+                postings, x = self._facets[field], 0
+
+                for v in _iterable(values):
+                    x |= postings.mask(v, size)
+
+                masks.append(x)
+
+        for x in _iterable(tags_include or ()):
+            masks.append(self._facets["tags"].mask(x, size))
+
+        for field, lo, hi in (
+            ("rating", min_rating, math.inf),
+            ("plays", min_plays, math.inf),
+            ("party_place", 1, min_party_place),
+        ):
+            if lo is not None and hi is not None:
+                masks.append(self._range(field, lo, hi))
+
+        if not masks and not tags_exclude:
+            return None
+
+        # Сначала наиболее селективные маски
+        masks.sort(key=int.bit_count)
+        mask = masks[0] if masks else self._alive()
+
+        for x in masks[1:]:
+            if not mask:
+                break
+
+            mask &= x
+
+        for x in _iterable(tags_exclude or ()):
+            mask &= ~self._facets["tags"].mask(x, size)
+
+        return mask
+
+    def _match(
+        self, text: str, similarity: float, mask: int | None
+    ) -> list[tuple[float, int, int]]:
+        """
+        Записи, похожие на строку и входящие в маску: доля найденных триграмм
+        строки, количество триграмм записи со знаком минус и номер записи.
+        """
+
+        if not (q := trigrams(text)):
+            return []
+
+        n = len(q)
+        m = max(1, math.ceil(similarity * n))
+        postings = sorted(map(self._trigrams.get, q), key=len)
+        # Запись с `m` общими триграммами содержит хотя бы одну из `n - m + 1`
+        # триграмм с самыми короткими списками. Вхождения подсчитываются и по
+        # следующим спискам, пока их длина не превышает суммы предыдущих:
+        # запись должна содержать не менее `m - (n - k)` из `k` триграмм.
+        k, total = n - m + 1, sum(map(len, postings[: n - m + 1]))
+
+        while k < n and len(postings[k]) <= total:
+            total += len(postings[k])
+            k += 1
+
+        counts = Counter(itertools.chain.from_iterable(postings[:k]))
+        least, rest = m - (n - k), postings[k:]
+        found = [(c, x) for x, c in counts.items() if c >= least]
+
+        if mask is not None:
+            view = mask.to_bytes((len(self._items) + 7) >> 3, "little")
+            found = [(c, x) for c, x in found if view[x >> 3] >> (x & 7) & 1]
+
+        for p in rest:
+            found = [(c + (x in p), x) for c, x in found]
+
+        grams = self._grams
+
+        # При равной доле триграмм строки выше записи с меньшим количеством
+        # триграмм, что соответствует большему коэффициенту Жаккара
+        return [(c / n, -len(grams[x]), x) for c, x in found if c >= m]
+
+    def search(
+        self,
+        text: str | None = None,
+        *,
+        limit: int = 60,
+        similarity: float = 0.5,
+        order: Field | None = None,
+        reverse: bool = True,
+        **filters: Any,
+    ) -> list[Match]:
+        """
+        Поиск записей.
+
+        Параметры:
+        - `text`: строка нечеткого поиска по названию.
+        - `limit`: максимальное количество результатов.
+        - `similarity`: минимальная доля найденных триграмм строки.
+        - `order`: поле сортировки: `rating`, `plays` или `party_place`. По
+        умолчанию: по убыванию схожести, без строки — в порядке добавления.
+        Записи без значения поля не выдаются.
+        - `reverse`: сортировка по убыванию.
+        - `filters`: фильтры метода `mask`.
+        """
+
+        mask = self.mask(**filters)
+        items = self._items
+
+        if text is not None:
+            found = self._match(text, similarity, mask)
+
+            if order is None:
+                top = heapq.nlargest(limit, found)
+                return [Match(items[x], c) for c, _, x in top]
+
+            values = self._values[order]
+            found = [
+                (values[x], c, x) for c, _, x in found if values[x] is not None
+            ]
+            found.sort(reverse=reverse)
+            return [Match(items[x], c) for _, c, x in found[:limit]]
+
+        if order is None:
+            slots = _decode(self._alive() if mask is None else mask)
+            return [Match(items[k], 1.0) for _, k in zip(range(limit), slots)]
+
+        lst = self._numeric[order]
+
+        if mask is not None and 4 * mask.bit_count() ** 2 < limit * len(lst):
+            # Маска малого размера: проход по отсортированному списку до
+            # `limit` записей маски длиннее сортировки самой маски. Результат
+            # сортировки кэшируется для повторных запросов.
+            slots = self._sorted(order, mask)
+            top = slots[: -limit - 1 : -1] if reverse else slots[:limit]
+            return [Match(items[x], 1.0) for x in top]
+
+        pairs = reversed(lst) if reverse else iter(lst)
+
+        if mask is not None:
+            # Проход по отсортированному списку с проверкой бита маски
+            view = mask.to_bytes((len(items) + 7) >> 3, "little")
+            pairs = (x for x in pairs if view[x[1] >> 3] >> (x[1] & 7) & 1)
+
+        return [Match(items[k], 1.0) for _, (_, k) in zip(range(limit), pairs)]
+
+    def count(
+        self,
+        text: str | None = None,
+        *,
+        similarity: float = 0.5,
+        **filters: Any,
+    ) -> int:
+        """Количество записей, удовлетворяющих запросу метода `search`."""
+
+        mask = self.mask(**filters)
+
+        if text is None:
+            return len(self) if mask is None else mask.bit_count()
+
+        return len(self._match(text, similarity, mask))
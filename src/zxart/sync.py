@@ -0,0 +1,178 @@
+"""
+Инкрементальная синхронизация каталога.
+
+Записи запрашиваются в порядке `сначала последние`, обход прекращается на
+первой записи, измененной не позднее сохраненной отметки времени. Записи, более
+старые по дате создания, но измененные после отметки, при этом не
+обнаруживаются: для них требуется полный обход (`since=None`).
+
+Страницы запрашиваются у сервера в обход зеркала и кэша клиента (`fresh=True`):
+зеркало может быть приемником синхронизации, и после первой страницы оно
+отвечало бы на запросы остальных.
+"""
+
+import asyncio
+import dataclasses as dc
+import datetime as dt
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+import orjson
+
+from .common import Entity, Order
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+
+
+class SyncSink(Protocol):
+    """
+    Приемник изменений синхронизации.
+
+    Приемник может реализовать метод `async complete(entity, language)`,
+    который вызывается после полного обхода сущности без фильтров (например,
+    `Mirror.complete`).
+    """
+
+    async def upsert(self, entity: Entity, items: list[Any]) -> None:
+        """Добавление или обновление записей."""
+        ...
+
+
+class WatermarkStore(Protocol):
+    """Хранилище отметок времени синхронизации."""
+
+    async def load(self, entity: Entity) -> dt.datetime | None:
+        """Загрузка отметки сущности."""
+        ...
+
+    async def save(self, entity: Entity, watermark: dt.datetime) -> None:
+        """Сохранение отметки сущности."""
+        ...
+
+
+class FileWatermarkStore:
+    """Хранилище отметок времени в файле JSON с атомарной записью."""
+
+    _path: Path
+    _lock: asyncio.Lock
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = Path(path)
+        self._lock = asyncio.Lock()
+
+    def _read(self) -> dict[str, float]:
+        try:
+            return orjson.loads(self._path.read_bytes())
+
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict[str, float]) -> None:
+        fd, tmp = tempfile.mkstemp(
+            dir=self._path.parent, prefix=self._path.name, suffix=".tmp"
+        )
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp, self._path)
+
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    async def load(self, entity: Entity) -> dt.datetime | None:
+        data = await asyncio.to_thread(self._read)
+
+        if (x := data.get(str(entity))) is not None:
+            return dt.datetime.fromtimestamp(x)
+
+    async def save(self, entity: Entity, watermark: dt.datetime) -> None:
+        async with self._lock:
+            data = await asyncio.to_thread(self._read)
+            data[str(entity)] = watermark.timestamp()
+            await asyncio.to_thread(self._write, data)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class SyncResult:
+    """Результат синхронизации"""
+
+    entity: Entity
+    """Сущность"""
+    count: int
+    """Количество переданных в приемник записей"""
+    watermark: dt.datetime | None
+    """Новая отметка времени"""
+
+
+async def sync(
+    client: "ZXArtClient",
+    entity: Entity,
+    sink: SyncSink,
+    *,
+    since: dt.datetime | None = None,
+    store: WatermarkStore | None = None,
+    concurrency: int = 2,
+    **kwargs: Any,
+) -> SyncResult:
+    """
+    Синхронизация записей сущности, измененных после отметки времени.
+
+    Параметры:
+    - `client`: клиент API.
+    - `entity`: сущность.
+    - `sink`: приемник изменений. Записи передаются постранично.
+    - `since`: отметка времени. По-умолчанию: загружается из `store`, при ее
+    отсутствии выполняется полный обход.
+    - `store`: хранилище отметок. Новая отметка сохраняется после успешной
+    передачи всех записей в приемник.
+    - `concurrency`: количество одновременно запрашиваемых страниц.
+    - `kwargs`: фильтры запроса, как в методе `api`.
+    """
+
+    if since is None and store is not None:
+        since = await store.load(entity)
+
+    # Полный обход всех записей сущности
+    crawl = since is None and not kwargs.keys() - {"language", "limit", "order"}
+    language = kwargs.get("language") or client.language
+
+    kwargs["order"] = Order.MOST_RECENT
+    watermark, count = since, 0
+    batch: list[Any] = []
+    size = kwargs.get("limit") or client.limit
+
+    async for x in client.iter_all(
+        entity, concurrency=concurrency, fresh=True, **kwargs
+    ):
+        if since is not None and x.modified <= since:
+            break
+
+        if watermark is None or x.modified > watermark:
+            watermark = x.modified
+
+        batch.append(x)
+
+        if len(batch) >= size:
+            await sink.upsert(entity, batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        await sink.upsert(entity, batch)
+        count += len(batch)
+
+    if crawl and (complete := getattr(sink, "complete", None)) is not None:
+        await complete(entity, language)
+
+    if store is not None and watermark is not None and watermark != since:
+        await store.save(entity, watermark)
+
+    return SyncResult(entity, count, watermark)
@@ -0,0 +1,341 @@
+"""
+Колоночное представление больших выборок медиафайлов и продуктов.
+
+Числовые поля хранятся в массивах `array.array`, строковые поля кодируются
+словарем. Отсутствующие целые значения кодируются как `-1`, вещественные как
+`NaN`.
+
+Фильтры и сортировки обрабатывают колонки целиком без цикла Python по
+записям: условие фильтра вычисляется `map` по колонке в маску из байтов
+`0`/`1`, маски нескольких фильтров объединяются побитовым `И` целых чисел,
+выборка записей по индексам выполняется `operator.itemgetter`.
+"""
+
+import functools
+import itertools
+import math
+import operator
+from array import array
+from typing import Any, ClassVar, Iterable, Self
+
+from .models import ApiResponse, MediaBase, Tune
+
+_NA = -1
+"""Отсутствующее целое значение"""
+
+
+def _gather(values: Any, rows: list[int]) -> Iterable[Any]:
+    """Элементы последовательности с указанными индексами."""
+
+    if len(rows) > 1:
+        return operator.itemgetter(*rows)(values)
+
+    return [values[x] for x in rows]
+
+
+class _Dictionary:
+    """Словарь кодирования строк."""
+
+    __slots__ = ("_index", "values")
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = [None]
+        self._index: dict[str | None, int] = {None: 0}
+
+    def encode(self, value: str | None) -> int:
+        """Код строки. Новые строки добавляются в словарь."""
+
+        if (code := self._index.get(value)) is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+
+        return code
+
+    def find(self, value: str | None) -> int | None:
+        """Код строки или `None`, если строка отсутствует в словаре."""
+
+        return self._index.get(value)
+
+
+class MediaTable:
+    """Базовая колоночная таблица медиафайлов."""
+
+    NUMERIC: ClassVar[dict[str, str]] = {
+        "id": "q",
+        "year": "i",
+        "rating": "d",
+        "party_place": "i",
+    }
+    """Числовые колонки и коды типов их массивов"""
+
+    STRINGS: ClassVar[tuple[str, ...]] = ("type", "compo")
+    """Строковые колонки"""
+
+    _columns: dict[str, array]
+    _strings: dict[str, tuple[_Dictionary, array]]
+    _tags: _Dictionary
+    _tag_codes: array
+    _tag_offsets: array
+    _titles: list[str | None]
+
+    def __init__(self, items: Iterable[MediaBase] = ()) -> None:
+        self._columns = {k: array(t) for k, t in self.NUMERIC.items()}
+        self._strings = {k: (_Dictionary(), array("I")) for k in self.STRINGS}
+        self._tags = _Dictionary()
+        self._tag_codes = array("I")
+        self._tag_offsets = array("I", [0])
+        self._titles = []
+        self.extend(items)
+
+    @classmethod
+    def from_response(cls, response: ApiResponse) -> Self:
+        """Таблица из ответа API."""
+
+        return cls(response.result)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _value(self, item: MediaBase, name: str) -> Any:
+        if name == "rating":
+            return math.nan if item.rating is None else float(item.rating)
+
+        if (x := getattr(item, name)) is None:
+            return _NA
+
+        return x
+
+    def append(self, item: MediaBase) -> None:
+        """Добавление записи."""
+
+        for name, column in self._columns.items():
+            column.append(self._value(item, name))
+
+        for name, (dictionary, codes) in self._strings.items():
+            codes.append(dictionary.encode(getattr(item, name)))
+
+        if item.tags:
+            self._tag_codes.extend(map(self._tags.encode, item.tags))
+
+        self._tag_offsets.append(len(self._tag_codes))
+        self._titles.append(item.title)
+
+    def extend(self, items: Iterable[MediaBase]) -> None:
+        """Добавление записей."""
+
+        for x in items:
+            self.append(x)
+
+    def column(self, name: str) -> array | list[Any]:
+        """
+        Колонка по имени поля. Строковые колонки возвращаются раскодированными
+        списками.
+        """
+
+        if (x := self._columns.get(name)) is not None:
+            return x
+
+        if name == "title":
+            return self._titles
+
+        if name == "tags":
+            return [self.tags(i) for i in range(len(self))]
+
+        dictionary, codes = self._strings[name]
+
+        return [dictionary.values[x] for x in codes]
+
+    def tags(self, row: int) -> list[str]:
+        """Теги записи."""
+
+        a, b = self._tag_offsets[row], self._tag_offsets[row + 1]
+        values = self._tags.values
+
+        return [values[x] for x in self._tag_codes[a:b]]  # type: ignore[misc]
+
+    def row(self, row: int) -> dict[str, Any]:
+        """Запись в виде словаря."""
+
+        x: dict[str, Any] = {k: v[row] for k, v in self._columns.items()}
+
+        for name, (dictionary, codes) in self._strings.items():
+            x[name] = dictionary.values[codes[row]]
+
+        x["title"] = self._titles[row]
+        x["tags"] = self.tags(row)
+
+        return x
+
+    def take(self, rows: Iterable[int]) -> Self:
+        """Новая таблица из записей с указанными индексами."""
+
+        rows = list(rows)
+        table = type(self)()
+
+        for name, column in self._columns.items():
+            table._columns[name] = array(column.typecode, _gather(column, rows))
+
+        for name, (dictionary, codes) in self._strings.items():
+            table._strings[name] = dictionary, array("I", _gather(codes, rows))
+
+        offsets, tag_codes = self._tag_offsets, self._tag_codes
+        starts = _gather(offsets, rows)
+        ends = _gather(offsets, [x + 1 for x in rows])
+        positions = list(
+            itertools.chain.from_iterable(map(range, starts, ends))
+        )
+
+        table._tags = self._tags
+        table._tag_codes = array("I", _gather(tag_codes, positions))
+        table._tag_offsets = array(
+            "I",
+            itertools.accumulate(map(operator.sub, ends, starts), initial=0),
+        )
+        table._titles = list(_gather(self._titles, rows))
+
+        return table
+
+    def sort(self, name: str, *, reverse: bool = False) -> Self:
+        """
+        Новая таблица, отсортированная по числовой или строковой колонке.
+        Отсутствующие значения располагаются в конце.
+        """
+
+        rows = range(len(self))
+
+        if (column := self._columns.get(name)) is None:
+            values = self.column(name)
+            mask = bytes(map(operator.is_not, values, itertools.repeat(None)))
+
+        else:
+            values = column.tolist()
+
+            if column.typecode == "d":
+                # NaN не равен самому себе
+                mask = bytes(map(operator.eq, values, values))
+
+            else:
+                mask = bytes(map(_NA.__ne__, values))
+
+        present = sorted(
+            itertools.compress(rows, mask),
+            key=values.__getitem__,
+            reverse=reverse,
+        )
+        present += itertools.compress(rows, map(operator.not_, mask))
+
+        return self.take(present)
+
+    def filter(
+        self,
+        *,
+        years: Iterable[int] | int | None = None,
+        min_rating: float | None = None,
+        min_party_place: int | None = None,
+        tags_include: Iterable[str] | str | None = None,
+        tags_exclude: Iterable[str] | str | None = None,
+        **kwargs: str,
+    ) -> Self:
+        """
+        Новая таблица из записей, удовлетворяющих фильтрам. Фильтры аналогичны
+        фильтрам запроса API, строковые колонки фильтруются на равенство
+        именованными параметрами (`type`, `compo`).
+        """
+
+        n = len(self)
+        # Объединение масок: байты `0`/`1` как разряды целого числа
+        masks: list[int] = []
+
+        def where(predicate: Any, *values: Iterable[Any]) -> None:
+            mask = bytes(map(predicate, *values))
+            masks.append(int.from_bytes(mask, "little"))
+
+        if years is not None:
+            ys = {years} if isinstance(years, int) else set(years)
+            where(ys.__contains__, self._columns["year"])
+
+        if min_rating is not None:
+            where(float(min_rating).__le__, self._columns["rating"])
+
+        if min_party_place is not None:
+            places = range(1, min_party_place + 1)
+            where(places.__contains__, self._columns["party_place"])
+
+        for name, value in kwargs.items():
+            dictionary, codes = self._strings[name]
+
+            if (code := dictionary.find(value)) is None:
+                return self.take(())
+
+            where(code.__eq__, codes)
+
+        if tags_include is not None or tags_exclude is not None:
+            include = self._tag_codes_of(tags_include)
+            exclude = self._tag_codes_of(tags_exclude)
+
+            # Отсутствующий в словаре тег не встречается ни в одной записи
+            if None in include:
+                return self.take(())
+
+            exclude.discard(None)
+
+            for code in include:
+                where(operator.lt, *self._tag_hits({code}))
+
+            if exclude:
+                where(operator.eq, *self._tag_hits(exclude))
+
+        if not masks:
+            return self.take(range(n))
+
+        mask = functools.reduce(operator.and_, masks)
+
+        return self.take(
+            itertools.compress(range(n), mask.to_bytes(n, "little"))
+        )
+
+    def _tag_hits(self, codes: set[Any]) -> tuple[Any, Any]:
+        """
+        Количество вхождений тегов до начала и до конца тегов каждой записи:
+        запись содержит хотя бы один из тегов, если значения различаются.
+        """
+
+        hits = map(codes.__contains__, self._tag_codes)
+        counts = list(itertools.accumulate(hits, initial=0))
+        counts = _gather(counts, self._tag_offsets)
+
+        return counts, counts[1:]
+
+    def _tag_codes_of(self, tags: Iterable[str] | str | None) -> set[Any]:
+        if tags is None:
+            return set()
+
+        if isinstance(tags, str):
+            tags = [tags]
+
+        return {self._tags.find(x) for x in tags}
+
+
+class TuneTable(MediaTable):
+    """Колоночная таблица мелодий."""
+
+    NUMERIC = MediaTable.NUMERIC | {"plays": "q", "duration": "d"}
+
+    def _value(self, item: Tune, name: str) -> Any:  # type: ignore[override]
+        if name == "duration":
+            d = item.duration
+            return math.nan if d is None else d.total_seconds()
+
+        return super()._value(item, name)
+
+
+class ImageTable(MediaTable):
+    """Колоночная таблица изображений."""
+
+    NUMERIC = MediaTable.NUMERIC | {"views": "q"}
+
+
+class ProductTable(MediaTable):
+    """Колоночная таблица продуктов."""
+
+    STRINGS = ("legal_status", "compo")
@@ -0,0 +1,331 @@
+"""
+Инструментирование запросов клиента.
+
+Для каждого вызова `ZXArtClient.api` формируется событие `RequestEvent` с
+длительностью этапов запроса, размером ответа и результатом обработки.
+События передаются обработчикам, заданным параметром `instruments` клиента.
+Встроенные обработчики: `Metrics` (гистограммы в стиле Prometheus) и
+`OpenTelemetryHook` (спаны трассировщика OpenTelemetry).
+"""
+
+import bisect
+import contextvars
+import dataclasses as dc
+import time
+from typing import Any, Callable, Iterable, Literal
+
+import aiohttp
+import yarl
+
+from .common import Entity
+
+type Outcome = Literal["network", "cache", "revalidated", "coalesced", "mirror"]
+"""
+Источник ответа: сетевой запрос, кэш, кэш после проверки актуальности,
+запрос, объединенный с уже выполняющимся, или локальное зеркало.
+"""
+
+
+@dc.dataclass(slots=True)
+class RequestEvent:
+    """Измерения одного вызова API. Длительности в секундах."""
+
+    entity: Entity
+    """Сущность"""
+    url: yarl.URL | None = None
+    """URL запроса"""
+    outcome: Outcome = "network"
+    """Источник ответа"""
+    started: float = dc.field(default_factory=time.time)
+    """Время начала (`time.time`)"""
+    duration: float = 0.0
+    """Полная длительность вызова"""
+    queue_wait: float = 0.0
+    """Ожидание ограничителей частоты, количества запросов и пула соединений"""
+    dns: float | None = None
+    """Разрешение имени сервера"""
+    connect: float | None = None
+    """Установка соединения (включая разрешение имени)"""
+    ttfb: float | None = None
+    """Время до получения заголовков ответа"""
+    size: int = 0
+    """Размер тела ответа в байтах"""
+    json_decode: float = 0.0
+    """Разбор JSON"""
+    model_decode: float = 0.0
+    """Создание моделей"""
+    items: int = 0
+    """Количество записей"""
+    status: int | None = None
+    """Статус HTTP последней попытки"""
+    attempts: int = 0
+    """Количество сетевых попыток"""
+    error: BaseException | None = None
+    """Ошибка вызова"""
+
+
+type Instrument = Callable[[RequestEvent], None]
+"""Обработчик событий"""
+
+_EVENT: contextvars.ContextVar[RequestEvent | None] = contextvars.ContextVar(
+    "zxart_event", default=None
+)
+"""Событие выполняющегося вызова"""
+
+
+def current() -> RequestEvent | None:
+    """Событие выполняющегося в текущем контексте вызова."""
+
+    return _EVENT.get()
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """
+    Трассировка `aiohttp`, дополняющая событие временем разрешения имени,
+    установки соединения и ожидания свободного соединения. Клиент подключает
+    ее к собственной сессии; пользовательской сессии ее нужно передать при
+    создании (`trace_configs`).
+    """
+
+    async def start(session, ctx, params) -> None:
+        ctx.started = time.monotonic()
+
+    def end(field: str):
+        async def callback(session, ctx, params) -> None:
+            if (event := _EVENT.get()) is not None:
+                value = getattr(event, field) or 0.0
+                setattr(event, field, value + time.monotonic() - ctx.started)
+
+        return callback
+
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(start)
+    config.on_dns_resolvehost_end.append(end("dns"))
+    config.on_connection_create_start.append(start)
+    config.on_connection_create_end.append(end("connect"))
+    config.on_connection_queued_start.append(start)
+    config.on_connection_queued_end.append(end("queue_wait"))
+
+    return config
+
+
+_TIME_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+_SIZE_BUCKETS = tuple(256 * 4**x for x in range(10))
+_ITEM_BUCKETS = (0, 1, 10, 60, 100, 250, 500, 1000)
+
+_HISTOGRAMS: dict[str, tuple[str, str, tuple[float, ...]]] = {
+    "duration": ("request_duration_seconds", "Call duration", _TIME_BUCKETS),
+    "queue_wait": ("queue_wait_seconds", "Throttling wait", _TIME_BUCKETS),
+    "dns": ("dns_seconds", "DNS resolution", _TIME_BUCKETS),
+    "connect": ("connect_seconds", "Connection setup", _TIME_BUCKETS),
+    "ttfb": ("ttfb_seconds", "Time to first byte", _TIME_BUCKETS),
+    "size": ("response_size_bytes", "Response body size", _SIZE_BUCKETS),
+    "json_decode": ("json_decode_seconds", "JSON parsing", _TIME_BUCKETS),
+    "model_decode": ("model_decode_seconds", "Model creation", _TIME_BUCKETS),
+    "items": ("items", "Items per response", _ITEM_BUCKETS),
+}
+"""Поле события: имя метрики, описание и границы гистограммы"""
+
+
+class Histogram:
+    """Гистограмма с накопительными интервалами в стиле Prometheus."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    bounds: tuple[float, ...]
+    """Верхние границы интервалов (включительно)"""
+    counts: list[int]
+    """Количество значений по интервалам, последний: `+Inf`"""
+    sum: float
+    """Сумма значений"""
+    count: int
+    """Количество значений"""
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Добавление значения."""
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Оценка квантиля по верхней границе интервала."""
+
+        rank, n = q * self.count, 0
+
+        for bound, x in zip(self.bounds, self.counts):
+            if (n := n + x) >= rank:
+                return bound
+
+        return float("inf")
+
+
+class Metrics:
+    """
+    Агрегатор событий в гистограммы по сущностям и счетчики результатов.
+    Передается клиенту как обработчик событий.
+    """
+
+    _prefix: str
+    _histograms: dict[tuple[str, Entity], Histogram]
+    _outcomes: dict[tuple[Entity, str], int]
+    _errors: dict[Entity, int]
+
+    def __init__(self, prefix: str = "zxart") -> None:
+        """
+        Параметры:
+        - `prefix`: префикс имен метрик.
+        """
+
+        self._prefix = prefix
+        self._histograms = {}
+        self._outcomes = {}
+        self._errors = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        entity = event.entity
+
+        if event.error is not None:
+            self._errors[entity] = self._errors.get(entity, 0) + 1
+            return
+
+        key = entity, event.outcome
+        self._outcomes[key] = self._outcomes.get(key, 0) + 1
+
+        for field in _HISTOGRAMS:
+            if (value := getattr(event, field)) is not None:
+                self.histogram(field, entity).observe(value)
+
+    def histogram(self, field: str, entity: Entity) -> Histogram:
+        """Гистограмма поля события `RequestEvent` по сущности."""
+
+        if (x := self._histograms.get((field, entity))) is None:
+            x = self._histograms[field, entity] = Histogram(
+                _HISTOGRAMS[field][2]
+            )
+
+        return x
+
+    def outcomes(self, entity: Entity) -> dict[str, int]:
+        """Количество успешных вызовов сущности по источникам ответа."""
+
+        return {k[1]: v for k, v in self._outcomes.items() if k[0] == entity}
+
+    def render(self) -> str:
+        """Метрики в текстовом формате Prometheus."""
+
+        p, lines = self._prefix, []
+
+        lines += [
+            f"# HELP {p}_requests_total Successful API calls",
+            f"# TYPE {p}_requests_total counter",
+        ]
+        lines += (
+            f'{p}_requests_total{{entity="{e}",outcome="{o}"}} {n}'
+            for (e, o), n in sorted(self._outcomes.items())
+        )
+
+        lines += [
+            f"# HELP {p}_errors_total Failed API calls",
+            f"# TYPE {p}_errors_total counter",
+        ]
+        lines += (
+            f'{p}_errors_total{{entity="{e}"}} {n}'
+            for e, n in sorted(self._errors.items())
+        )
+
+        for field, (name, help, _) in _HISTOGRAMS.items():
+            name = f"{p}_{name}"
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+
+            for (f, e), x in sorted(self._histograms.items()):
+                if f != field:
+                    continue
+
+                n = 0
+
+                for bound, count in zip(x.bounds + ("+Inf",), x.counts):
+                    n += count
+                    lines.append(
+                        f'{name}_bucket{{entity="{e}",le="{bound}"}} {n}'
+                    )
+
+                lines.append(f'{name}_sum{{entity="{e}"}} {x.sum}')
+                lines.append(f'{name}_count{{entity="{e}"}} {x.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook:
+    """
+    Обработчик, создающий по спану на каждое событие. Спан создается по
+    завершении вызова с исходным временем начала и окончания и становится
+    дочерним для активного спана вызывающего кода.
+    """
+
+    _tracer: Any
+
+    def __init__(self, tracer: Any) -> None:
+        """
+        Параметры:
+        - `tracer`: трассировщик, совместимый с
+        `opentelemetry.trace.Tracer`.
+        """
+
+        self._tracer = tracer
+
+    def __call__(self, event: RequestEvent) -> None:
+        start = int(event.started * 1e9)
+        attributes = {
+            "zxart.entity": str(event.entity),
+            "zxart.outcome": event.outcome,
+            "zxart.queue_wait": event.queue_wait,
+            "zxart.json_decode": event.json_decode,
+            "zxart.model_decode": event.model_decode,
+            "zxart.items": event.items,
+            "zxart.attempts": event.attempts,
+            "http.response.body.size": event.size,
+        }
+
+        if event.url is not None:
+            attributes["url.full"] = str(event.url)
+
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+
+        for field in ("dns", "connect", "ttfb"):
+            if (value := getattr(event, field)) is not None:
+                attributes[f"zxart.{field}"] = value
+
+        span = self._tracer.start_span(
+            f"zxart {event.entity}",
+            start_time=start,
+            attributes=attributes,
+        )
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error.type", type(event.error).__name__)
+
+        span.end(end_time=start + int(event.duration * 1e9))
@@ -0,0 +1,274 @@
+import asyncio
+import dataclasses as dc
+import email.utils
+import multiprocessing
+import random
+import time
+from typing import Protocol
+
+
+class RateLimiter(Protocol):
+    """Протокол ограничителя частоты запросов."""
+
+    async def acquire(self) -> None:
+        """Ожидание разрешения на запрос."""
+        ...
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму `token bucket`."""
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _updated: float
+    _lock: asyncio.Lock
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        """
+        Параметры:
+        - `rate`: средняя частота запросов в секунду.
+        - `burst`: максимальная пачка запросов. По-умолчанию: `max(1, rate)`.
+        """
+
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+
+        self._rate = rate
+        self._burst = burst or max(1.0, rate)
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Средняя частота запросов в секунду."""
+
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Ожидание разрешения на запрос."""
+
+        # Блокировка сохраняет очередность ожидающих
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class SharedTokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму `token bucket`, общий для
+    нескольких процессов. Передается дочерним процессам при их создании.
+    """
+
+    _rate: float
+    _burst: float
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        """
+        Параметры:
+        - `rate`: средняя частота запросов в секунду для всех процессов.
+        - `burst`: максимальная пачка запросов. По-умолчанию: `max(1, rate)`.
+        - `context`: контекст `multiprocessing` создаваемых процессов.
+        """
+
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+
+        ctx = context or multiprocessing.get_context()
+
+        self._rate = rate
+        self._burst = burst or max(1.0, rate)
+        self._lock = ctx.Lock()
+        self._tokens = ctx.RawValue("d", self._burst)
+        # Время CLOCK_MONOTONIC общее для процессов одной системы
+        self._updated = ctx.RawValue("d", time.monotonic())
+
+    @property
+    def rate(self) -> float:
+        """Средняя частота запросов в секунду."""
+
+        return self._rate
+
+    def _take(self) -> float:
+        """Попытка получить разрешение. Возвращает время ожидания."""
+
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(
+                self._burst,
+                self._tokens.value + (now - self._updated.value) * self._rate,
+            )
+            self._updated.value = now
+
+            if tokens >= 1:
+                self._tokens.value = tokens - 1
+                return 0
+
+            self._tokens.value = tokens
+
+            return (1 - tokens) / self._rate
+
+    async def acquire(self) -> None:
+        """Ожидание разрешения на запрос."""
+
+        while delay := self._take():
+            await asyncio.sleep(delay)
+
+
+class ConcurrencyLimiter:
+    """
+    Ограничитель количества одновременных запросов.
+
+    При заданном `max_limit` ограничение подстраивается по алгоритму AIMD:
+    растет на единицу за каждые `limit` успешных запросов и уменьшается вдвое
+    при ошибках или превышении целевой задержки.
+    """
+
+    _limit: float
+    _min_limit: int
+    _max_limit: int | None
+    _target_latency: float | None
+    _active: int
+    _cond: asyncio.Condition
+    _decreased: float
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        target_latency: float | None = None,
+    ) -> None:
+        """
+        Параметры:
+        - `limit`: начальное ограничение.
+        - `min_limit`: нижняя граница адаптивного ограничения.
+        - `max_limit`: верхняя граница адаптивного ограничения. По-умолчанию:
+        ограничение фиксировано.
+        - `target_latency`: целевая задержка ответа в секундах.
+        """
+
+        if not 1 <= min_limit <= limit <= (max_limit or limit):
+            raise ValueError("Invalid concurrency limits.")
+
+        self._limit = limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_latency = target_latency
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._decreased = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Текущее ограничение."""
+
+        return int(self._limit)
+
+    @property
+    def active(self) -> int:
+        """Количество выполняющихся запросов."""
+
+        return self._active
+
+    async def acquire(self) -> None:
+        """Ожидание свободного слота."""
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < int(self._limit))
+            self._active += 1
+
+    async def release(self, latency: float | None) -> None:
+        """
+        Освобождение слота.
+
+        Параметры:
+        - `latency`: задержка успешного ответа в секундах или `None` при
+        ошибке или перегрузке сервера.
+        """
+
+        async with self._cond:
+            self._active -= 1
+
+            if self._max_limit is not None:
+                self._adapt(latency)
+
+            self._cond.notify_all()
+
+    def _adapt(self, latency: float | None) -> None:
+        target = self._target_latency
+
+        if latency is not None and (target is None or latency <= target):
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            return
+
+        # Не чаще одного уменьшения за период целевой задержки
+        now = time.monotonic()
+
+        if now - self._decreased >= (target or latency or 0):
+            self._limit = max(self._min_limit, self._limit / 2)
+            self._decreased = now
+
+
+@dc.dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Параметры повторных запросов."""
+
+    attempts: int = 3
+    """Максимальное количество повторов."""
+    base_delay: float = 0.5
+    """Базовая задержка в секундах."""
+    max_delay: float = 30.0
+    """Максимальная задержка в секундах."""
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    """Статусы HTTP, требующие повтора."""
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Задержка перед повтором: экспоненциальная со случайным разбросом или
+        по заголовку `Retry-After`, если он задан.
+        """
+
+        if retry_after and (x := _parse_retry_after(retry_after)) is not None:
+            return min(self.max_delay, x)
+
+        x = min(self.max_delay, self.base_delay * 2**attempt)
+
+        return random.uniform(0, x)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Разбор заголовка `Retry-After` (секунды или дата HTTP)."""
+
+    try:
+        return max(0.0, float(value))
+
+    except ValueError:
+        pass
+
+    try:
+        x = email.utils.parsedate_to_datetime(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, x.timestamp() - time.time())
@@ -0,0 +1,67 @@
+import dataclasses as dc
+import importlib.util
+
+import aiohttp
+
+_HAS_BROTLI = any(
+    importlib.util.find_spec(x) is not None for x in ("brotli", "brotlicffi")
+)
+
+
+@dc.dataclass(frozen=True, slots=True)
+class TransportOptions:
+    """Параметры транспорта HTTP клиента."""
+
+    limit_per_host: int = 32
+    """Ограничение количества соединений с сервером."""
+    keepalive_timeout: float = 60.0
+    """Время удержания неактивного соединения в секундах."""
+    dns_cache_ttl: int | None = 600
+    """Время кэширования адресов DNS в секундах (`None`: без ограничения)."""
+    connect_timeout: float | None = 10.0
+    """Ограничение времени установки соединения в секундах."""
+    read_timeout: float | None = 30.0
+    """Ограничение времени ожидания данных в секундах."""
+    compress: bool = True
+    """Запрос сжатых ответов (gzip, deflate и brotli при наличии)."""
+    prewarm: int = 0
+    """Количество соединений, открываемых при входе в контекст клиента."""
+
+    def headers(self) -> dict[str, str]:
+        """Заголовки запросов по-умолчанию."""
+
+        if not self.compress:
+            encoding = "identity"
+
+        elif _HAS_BROTLI:
+            encoding = "gzip, deflate, br"
+
+        else:
+            encoding = "gzip, deflate"
+
+        return {aiohttp.hdrs.ACCEPT_ENCODING: encoding}
+
+    def session(
+        self, trace_configs: list[aiohttp.TraceConfig] | None = None
+    ) -> aiohttp.ClientSession:
+        """Создание сессии с заданными параметрами."""
+
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=self.headers(),
+            trace_configs=trace_configs,
+        )
@@ -0,0 +1,347 @@
+"""
+Подписка на новые записи с адаптивным опросом.
+
+Изменения выборки определяются пробным запросом с малым `limit` в порядке
+`сначала последние`: сравниваются общее количество записей, идентификатор и
+время изменения первой записи. Страницы запрашиваются только при изменении,
+до первой уже известной записи. Интервал опроса подстраивается под
+наблюдаемую частоту появления записей. Подписки с одинаковым запросом
+используют общий опрос.
+
+Запросы опроса выполняются в обход зеркала, кэша и объединения запросов
+клиента (`fresh=True`), поэтому кэш клиента не задерживает обнаружение.
+"""
+
+import asyncio
+import collections
+import dataclasses as dc
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from .common import Entity, Order
+from .query import Query
+
+if TYPE_CHECKING:
+    from .client import ZXArtClient
+
+_LOGGER = logging.getLogger(__name__)
+
+_SMOOTHING = 0.3
+"""Коэффициент экспоненциального сглаживания частоты записей"""
+
+
+@dc.dataclass(slots=True)
+class _State:
+    """Признаки состояния выборки по пробному запросу."""
+
+    total: int
+    """Общее количество записей"""
+    top: tuple[int, float] | None
+    """Идентификатор и время изменения первой записи"""
+
+
+def _state(total: int, items: list[Any]) -> _State:
+    if not items:
+        return _State(total, None)
+
+    x = items[0]
+
+    return _State(total, (x.id, x.modified.timestamp()))
+
+
+class _Poller:
+    """Опрос одного запроса с рассылкой новых записей подписчикам."""
+
+    _feed: "ChangeFeed"
+    _query: Query
+    _queues: set[asyncio.Queue[list[Any]]]
+    _seen: collections.OrderedDict[int, None]
+    _state: _State | None
+    _task: asyncio.Task[None] | None
+
+    interval: float
+    """Текущий интервал опроса, с"""
+    rate: float
+    """Сглаженная частота появления записей, 1/с"""
+
+    def __init__(self, feed: "ChangeFeed", query: Query) -> None:
+        self._feed = feed
+        self._query = query
+        self._queues = set()
+        self._seen = collections.OrderedDict()
+        self._state = None
+        self._task = None
+        self.interval = feed.min_interval
+        # Опрос начинается с минимальным интервалом
+        self.rate = feed.target / feed.min_interval
+
+    def subscribe(self) -> asyncio.Queue[list[Any]]:
+        queue: asyncio.Queue[list[Any]] = asyncio.Queue()
+        self._queues.add(queue)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[list[Any]]) -> bool:
+        """Отписка. Возвращает `True`, если подписчиков не осталось."""
+
+        self._queues.discard(queue)
+
+        if self._queues:
+            return False
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        return True
+
+    def _remember(self, items: list[Any]) -> None:
+        seen, size = self._seen, self._feed.history
+
+        for x in items:
+            seen[x.id] = None
+            seen.move_to_end(x.id)
+
+        while len(seen) > size:
+            seen.popitem(last=False)
+
+    async def _fetch(self) -> list[Any]:
+        """Записи до первой известной, начиная с самой старой."""
+
+        client, feed = self._feed.client, self._feed
+        result: list[Any] = []
+
+        for page in range(feed.max_pages):
+            r = await client.run(
+                self._query,
+                start=page * feed.page_size,
+                limit=feed.page_size,
+                fresh=True,
+            )
+            new = [x for x in r.result if x.id not in self._seen]
+            result += new
+
+            if len(new) < len(r.result) or len(r.result) < feed.page_size:
+                break
+
+        else:
+            _LOGGER.warning(
+                "Watch %s: more than %d new pages, rest skipped",
+                self._query.entity,
+                feed.max_pages,
+            )
+
+        result.reverse()
+
+        return result
+
+    async def _poll(self) -> tuple[list[Any], _State]:
+        """
+        Пробный запрос и, при изменении выборки, запрос новых записей.
+        Возвращает новые записи и состояние выборки, которое сохраняется
+        после рассылки записей: при ошибке запроса страниц изменение будет
+        обнаружено следующим опросом.
+        """
+
+        feed, prev = self._feed, self._state
+
+        # Первый опрос запрашивает страницу: ее записи считаются известными
+        # и ограничивают запрос страниц при удалении первой записи
+        size = feed.page_size if prev is None else feed.probe_size
+        r = await feed.client.run(self._query, limit=size, fresh=True)
+        state = _state(r.total, r.result)
+
+        if prev is None:
+            self._remember(r.result)
+            return [], state
+
+        # Новая запись меняет первую позицию, рост количества без смены
+        # первой записи означает запись, загруженную с более ранней датой
+        if state.top == prev.top and state.total <= prev.total:
+            return [], state
+
+        if all(x.id in self._seen for x in r.result) and (
+            state.total <= prev.total
+        ):
+            # Изменилась только первая известная запись
+            return [], state
+
+        items = await self._fetch()
+        self._remember(items)
+
+        return items, state
+
+    def _adapt(self, count: int, elapsed: float) -> None:
+        """Интервал, при котором в среднем ожидается `target` записей."""
+
+        feed = self._feed
+
+        if elapsed > 0:
+            self.rate += _SMOOTHING * (count / elapsed - self.rate)
+
+        if self.rate > 0:
+            interval = feed.target / self.rate
+
+        else:
+            interval = feed.max_interval
+
+        self.interval = min(max(interval, feed.min_interval), feed.max_interval)
+
+    async def _loop(self) -> None:
+        feed, errors = self._feed, 0
+        t = time.monotonic()
+
+        while True:
+            try:
+                items, state = await self._poll()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as exc:
+                errors += 1
+                delay = min(feed.min_interval * 2**errors, feed.max_interval)
+                _LOGGER.warning(
+                    "Watch %s poll error: %s. Retry in %.1f s",
+                    self._query.entity,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            errors, now = 0, time.monotonic()
+            self._adapt(len(items), now - t)
+            t = now
+
+            if items:
+                _LOGGER.debug(
+                    "Watch %s: %d new items", self._query.entity, len(items)
+                )
+
+                for queue in self._queues:
+                    queue.put_nowait(items)
+
+            self._state = state
+            await asyncio.sleep(self.interval)
+
+
+class ChangeFeed:
+    """Подписки на новые записи с общими опросами одинаковых запросов."""
+
+    _pollers: dict[Query, _Poller]
+
+    client: "ZXArtClient"
+    """Клиент API"""
+    min_interval: float
+    """Минимальный интервал опроса, с"""
+    max_interval: float
+    """Максимальный интервал опроса, с"""
+    target: float
+    """Ожидаемое количество новых записей за интервал опроса"""
+    probe_size: int
+    """Количество записей пробного запроса"""
+    page_size: int
+    """Количество записей страницы при изменении выборки"""
+    max_pages: int
+    """Наибольшее количество страниц за один опрос"""
+    history: int
+    """Количество запоминаемых идентификаторов записей"""
+
+    def __init__(
+        self,
+        client: "ZXArtClient",
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 120.0,
+        target: float = 0.5,
+        probe_size: int = 1,
+        page_size: int | None = None,
+        max_pages: int = 10,
+        history: int = 10_000,
+    ) -> None:
+        """
+        Параметры:
+        - `client`: клиент API.
+        - `min_interval`: минимальный интервал опроса, с.
+        - `max_interval`: максимальный интервал опроса, с.
+        - `target`: ожидаемое количество новых записей за интервал опроса.
+        - `probe_size`: количество записей пробного запроса.
+        - `page_size`: количество записей страницы. По-умолчанию: из клиента.
+        - `max_pages`: наибольшее количество страниц за один опрос.
+        - `history`: количество запоминаемых идентификаторов записей.
+        """
+
+        self._pollers = {}
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target = target
+        self.probe_size = probe_size
+        self.page_size = page_size or client.limit
+        self.max_pages = max_pages
+        self.history = max(history, self.page_size * max_pages)
+
+    def __len__(self) -> int:
+        """Количество активных опросов."""
+
+        return len(self._pollers)
+
+    async def watch(self, entity: Entity, **filters: Any) -> AsyncIterator[Any]:
+        """
+        Асинхронный итератор новых записей выборки, начиная с самой старой.
+        Записи, существующие на момент первого опроса, не возвращаются.
+
+        Параметры:
+        - `entity`: сущность.
+        - `filters`: фильтры запроса, как в методе `api`. Сортировка всегда
+        `Order.MOST_RECENT`.
+        """
+
+        filters["order"] = Order.MOST_RECENT
+        filters.pop("start", None)
+        filters.pop("limit", None)
+        query = self.client.compile(entity, **filters)
+
+        if (poller := self._pollers.get(query)) is None:
+            poller = self._pollers[query] = _Poller(self, query)
+
+        queue = poller.subscribe()
+
+        try:
+            while True:
+                for x in await queue.get():
+                    yield x
+
+        finally:
+            if poller.unsubscribe(queue):
+                self._pollers.pop(query, None)
+
+
+_FEEDS: weakref.WeakKeyDictionary["ZXArtClient", ChangeFeed] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def watch(
+    client: "ZXArtClient", entity: Entity, **filters: Any
+) -> AsyncIterator[Any]:
+    """
+    Асинхронный итератор новых записей выборки с общими для клиента опросами
+    и параметрами `ChangeFeed` по-умолчанию.
+
+    Параметры:
+    - `client`: клиент API.
+    - `entity`: сущность.
+    - `filters`: фильтры запроса, как в методе `api`.
+    """
+
+    if (feed := _FEEDS.get(client)) is None:
+        feed = _FEEDS[client] = ChangeFeed(client)
+
+    return feed.watch(entity, **filters)
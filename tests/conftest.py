@@ -0,0 +1,30 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Локальный сервер API общий с бенчмарками
+sys.path.insert(0, str(Path(__file__).parents[1] / "benchmarks"))
+
+from server import MockServer  # noqa: E402
+
+import zxart.query  # noqa: E402
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """
+    Выполнение тестовой сопрограммы `test(server)` с локальным сервером API,
+    на который направлены запросы клиента. Параметры: как у `MockServer`.
+    """
+
+    def run(test, **options):
+        async def main():
+            async with MockServer(**options) as server:
+                monkeypatch.setattr(zxart.query, "_BASE_URL", server.url)
+                return await test(server)
+
+        return asyncio.run(main())
+
+    return run
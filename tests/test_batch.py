@@ -0,0 +1,114 @@
+import asyncio
+
+import zxart.client
+from zxart.client import ZXArtClient, _chunk_ids
+
+
+def test_lookup(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await cli.tunes([3, 1, 2, 1])
+
+        assert server.requests == 1
+        assert sorted(r) == [1, 2, 3]
+        assert all(k == v.id for k, v in r.items())
+
+    serve(test)
+
+
+def test_lookup_chunks(serve):
+    async def test(server):
+        ids = list(range(1, 1001))
+
+        async with ZXArtClient() as cli:
+            r = await cli.images(ids)
+
+        chunks = list(_chunk_ids(ids, zxart.client._MAX_IDS_LENGTH))
+
+        assert len(chunks) > 1
+        assert server.requests == len(chunks)
+        assert sorted(r) == ids
+
+    serve(test)
+
+
+def test_lookup_missing(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await cli.tunes([1, 2, 50])
+
+        assert sorted(r) == [1, 2]
+
+    serve(test, total=10)
+
+
+def test_identity_disabled(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            await cli.tunes([1, 2])
+            await cli.tunes([1, 2])
+
+        assert server.requests == 2
+
+    serve(test)
+
+
+def test_identity_ttl(serve):
+    async def test(server):
+        async with ZXArtClient(identity_ttl=0.1) as cli:
+            a = await cli.tunes([1, 2])
+            b = await cli.tunes([2, 3])
+
+            assert a[2] is b[2]
+            assert server.requests == 2
+
+            await asyncio.sleep(0.15)
+            await cli.tunes([1])
+
+            assert server.requests == 3
+
+            cli.forget()
+            await cli.tunes([1])
+
+        assert server.requests == 4
+
+    serve(test)
+
+
+def test_identity_size(serve, monkeypatch):
+    monkeypatch.setattr(zxart.client, "_MAX_IDENTITY_SIZE", 2)
+
+    async def test(server):
+        async with ZXArtClient(identity_ttl=60) as cli:
+            await cli.tunes([1, 2, 3])
+            await cli.tunes([2, 3])
+
+            assert server.requests == 1
+
+            await cli.tunes([1])
+
+        assert server.requests == 2
+
+    serve(test)
+
+
+def test_auto_batch(serve):
+    async def test(server):
+        async with ZXArtClient(auto_batch=True) as cli:
+            r = await asyncio.gather(*(cli.author(x) for x in (1, 2, 3, 50)))
+
+        assert server.requests == 1
+        assert [x and x.id for x in r] == [1, 2, 3, None]
+
+    serve(test, total=10)
+
+
+def test_auto_batch_loop_iterations(serve):
+    async def test(server):
+        async with ZXArtClient(auto_batch=True) as cli:
+            await cli.author(1)
+            await cli.author(2)
+
+        assert server.requests == 2
+
+    serve(test)
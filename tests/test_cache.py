@@ -0,0 +1,82 @@
+import pytest
+
+import zxart.client
+from zxart.cache import MemoryCache
+from zxart.client import ZXArtApiError, ZXArtClient
+from zxart.common import Entity
+
+
+def test_cache_hit(serve):
+    async def test(server):
+        async with ZXArtClient(cache=MemoryCache()) as cli:
+            a = await cli.api(Entity.TUNE, limit=10)
+            b = await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 1
+        assert cli.cache_stats.hits == 1
+        assert cli.cache_stats.misses == 1
+        assert [x.id for x in a.result] == [x.id for x in b.result]
+
+    serve(test)
+
+
+def test_cache_key(serve):
+    async def test(server):
+        async with ZXArtClient(cache=MemoryCache()) as cli:
+            await cli.api(Entity.TUNE, limit=10)
+            await cli.api(Entity.TUNE, limit=10, start=10)
+            await cli.api(Entity.IMAGE, limit=10)
+
+        assert server.requests == 3
+        assert cli.cache_stats.hits == 0
+
+    serve(test)
+
+
+def test_revalidation(serve):
+    async def test(server):
+        async with ZXArtClient(cache=MemoryCache(), cache_ttl=0) as cli:
+            a = await cli.api(Entity.TUNE, limit=10)
+            b = await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 2
+        assert server.not_modified == 1
+        assert cli.cache_stats.revalidations == 1
+        assert [x.id for x in a.result] == [x.id for x in b.result]
+
+    serve(test, etag=True)
+
+
+def test_errors_not_cached(serve):
+    async def test(server):
+        server.faults.append(500)
+
+        async with ZXArtClient(cache=MemoryCache()) as cli:
+            with pytest.raises(ZXArtApiError):
+                await cli.api(Entity.TUNE, limit=10)
+
+            r = await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 2
+        assert len(r.result) == 10
+
+    serve(test)
+
+
+def test_single_parse(serve, monkeypatch):
+    calls = []
+    decode = zxart.client._decode_json
+
+    def decode_json(entity, body):
+        calls.append(entity)
+        return decode(entity, body)
+
+    monkeypatch.setattr(zxart.client, "_decode_json", decode_json)
+
+    async def test(server):
+        async with ZXArtClient(cache=MemoryCache()) as cli:
+            await cli.api(Entity.TUNE, limit=10)
+
+        assert calls == [Entity.TUNE]
+
+    serve(test)
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from zxart.client import ZXArtClient
+from zxart.common import Entity
+
+
+def test_coalesce(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            results = await asyncio.gather(
+                *(cli.api(Entity.TUNE, limit=10) for _ in range(5))
+            )
+
+        assert server.requests == 1
+        assert cli.coalesced == 4
+        assert len({tuple(x.id for x in r.result) for r in results}) == 1
+
+    serve(test, latency=0.05)
+
+
+def test_coalesce_disabled(serve):
+    async def test(server):
+        async with ZXArtClient(coalesce=False) as cli:
+            await asyncio.gather(
+                *(cli.api(Entity.TUNE, limit=10) for _ in range(5))
+            )
+
+        assert server.requests == 5
+        assert cli.coalesced == 0
+
+    serve(test, latency=0.05)
+
+
+def test_cancel_waiter(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            a = asyncio.create_task(cli.api(Entity.TUNE, limit=10))
+            b = asyncio.create_task(cli.api(Entity.TUNE, limit=10))
+            await asyncio.sleep(0.05)
+            a.cancel()
+            r = await b
+
+        assert a.cancelled()
+        assert len(r.result) == 10
+        assert server.requests == 1
+
+    serve(test, latency=0.2)
+
+
+def test_cancel_all_waiters(serve):
+    async def test(server):
+        async with ZXArtClient(max_concurrency=1) as cli:
+            tasks = [
+                asyncio.create_task(cli.api(Entity.TUNE, limit=10))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.1)
+
+            for x in tasks:
+                x.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            assert not cli._inflight
+
+            # Отмененный общий запрос освобождает место ограничителя
+            t = time.monotonic()
+            await cli.api(Entity.IMAGE, limit=10)
+            elapsed = time.monotonic() - t
+
+        assert elapsed < 1.5
+
+    serve(test, latency=1.0)
@@ -0,0 +1,100 @@
+import asyncio
+import queue
+import threading
+
+import orjson
+import pytest
+from server import MockServer
+
+import zxart.query
+from zxart.__main__ import cli
+from zxart.common import Entity
+from zxart.crawl import Partition, _crawl, plan
+
+_ENTITIES = (Entity.TUNE, Entity.IMAGE)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Сервер в отдельном потоке: `plan` выполняет собственный цикл событий."""
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = MockServer(total=1000)
+    asyncio.run_coroutine_threadsafe(server.__aenter__(), loop).result()
+    monkeypatch.setattr(zxart.query, "_BASE_URL", server.url)
+
+    yield server
+
+    asyncio.run_coroutine_threadsafe(
+        server.__aexit__(None, None, None), loop
+    ).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def _run(partitions):
+    """Обход частей в текущем процессе. Возвращает записи по сущностям."""
+
+    results = queue.Queue()
+
+    for x in partitions:
+        asyncio.run(_crawl(x, results, {}))
+
+    items = {x: [] for x in _ENTITIES}
+
+    while not results.empty():
+        kind, entity, _, lines = results.get()
+
+        assert kind == "items"
+        items[entity] += map(orjson.loads, lines.split(b"\n"))
+
+    return items
+
+
+def test_plan_entity():
+    assert plan(_ENTITIES) == [Partition(x) for x in _ENTITIES]
+
+
+def test_plan_years():
+    r = plan([Entity.TUNE], split="years", years=range(1990, 1993))
+
+    assert r == [
+        Partition(Entity.TUNE, {"years": y}) for y in (1990, 1991, 1992)
+    ]
+
+    with pytest.raises(ValueError):
+        plan([Entity.TUNE], split="years")
+
+
+def test_plan_offset(server):
+    r = plan([Entity.TUNE], split="offset", parts=3)
+
+    # Границы частей кратны размеру страницы
+    assert [(x.start, x.stop) for x in r] == [(0, 360), (360, 720), (720, 1000)]
+
+
+@pytest.mark.parametrize("split", ["entity", "offset"])
+def test_crawl(server, split):
+    partitions = plan(_ENTITIES, split=split, parts=3)
+    server.requests = 0
+    items = _run(partitions)
+
+    for entity, x in items.items():
+        ids = [y["id"] for y in x]
+
+        assert sorted(ids) == list(range(1, 1001))
+        assert all(y["entity"] == entity for y in x)
+
+    # Каждая страница запрашивается один раз: 17 страниц на сущность
+    assert server.requests == 2 * 17
+
+
+def test_cli_years_required(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli(["crawl", "tune", "--split", "years", "-o", "-"])
+
+    assert exc.value.code == 2
+    assert "--years" in capsys.readouterr().err
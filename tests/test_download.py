@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+
+import pytest
+from aiohttp import web
+
+import zxart.download
+from zxart.client import ZXArtClient
+from zxart.download import Downloader
+
+_DATA = bytes(range(256)) * 1024
+
+
+def _run(test, tmp_path):
+    requests = []
+
+    async def handle(request):
+        requests.append(request.headers.get("Range"))
+
+        if (r := request.headers.get("Range")) is not None:
+            offset = int(r.removeprefix("bytes=").removesuffix("-"))
+
+            if offset >= len(_DATA):
+                return web.Response(status=416)
+
+            return web.Response(status=206, body=_DATA[offset:])
+
+        return web.Response(body=_DATA)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{name}", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        try:
+            async with ZXArtClient() as cli:
+                downloader = Downloader(cli, tmp_path)
+
+                try:
+                    await test(downloader, f"http://127.0.0.1:{port}", requests)
+
+                finally:
+                    downloader.close()
+
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def _part(tmp_path, url):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return tmp_path / "partial" / f"{key}.part"
+
+
+def test_download(tmp_path):
+    async def test(downloader, base, requests):
+        urls = [f"{base}/{i}.scr" for i in range(3)]
+        r = [x async for x in downloader.download_all(urls + urls[:1])]
+
+        assert len(r) == 3
+        assert {x.status for x in r} == {"downloaded"}
+        assert r[0].path.read_bytes() == _DATA
+
+        r = await downloader.download(urls[0])
+
+        assert r.status == "skipped"
+        assert downloader.path(urls[0]) == r.path
+        assert len(requests) == 3
+
+    _run(test, tmp_path)
+
+
+def test_resume(tmp_path):
+    async def test(downloader, base, requests):
+        url = f"{base}/1.scr"
+        _part(tmp_path, url).write_bytes(_DATA[:1000])
+        r = await downloader.download(url)
+
+        assert r.path.read_bytes() == _DATA
+        assert requests == ["bytes=1000-"]
+
+    _run(test, tmp_path)
+
+
+def test_range_not_satisfiable(tmp_path):
+    async def test(downloader, base, requests):
+        url = f"{base}/1.scr"
+        _part(tmp_path, url).write_bytes(_DATA + b"x")
+        r = await downloader.download(url)
+
+        assert r.status == "downloaded"
+        assert r.path.read_bytes() == _DATA
+        assert requests == [f"bytes={len(_DATA) + 1}-", None]
+
+    _run(test, tmp_path)
+
+
+def test_unexpected_error(tmp_path, monkeypatch):
+    def fail(url, content_type):
+        raise ValueError(url)
+
+    monkeypatch.setattr(zxart.download, "_suffix", fail)
+
+    async def test(downloader, base, requests):
+        with pytest.raises(ValueError):
+            async for _ in downloader.download_all([f"{base}/1.scr"]):
+                pass
+
+        assert downloader.stats.failed == 1
+
+    _run(test, tmp_path)
@@ -0,0 +1,181 @@
+import asyncio
+import datetime as dt
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import zxart.facets
+from zxart.common import Entity
+from zxart.facets import FacetCounter, facet_values
+from zxart.query import compile_query
+
+_FORMATS = ("PT3", "STC", "ASC")
+
+_TUNES = [
+    {"years": 1990 + x % 5, "format": _FORMATS[x % 7 % 3], "tags_include": "AY"}
+    for x in range(200)
+]
+"""Записи выборки: значения фильтров, записей 1989 года и формата `SQT` нет"""
+
+
+class _Client:
+    """Клиент с подсчетом записей `_TUNES`, удовлетворяющих фильтрам."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self.active = self.max_active = 0
+
+    def compile(self, entity, **filters):
+        return compile_query(entity, **filters)
+
+    async def run(self, query, *, limit):
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+
+        try:
+            await asyncio.sleep(self.latency)
+
+        finally:
+            self.active -= 1
+
+        return SimpleNamespace(total=_count(dict(query.params)))
+
+
+def _count(filters):
+    return sum(
+        all(x[k] == v for k, v in filters.items() if k in x) for x in _TUNES
+    )
+
+
+def test_histogram():
+    async def test():
+        counter = FacetCounter(_Client())
+        r = await counter.histogram(Entity.TUNE, "years", range(1989, 1995))
+
+        assert r == {x: _count({"years": x}) for x in range(1989, 1995)}
+        assert r[1989] == 0
+
+        r = await counter.histogram(Entity.TUNE, "format", years=1991)
+
+        assert tuple(r) == facet_values(Entity.TUNE, "format")
+        assert r == {x: _count({"format": x, "years": 1991}) for x in r}
+        assert sum(r.values()) == _count({"years": 1991})
+
+    asyncio.run(test())
+
+
+def test_crosstab():
+    async def test():
+        client = _Client()
+        counter = FacetCounter(client)
+        years = range(1989, 1995)
+        r = await counter.crosstab(
+            Entity.TUNE,
+            {"years": years, "format": _FORMATS + ("SQT",)},
+            tags_include="AY",
+        )
+
+        expected = {
+            (y, f): n
+            for y in years
+            for f in _FORMATS
+            if (n := _count({"years": y, "format": f}))
+        }
+
+        assert r == expected
+        # Сочетания с нулевым значением фасета (1989, SQT) не запрашиваются
+        assert client.requests == len(years) + 4 + 5 * 3
+        assert counter.probes == client.requests
+
+        r = await counter.crosstab(Entity.TUNE, {"years": years})
+
+        assert r == {(y,): _count({"years": y}) for y in range(1990, 1995)}
+
+    asyncio.run(test())
+
+
+def test_cache(monkeypatch):
+    async def test():
+        client = _Client()
+        counter = FacetCounter(client)
+
+        assert await counter.count(Entity.TUNE, years=1990) == 40
+        assert await counter.count(Entity.TUNE, years=1990) == 40
+        # Одинаковые фильтры в другом порядке: тот же запрос
+        await counter.count(Entity.TUNE, format="PT3", years=1990)
+        await counter.count(Entity.TUNE, years=1990, format="PT3")
+
+        assert client.requests == counter.probes == 2
+
+        counter.clear()
+        await counter.count(Entity.TUNE, years=1990)
+
+        assert client.requests == 3
+
+        expired = FacetCounter(client, ttl=0.0)
+        await expired.count(Entity.TUNE, years=1990)
+        await expired.count(Entity.TUNE, years=1990)
+
+        assert client.requests == 5
+
+        monkeypatch.setattr(zxart.facets, "_CACHE_SIZE", 2)
+        counter.clear()
+
+        for x in (1990, 1991, 1992, 1990):
+            await counter.count(Entity.TUNE, years=x)
+
+        # Вытеснен самый давний результат
+        assert client.requests == 9
+
+    asyncio.run(test())
+
+
+def test_concurrency():
+    async def test():
+        client = _Client(latency=0.01)
+        counter = FacetCounter(client, concurrency=3)
+        await counter.histogram(Entity.TUNE, "years", range(1980, 2000))
+
+        assert client.max_active == 3
+
+    asyncio.run(test())
+
+
+def test_facet_values():
+    years = facet_values(Entity.IMAGE, "years")
+
+    assert years[0] == 1982
+    assert years[-1] == dt.date.today().year
+    assert "PT3" in facet_values(Entity.TUNE, "format")
+    assert "gigascreen" in facet_values(Entity.IMAGE, "type")
+
+    with pytest.raises(ValueError):
+        facet_values(Entity.TUNE, "tags_include")
+
+
+def test_random_filters():
+    """Сравнение перекрестной таблицы с прямым подсчетом."""
+
+    rnd = random.Random(0)
+
+    async def test():
+        counter = FacetCounter(_Client())
+
+        for _ in range(5):
+            years = rnd.sample(range(1988, 1996), 4)
+            formats = rnd.sample(_FORMATS, 2)
+            r = await counter.crosstab(
+                Entity.TUNE, {"format": formats, "years": years}
+            )
+
+            assert r == {
+                (f, y): n
+                for f in formats
+                for y in years
+                if (n := _count({"years": y, "format": f}))
+            }
+
+    asyncio.run(test())
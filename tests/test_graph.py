@@ -0,0 +1,141 @@
+import asyncio
+import collections
+import contextlib
+
+from zxart.client import ZXArtClient
+from zxart.graph import expand, profiles
+
+
+def test_expand(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            edges = [x async for x in expand(cli, [1, 2], depth=3)]
+
+        media = [x for x in edges if x.relation in ("tune", "image")]
+        # Сервер выдает все записи без фильтра по автору
+        assert {(x.author_id, x.relation) for x in media} >= {
+            (1, "tune"),
+            (1, "image"),
+            (2, "tune"),
+            (2, "image"),
+        }
+        assert len(media) == 10 * len(
+            {(x.author_id, x.relation) for x in media}
+        )
+
+        # Авторы следующего уровня: соавторы работ предыдущего
+        levels = collections.defaultdict(set)
+
+        for x in media:
+            levels[x.depth].add(x.author_id)
+
+        assert levels[0] == {1, 2}
+
+        for d in (1, 2):
+            coauthors = {
+                y for x in media if x.depth == d - 1 for y in x.item.author_ids
+            }
+            assert levels[d] == coauthors - set().union(
+                *map(levels.get, range(d))
+            )
+
+        # Каждый автор раскрывается однократно
+        depths = collections.defaultdict(set)
+
+        for x in edges:
+            depths[x.author_id].add(x.depth)
+
+        assert all(len(x) == 1 for x in depths.values())
+
+        authors = [x.item.id for x in edges if x.relation == "author"]
+        assert len(authors) == len(set(authors))
+
+        # Одна и та же запись для всех авторов и уровней — один объект
+        shared = {}
+
+        for x in media:
+            assert shared.setdefault((x.relation, x.item.id), x.item) is x.item
+
+    serve(test, total=10)
+
+
+def test_aliases(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            edges = [
+                x async for x in expand(cli, [1, 2, 3], relations=["alias"])
+            ]
+
+        authors = {x.item.id: x.item for x in edges if x.relation == "author"}
+        aliases = collections.defaultdict(set)
+
+        for x in edges:
+            if x.relation == "alias":
+                aliases[x.author_id].add(x.item.id)
+
+        assert authors.keys() == {1, 2, 3}
+        assert {
+            k: set(v.aliases) for k, v in authors.items() if v.aliases
+        } == aliases
+        # Запросы авторов и псевдонимов без запросов работ
+        assert server.requests == 2
+
+    serve(test)
+
+
+def test_concurrency(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            n = sum([1 async for _ in expand(cli, range(1, 9), concurrency=2)])
+
+        assert n > 0
+        assert server.max_active == 2
+
+    serve(test, total=10, latency=0.01)
+
+
+def test_break(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            it = expand(cli, range(1, 9), depth=2, concurrency=2)
+
+            async with contextlib.aclosing(it):
+                async for _ in it:
+                    break
+
+            # Запросы уровня отменены
+            assert not [
+                x
+                for x in asyncio.all_tasks()
+                if x.get_coro().__qualname__.startswith("expand.")
+            ]
+
+            n = server.requests
+            await asyncio.sleep(0.1)
+
+        assert n < 17
+        assert server.requests == n
+
+    serve(test, total=10, latency=0.05)
+
+
+def test_profiles(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await profiles(cli, [1, 2, 20])
+
+        assert r.keys() == {1, 2, 20}
+        assert r[1].author is not None and r[1].author.id == 1
+        assert sorted(x.id for x in r[1].tunes) == list(range(1, 11))
+        assert sorted(x.id for x in r[2].images) == list(range(1, 11))
+        assert [x.id for x in r[1].aliases] == [
+            x for x in r[1].author.aliases or () if x <= 10
+        ]
+
+        # Отсутствующий автор: связанные записи без автора
+        assert r[20].author is None
+
+        tunes = {x.id: x for x in r[1].tunes}
+        assert all(tunes[x.id] is x for x in r[2].tunes)
+
+    serve(test, total=10)
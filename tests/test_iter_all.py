@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from zxart.client import ZXArtClient
+from zxart.common import Entity
+
+
+def test_order(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            ids = [x.id async for x in cli.iter_all(Entity.TUNE, concurrency=4)]
+
+        # Сортировка по-умолчанию: сначала последние
+        assert ids == list(range(250, 0, -1))
+        assert server.requests == 5
+
+    # Случайная задержка меняет порядок завершения запросов страниц
+    serve(test, total=250, latency=0.01)
+
+
+def test_start_limit(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await cli.fetch_all(Entity.TUNE, start=10, limit=25)
+
+        assert [x.id for x in r] == list(range(90, 0, -1))
+        assert server.requests == 4
+
+    serve(test, total=100)
+
+
+def test_concurrency(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await cli.fetch_all(Entity.TUNE, concurrency=2)
+
+            assert len(r) == 600
+            assert server.max_active == 2
+
+            with pytest.raises(ValueError):
+                await cli.fetch_all(Entity.TUNE, concurrency=0)
+
+    serve(test, total=600, latency=0.02)
+
+
+def test_break(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            it = cli.iter_all(Entity.TUNE, concurrency=4)
+
+            async with contextlib.aclosing(it):
+                async for x in it:
+                    # Первая запись второй страницы
+                    if x.id == 940:
+                        break
+
+            # Запросы страниц предвыборки отменены
+            assert not [
+                x
+                for x in asyncio.all_tasks()
+                if x.get_coro().__qualname__.startswith("ZXArtClient.")
+            ]
+
+            n = server.requests
+            await asyncio.sleep(0.1)
+
+        # Первая страница и не более `concurrency + 1` страниц предвыборки
+        assert n <= 6
+        assert server.requests == n
+
+    serve(test, total=1000, latency=0.05)
+
+
+def test_shrink(serve):
+    async def test(server):
+        ids = []
+
+        async with ZXArtClient() as cli:
+            async for x in cli.iter_all(Entity.TUNE, concurrency=1):
+                ids.append(x.id)
+
+                if x.id == 241:
+                    server.total = 100
+
+        # Следующая страница содержит записи со смещения 60 сокращенной
+        # выборки, затем выборка заканчивается
+        assert ids == list(range(300, 240, -1)) + list(range(40, 0, -1))
+
+    serve(test, total=300)
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "requests"),
+    [(0, 120, 2), (30, 100, 2), (50, 60, 1), (900, 2000, 2), (60, 60, 0)],
+)
+def test_stop(serve, start, stop, requests):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await cli.fetch_all(Entity.TUNE, start=start, stop=stop)
+
+        ids = list(range(1000, 0, -1))[start:stop]
+
+        assert [x.id for x in r] == ids
+        # Страницы за конечным смещением не запрашиваются
+        assert server.requests == requests
+
+    serve(test, total=1000)
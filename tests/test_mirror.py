@@ -0,0 +1,165 @@
+import asyncio
+import gc
+import sqlite3
+
+import pytest
+from payloads import ITEMS
+
+from zxart.client import ZXArtApiError, ZXArtClient
+from zxart.common import Entity, Language, Order
+from zxart.mirror import Mirror
+from zxart.sync import sync
+
+
+async def _mirror(cli, entity=Entity.TUNE):
+    mirror = Mirror()
+    await sync(cli, entity, mirror)
+
+    return mirror
+
+
+@pytest.mark.parametrize("entity", list(ITEMS))
+def test_round_trip(serve, entity):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            items = (await cli.api(entity, limit=50)).result
+
+        mirror = Mirror()
+        mirror.add(entity, items)
+        mirror.mark_complete(entity, Language.RUSSIAN)
+        r = mirror.query(entity, limit=100, order=Order.MOST_RECENT)
+
+        assert r.total == 50
+        assert sorted(r.result, key=lambda x: x.id) == sorted(
+            items, key=lambda x: x.id
+        )
+
+    serve(test, total=50)
+
+
+def test_complete(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            mirror = Mirror()
+            await sync(cli, Entity.TUNE, mirror, years=2000)
+
+            assert Entity.TUNE not in mirror
+
+            with pytest.raises(LookupError):
+                mirror.query(Entity.TUNE, limit=10, order=Order.MOST_RECENT)
+
+            await sync(cli, Entity.TUNE, mirror)
+
+        assert Entity.TUNE in mirror
+        assert mirror.language(Entity.TUNE) == Language.RUSSIAN
+
+    serve(test, total=100)
+
+
+def test_language(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            mirror = await _mirror(cli)
+
+        n = server.requests
+
+        async with ZXArtClient(mirror=mirror) as cli:
+            await cli.api(Entity.TUNE, limit=10)
+
+            assert server.requests == n
+
+            await cli.api(Entity.TUNE, limit=10, language=Language.ENGLISH)
+
+        assert server.requests == n + 1
+
+    serve(test, total=100)
+
+
+def test_offline_stream(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            mirror = await _mirror(cli)
+
+        n = server.requests
+
+        async with ZXArtClient(mirror=mirror, offline=True) as cli:
+            items = [x async for x in cli.stream(Entity.TUNE, limit=30)]
+
+            assert len(items) == 30
+            assert server.requests == n
+
+            with pytest.raises(ZXArtApiError):
+                async for _ in cli.stream(Entity.IMAGE):
+                    pass
+
+        assert server.requests == n
+
+    serve(test, total=100)
+
+
+def test_lookup(serve):
+    async def test(server):
+        async with ZXArtClient(limit=10) as cli:
+            mirror = await _mirror(cli)
+
+        n, server.total = server.requests, 100
+
+        async with ZXArtClient(mirror=mirror) as cli:
+            r = await cli.tunes([1, 2, 50])
+
+        assert sorted(r) == [1, 2, 50]
+        assert server.requests == n + 1
+
+    serve(test, total=10)
+
+
+def test_lookup_offline(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            mirror = await _mirror(cli)
+
+        n = server.requests
+
+        async with ZXArtClient(mirror=mirror, offline=True) as cli:
+            assert sorted(await cli.tunes([1, 2])) == [1, 2]
+
+            with pytest.raises(ZXArtApiError):
+                await cli.tunes([1, 2, 50])
+
+        assert server.requests == n
+
+    serve(test, total=10)
+
+
+def test_schema_upgrade(tmp_path):
+    path = str(tmp_path / "mirror.db")
+
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE entities (entity TEXT, updated REAL)")
+        db.execute("INSERT INTO entities VALUES (?, 0)", (Entity.TUNE,))
+
+    mirror = Mirror(path)
+
+    assert Entity.TUNE not in mirror
+
+    mirror.mark_complete(Entity.TUNE, Language.RUSSIAN)
+    mirror.close()
+
+    assert Entity.TUNE in Mirror(path)
+
+
+def test_offline_requires_mirror():
+    async def test():
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, x: errors.append(x["message"]))
+
+        with pytest.raises(ValueError):
+            ZXArtClient(offline=True)
+
+        # Незакрытая сессия сообщает об утечке при сборке мусора
+        gc.collect()
+
+        assert not errors
+
+    asyncio.run(test())
@@ -0,0 +1,68 @@
+import pytest
+
+import zxart.query
+from zxart.common import Entity, Language, Order
+from zxart.query import Query, compile_query
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    zxart.query._compile.cache_clear()
+
+
+def test_equal():
+    a = compile_query(Entity.TUNE, years=1999, author_id=5)
+    b = compile_query(Entity.TUNE, author_id=5, years=1999)
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a.url(60, 30) == b.url(60, 30)
+    assert len({a, b}) == 1
+
+
+def test_cached():
+    a = compile_query(Entity.TUNE, years=1999, author_id=5)
+    b = compile_query(Entity.TUNE, author_id=5, years=1999)
+
+    assert a is b
+    assert zxart.query._compile.cache_info().hits == 1
+
+
+def test_iterable_values():
+    a = compile_query(Entity.TUNE, years=[1999, 2000], tags_include={"AY"})
+    b = compile_query(Entity.TUNE, tags_include=("AY",), years=(1999, 2000))
+
+    assert a == b
+    assert a.url() == b.url()
+
+
+def test_not_equal():
+    a = compile_query(Entity.TUNE, years=1999)
+
+    assert a != compile_query(Entity.TUNE, years=2000)
+    assert a != compile_query(Entity.IMAGE, years=1999)
+    assert a != compile_query(
+        Entity.TUNE, years=1999, language=Language.ENGLISH
+    )
+
+
+def test_url_stable():
+    q = compile_query(
+        Entity.TUNE,
+        years=1999,
+        author_id=5,
+        order=Order.TOP_RATED,
+        language=Language.ENGLISH,
+    )
+    direct = Query(Entity.TUNE, tuple(reversed(q.params)))
+
+    assert direct == q
+    assert str(direct.url(0, 10)) == str(q.url(0, 10))
+    assert q.filters == {
+        "author_id": 5,
+        "language": Language.ENGLISH,
+        "order": Order.TOP_RATED,
+        "years": 1999,
+    }
+    assert str(q.url(0, 10)).endswith("/start:0/limit:10")
+    assert "filter:authorId=5;zxMusicYear=1999" in str(q.url())
@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from zxart.client import ZXArtApiError, ZXArtClient
+from zxart.common import Entity
+from zxart.throttle import ConcurrencyLimiter, RetryPolicy
+
+_RETRY = RetryPolicy(attempts=2, base_delay=0.01)
+
+
+def test_retry(serve):
+    async def test(server):
+        server.faults += [503, 502]
+
+        async with ZXArtClient(retry=_RETRY) as cli:
+            r = await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 3
+        assert len(r.result) == 10
+
+    serve(test)
+
+
+def test_retry_exhausted(serve):
+    async def test(server):
+        server.faults += [503] * 3
+
+        async with ZXArtClient(retry=_RETRY) as cli:
+            with pytest.raises(ZXArtApiError, match="503"):
+                await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 3
+
+    serve(test)
+
+
+@pytest.mark.parametrize("retry", [None, _RETRY])
+def test_no_retry(serve, retry):
+    async def test(server):
+        server.faults += [404 if retry else 503]
+
+        async with ZXArtClient(retry=retry) as cli:
+            with pytest.raises(ZXArtApiError):
+                await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 1
+
+    serve(test)
+
+
+def test_retry_after(serve):
+    async def test(server):
+        server.faults.append(429)
+        server.retry_after = "0.3"
+
+        async with ZXArtClient(retry=RetryPolicy(base_delay=0)) as cli:
+            t = time.monotonic()
+            await cli.api(Entity.TUNE, limit=10)
+
+        assert time.monotonic() - t >= 0.3
+        assert server.requests == 2
+
+    serve(test)
+
+
+def test_retry_after_max_delay(serve):
+    async def test(server):
+        server.faults.append(503)
+        server.retry_after = "100"
+
+        async with ZXArtClient(retry=RetryPolicy(max_delay=0.1)) as cli:
+            t = time.monotonic()
+            await cli.api(Entity.TUNE, limit=10)
+
+        assert time.monotonic() - t < 1
+
+    serve(test)
+
+
+def test_payload_error_retry(serve):
+    async def test(server):
+        server.faults.append(0)
+
+        async with ZXArtClient(retry=_RETRY) as cli:
+            r = await cli.api(Entity.TUNE, limit=10)
+
+        assert server.requests == 2
+        assert len(r.result) == 10
+
+    serve(test)
+
+
+def test_payload_error(serve):
+    async def test(server):
+        server.faults.append(0)
+
+        async with ZXArtClient() as cli:
+            with pytest.raises(ZXArtApiError) as exc:
+                await cli.api(Entity.TUNE, limit=10)
+
+        assert isinstance(exc.value.__cause__, aiohttp.ClientPayloadError)
+
+    serve(test)
+
+
+def test_limiter_fixed():
+    async def test():
+        limiter, active = ConcurrencyLimiter(2), []
+
+        async def request():
+            await limiter.acquire()
+            active.append(limiter.active)
+            await asyncio.sleep(0.01)
+            await limiter.release(None)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert max(active) == 2
+        assert limiter.limit == 2
+
+    asyncio.run(test())
+
+
+def test_limiter_increase():
+    async def test():
+        limiter = ConcurrencyLimiter(2, max_limit=4, target_latency=1.0)
+        limits = []
+
+        for _ in range(20):
+            await limiter.acquire()
+            await limiter.release(0.1)
+            limits.append(limiter.limit)
+
+        # Аддитивный рост на единицу за `limit` успешных запросов
+        assert limits[:3] == [2, 2, 3]
+        assert limits == sorted(limits)
+        assert limits[-1] == 4
+
+    asyncio.run(test())
+
+
+@pytest.mark.parametrize("latency", [None, 2.0])
+def test_limiter_decrease(latency):
+    async def test():
+        limiter = ConcurrencyLimiter(8, max_limit=8, target_latency=1.0)
+
+        for _ in range(2):
+            await limiter.acquire()
+            await limiter.release(latency)
+
+        # Не более одного уменьшения за период целевой задержки
+        assert limiter.limit == 4
+
+    asyncio.run(test())
+
+
+def test_adaptive_overload(serve):
+    async def test(server):
+        server.faults.append(503)
+
+        async with ZXArtClient(
+            adaptive=True, max_concurrency=16, retry=_RETRY
+        ) as cli:
+            assert cli._limiter.limit == 4
+            await cli.api(Entity.TUNE, limit=10)
+
+        assert cli._limiter.limit == 2
+
+    serve(test)
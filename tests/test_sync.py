@@ -0,0 +1,133 @@
+import asyncio
+import datetime as dt
+
+from zxart.cache import MemoryCache
+from zxart.client import ZXArtClient
+from zxart.common import Entity, Order
+from zxart.mirror import Mirror
+from zxart.sync import FileWatermarkStore, sync
+
+
+class _Sink:
+    def __init__(self):
+        self.ids = []
+
+    async def upsert(self, entity, items):
+        self.ids += (x.id for x in items)
+
+
+def test_sync_mirror(serve):
+    async def test(server):
+        mirror = Mirror()
+
+        async with ZXArtClient(mirror=mirror) as cli:
+            r = await sync(cli, Entity.TUNE, mirror)
+
+            assert r.count == 300
+            assert server.requests == 5
+
+            r = await sync(cli, Entity.TUNE, mirror)
+
+        assert r.count == 300
+        assert server.requests == 10
+
+        x = mirror.query(Entity.TUNE, limit=1, order=Order.MOST_RECENT)
+        assert x.total == 300
+
+    serve(test, total=300)
+
+
+def test_sync_cache(serve):
+    async def test(server):
+        mirror = Mirror()
+
+        async with ZXArtClient(cache=MemoryCache()) as cli:
+            await sync(cli, Entity.TUNE, mirror)
+            r = await sync(cli, Entity.TUNE, mirror)
+
+        assert r.count == 120
+        assert server.requests == 4
+        assert cli.cache_stats.hits == 0
+
+    serve(test, total=120)
+
+
+def test_incremental(serve):
+    async def test(server):
+        sink = _Sink()
+
+        async with ZXArtClient() as cli:
+            first = await sync(cli, Entity.TUNE, sink)
+            n = server.requests
+            server.total = 330
+            r = await sync(cli, Entity.TUNE, sink, since=first.watermark)
+
+        assert r.count == 30
+        assert sink.ids[300:] == list(range(330, 300, -1))
+        assert r.watermark > first.watermark
+        # Обход остановлен на отметке внутри первой страницы
+        assert server.requests == n + 1
+
+    serve(test, total=300)
+
+
+def test_incremental_unchanged(serve):
+    async def test(server):
+        async with ZXArtClient() as cli:
+            first = await sync(cli, Entity.TUNE, _Sink())
+            n = server.requests
+            r = await sync(cli, Entity.TUNE, _Sink(), since=first.watermark)
+
+        assert r.count == 0
+        assert r.watermark == first.watermark
+        assert server.requests == n + 1
+
+    serve(test, total=100)
+
+
+def test_watermark_store(serve, tmp_path):
+    path = tmp_path / "watermarks.json"
+
+    async def test(server):
+        async with ZXArtClient() as cli:
+            r = await sync(
+                cli, Entity.TUNE, _Sink(), store=FileWatermarkStore(path)
+            )
+
+        assert r.count == 120
+        assert path.exists()
+
+        # Новый экземпляр хранилища после перезапуска
+        store = FileWatermarkStore(path)
+
+        assert await store.load(Entity.TUNE) == r.watermark
+        assert await store.load(Entity.IMAGE) is None
+
+        server.total = 125
+        sink = _Sink()
+
+        async with ZXArtClient() as cli:
+            r2 = await sync(cli, Entity.TUNE, sink, store=store)
+
+        assert sink.ids == [125, 124, 123, 122, 121]
+        assert await FileWatermarkStore(path).load(Entity.TUNE) == r2.watermark
+        assert not list(tmp_path.glob("*.tmp"))
+
+    serve(test, total=120)
+
+
+def test_watermark_store_entities(tmp_path):
+    async def test():
+        store = FileWatermarkStore(tmp_path / "watermarks.json")
+        a = dt.datetime(2024, 1, 1, 12, 30)
+        b = dt.datetime(2024, 2, 1)
+
+        await asyncio.gather(
+            store.save(Entity.TUNE, a), store.save(Entity.IMAGE, b)
+        )
+        store = FileWatermarkStore(tmp_path / "watermarks.json")
+
+        assert await store.load(Entity.TUNE) == a
+        assert await store.load(Entity.IMAGE) == b
+
+    asyncio.run(test())
@@ -0,0 +1,116 @@
+import math
+
+import pytest
+from payloads import items as payload
+
+from zxart.common import Entity
+from zxart.decode import decode_response
+from zxart.table import ImageTable, TuneTable
+
+_TABLES = {Entity.TUNE: TuneTable, Entity.IMAGE: ImageTable}
+
+
+@pytest.fixture(scope="module", params=list(_TABLES))
+def items(request):
+    entity = request.param
+    raw = payload(entity, 500)
+    json = {"totalAmount": 500, "start": 0, "limit": 500, "result": raw}
+    result = decode_response(entity, json).result
+
+    return entity, result
+
+
+def _ids(table):
+    return list(table.column("id"))
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"years": 1999},
+        {"years": range(1990, 2000)},
+        {"min_rating": 4.0},
+        {"min_party_place": 3},
+        {"tags_include": "AY"},
+        {"tags_include": ["AY", "demo"]},
+        {"tags_exclude": ["game", "party"]},
+        {
+            "tags_include": "AY",
+            "tags_exclude": "demo",
+            "years": range(2000, 2026),
+        },
+        {"tags_include": "unknown"},
+        {"tags_exclude": "unknown"},
+        {"compo": "wild", "type": "PT3"},
+        {"compo": "unknown"},
+    ],
+)
+def test_filter(items, filters):
+    entity, result = items
+    table = _TABLES[entity](result)
+
+    def match(x):
+        if (y := filters.get("years")) is not None:
+            if x.year not in ({y} if isinstance(y, int) else set(y)):
+                return False
+
+        if (y := filters.get("min_rating")) is not None:
+            if x.rating is None or x.rating < y:
+                return False
+
+        if (y := filters.get("min_party_place")) is not None:
+            if not x.party_place or x.party_place > y:
+                return False
+
+        tags = set(x.tags or ())
+        include = filters.get("tags_include", ())
+        exclude = filters.get("tags_exclude", ())
+
+        if not set([include] if isinstance(include, str) else include) <= tags:
+            return False
+
+        if tags & set([exclude] if isinstance(exclude, str) else exclude):
+            return False
+
+        return all(
+            getattr(x, k) == filters[k]
+            for k in ("compo", "type")
+            if k in filters
+        )
+
+    r = table.filter(**filters)
+
+    assert _ids(r) == [x.id for x in result if match(x)]
+    assert [r.tags(i) for i in range(len(r))] == [
+        list(x.tags or ()) for x in result if match(x)
+    ]
+
+
+@pytest.mark.parametrize("name", ["rating", "year", "party_place", "compo"])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort(items, name, reverse):
+    entity, result = items
+    table = _TABLES[entity](result)
+
+    def value(x):
+        v = getattr(x, name)
+        return None if v is None or (name == "party_place" and v < 0) else v
+
+    present = [x for x in result if value(x) is not None]
+    present.sort(key=value, reverse=reverse)
+    missing = [x for x in result if value(x) is None]
+    r = table.sort(name, reverse=reverse)
+
+    assert _ids(r) == [x.id for x in present + missing]
+    assert r.row(0)["title"] == (present + missing)[0].title
+
+
+def test_sort_rating_nan(items):
+    entity, result = items
+    table = _TABLES[entity](result)
+    rating = list(table.sort("rating", reverse=True).column("rating"))
+    values = [x for x in rating if not math.isnan(x)]
+
+    assert values == sorted(values, reverse=True)
+    assert all(math.isnan(x) for x in rating[len(values) :])
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from zxart.cache import MemoryCache
+from zxart.client import ZXArtApiError, ZXArtClient
+from zxart.common import Entity
+from zxart.telemetry import Histogram, Metrics, RequestEvent
+
+
+def test_outcomes(serve):
+    async def test(server):
+        metrics = Metrics()
+        events = []
+        cli = ZXArtClient(
+            cache=MemoryCache(),
+            cache_ttl=0,
+            instruments=[metrics, events.append],
+        )
+
+        async with cli:
+            await cli.api(Entity.TUNE, limit=10)
+            # Кэш устарел: ответ `304 Not Modified`
+            await cli.api(Entity.TUNE, limit=10)
+            # Второй запрос объединен с первым
+            await asyncio.gather(
+                cli.api(Entity.IMAGE, limit=10),
+                cli.api(Entity.IMAGE, limit=10),
+            )
+
+            server.faults.append(500)
+
+            with pytest.raises(ZXArtApiError):
+                await cli.api(Entity.IMAGE, limit=5)
+
+        assert metrics.outcomes(Entity.TUNE) == {"network": 1, "revalidated": 1}
+        assert metrics.outcomes(Entity.IMAGE) == {"network": 1, "coalesced": 1}
+        assert metrics.outcomes(Entity.AUTHOR) == {}
+        assert metrics.histogram("items", Entity.TUNE).sum == 20
+        assert metrics.histogram("duration", Entity.IMAGE).count == 2
+
+        assert len(events) == 5
+        assert events[0].status == 200
+        assert events[0].size > 0
+        assert events[0].items == 10
+        assert isinstance(events[-1].error, ZXArtApiError)
+
+    serve(test, etag=True)
+
+
+def test_cache_outcome(serve):
+    async def test(server):
+        metrics = Metrics()
+
+        async with ZXArtClient(
+            cache=MemoryCache(), instruments=[metrics]
+        ) as cli:
+            for _ in range(3):
+                await cli.api(Entity.TUNE, limit=10)
+
+        assert metrics.outcomes(Entity.TUNE) == {"network": 1, "cache": 2}
+
+    serve(test)
+
+
+def test_histogram():
+    x = Histogram([1.0, 0.1, 0.5])
+
+    for value in (0.05, 0.1, 0.3, 0.5, 0.7, 2.0):
+        x.observe(value)
+
+    # Границы интервалов включительно, последний интервал: `+Inf`
+    assert x.bounds == (0.1, 0.5, 1.0)
+    assert x.counts == [2, 2, 1, 1]
+    assert x.count == 6
+    assert x.sum == pytest.approx(3.65)
+    assert x.quantile(0.3) == 0.1
+    assert x.quantile(0.5) == 0.5
+    assert x.quantile(0.8) == 1.0
+    assert x.quantile(1.0) == float("inf")
+
+
+def test_render():
+    metrics = Metrics(prefix="test")
+    metrics(RequestEvent(Entity.TUNE, duration=0.2, size=300, items=10))
+    metrics(RequestEvent(Entity.TUNE, duration=3.0, outcome="cache"))
+    metrics(RequestEvent(Entity.IMAGE, duration=0.001, items=60))
+    metrics(RequestEvent(Entity.IMAGE, error=ZXArtApiError()))
+
+    lines = metrics.render().splitlines()
+
+    assert lines[:5] == [
+        "# HELP test_requests_total Successful API calls",
+        "# TYPE test_requests_total counter",
+        'test_requests_total{entity="zxMusic",outcome="cache"} 1',
+        'test_requests_total{entity="zxMusic",outcome="network"} 1',
+        'test_requests_total{entity="zxPicture",outcome="network"} 1',
+    ]
+    assert 'test_errors_total{entity="zxPicture"} 1' in lines
+    assert "# TYPE test_request_duration_seconds histogram" in lines
+
+    # Накопительные значения интервалов
+    name = "test_request_duration_seconds"
+
+    for le, n in (("0.1", 0), ("0.25", 1), ("2.5", 1), ("+Inf", 2)):
+        assert f'{name}_bucket{{entity="zxMusic",le="{le}"}} {n}' in lines
+
+    assert f'{name}_sum{{entity="zxMusic"}} 3.2' in lines
+    assert f'{name}_count{{entity="zxMusic"}} 2' in lines
+    assert 'test_items_bucket{entity="zxPicture",le="60"} 1' in lines
+
+    # Незаданные измерения не учитываются, ошибки не входят в гистограммы
+    assert not [x for x in lines if x.startswith("test_dns_seconds")]
+    assert 'test_items_count{entity="zxPicture"} 1' in lines
@@ -0,0 +1,77 @@
+import asyncio
+import datetime as dt
+from types import SimpleNamespace
+
+from zxart.common import Entity
+from zxart.query import compile_query
+from zxart.watch import ChangeFeed
+
+
+class _Client:
+    """Клиент с выборкой записей в порядке `сначала последние`."""
+
+    limit = 10
+
+    def __init__(self, total):
+        self.total = total
+        self.requests = 0
+        self.fail = False
+
+    def compile(self, entity, **filters):
+        return compile_query(entity, **filters)
+
+    async def run(self, query, *, start=None, limit, fresh):
+        self.requests += 1
+
+        if start is not None and self.fail:
+            self.fail = False
+            raise OSError("page request failed")
+
+        start = start or 0
+        ids = range(self.total - start, max(self.total - start - limit, 0), -1)
+        modified = dt.datetime(2000, 1, 1, tzinfo=dt.UTC)
+        items = [SimpleNamespace(id=x, modified=modified) for x in ids]
+
+        return SimpleNamespace(total=self.total, result=items)
+
+
+async def _wait(predicate):
+    while not predicate():
+        await asyncio.sleep(0.001)
+
+
+def test_watch():
+    async def test():
+        client = _Client(5)
+        feed = ChangeFeed(client, min_interval=0.01, max_interval=0.05)
+        it = feed.watch(Entity.TUNE)
+        first = asyncio.ensure_future(anext(it))
+        await _wait(lambda: client.requests)
+        client.total = 7
+
+        assert (await asyncio.wait_for(first, 1)).id == 6
+        assert (await anext(it)).id == 7
+
+        await it.aclose()
+        assert len(feed) == 0
+
+    asyncio.run(test())
+
+
+def test_fetch_error():
+    async def test():
+        client = _Client(5)
+        feed = ChangeFeed(client, min_interval=0.01, max_interval=0.05)
+        it = feed.watch(Entity.TUNE)
+        first = asyncio.ensure_future(anext(it))
+        await _wait(lambda: client.requests)
+        client.total, client.fail = 7, True
+
+        # Записи не теряются: изменение обнаруживается повторным опросом
+        assert (await asyncio.wait_for(first, 1)).id == 6
+        assert (await anext(it)).id == 7
+        assert not client.fail
+
+        await it.aclose()
+
+    asyncio.run(test())